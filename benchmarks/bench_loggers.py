@@ -0,0 +1,113 @@
+import contextlib
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable
+
+from benchmarks.bench_usecase import FILTER, ORDER
+from benchmarks.common import BenchResult
+from src.adapters import DBLoggerAdapter, FileLoggerAdapter, QueueFileLoggerAdapter
+from src.domain.entities import LogEntity
+from src.domain.repositories import LogRepositoryInterface
+
+
+@contextlib.contextmanager
+def isolated_logging():
+    """Run in a temporary directory (with a data/ directory, where
+    FileLoggerAdapter writes), restoring the root logger afterwards."""
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    level = root_logger.level
+    directory = os.getcwd()
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        os.makedirs(os.path.join(temporary_directory, "data"))
+        os.chdir(temporary_directory)
+        try:
+            yield temporary_directory
+        finally:
+            os.chdir(directory)
+            for handler in root_logger.handlers[:]:
+                if handler not in handlers:
+                    root_logger.removeHandler(handler)
+                    handler.close()
+            root_logger.setLevel(level)
+
+
+def close_logger(logger: LogRepositoryInterface) -> None:
+    """Write everything the logger queued."""
+    if hasattr(logger, "close"):
+        logger.close()
+    else:
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
+
+def time_logger(
+    create_logger: Callable[[], LogRepositoryInterface],
+    size: int,
+    repeat: int,
+) -> tuple[float, float]:
+    """Get the best times of size log_request calls, without and with the
+    writing of the queued records.
+
+    Returns:
+        seconds (tuple[float, float]): the time spent by the caller, and the
+            total time until every record is written.
+    """
+    log_entity = LogEntity(request_time=datetime.now(), filter=FILTER, order=ORDER)
+    caller_timings, total_timings = [], []
+    for _ in range(repeat):
+        logger = create_logger()
+        started_at = time.perf_counter()
+        for _ in range(size):
+            logger.log_request(log_entity)
+        caller_timings.append(time.perf_counter() - started_at)
+        close_logger(logger)
+        total_timings.append(time.perf_counter() - started_at)
+    return min(caller_timings), min(total_timings)
+
+
+def bench_loggers(size: int = 10_000, repeat: int = 3) -> list[BenchResult]:
+    """Time the log_request calls of the loggers.
+
+    The queued loggers return before the record is written, so both the
+    time spent by the caller (logger/<name>/call) and the time until every
+    record is written (logger/<name>/total) are measured.
+
+    Args:
+        size (int): number of log_request calls of a run.
+        repeat (int): number of runs, the best one being kept.
+
+    Returns:
+        results (list[BenchResult]): two results per logger.
+    """
+    results = []
+    with isolated_logging() as directory:
+        create_loggers = {
+            "file": lambda: FileLoggerAdapter(log_level=logging.INFO),
+            "queue_file": lambda: QueueFileLoggerAdapter(
+                log_level=logging.INFO,
+                filename=os.path.join(directory, "queue.log"),
+            ),
+            "db": lambda: DBLoggerAdapter(
+                log_level=logging.INFO,
+                db_path=os.path.join(directory, "app.db"),
+            ),
+        }
+        for name, create_logger in create_loggers.items():
+            caller_seconds, total_seconds = time_logger(create_logger, size, repeat)
+            for variant, seconds in (
+                ("call", caller_seconds),
+                ("total", total_seconds),
+            ):
+                results.append(
+                    BenchResult(
+                        name=f"logger/{name}/{variant}",
+                        group="logger",
+                        size=size,
+                        seconds=seconds,
+                    )
+                )
+    return results
@@ -0,0 +1,47 @@
+from benchmarks.common import BenchResult, NullLogger, StaticSession, measure
+from benchmarks.synthetic import generate_hn_page
+from src.adapters import HackerNewsCrawlerEntryAdapter, HtmlParserEnum
+
+SOURCE = "https://news.ycombinator.com/"
+
+
+def bench_parsing(sizes: list[int], min_time: float = 0.2) -> list[BenchResult]:
+    """Time HackerNewsCrawlerEntryAdapter.get_entries on synthetic pages.
+
+    The page is served by a StaticSession, so only the parsing is measured,
+    with each installed backend. A backend returning a wrong number of
+    entries fails the benchmark.
+
+    Args:
+        sizes (list[int]): numbers of entries of the pages.
+        min_time (float): seconds spent timing each case.
+
+    Returns:
+        results (list[BenchResult]): a result per backend and size.
+    """
+    results = []
+    for size in sizes:
+        page = generate_hn_page(size)
+        for parser_enum in HtmlParserEnum:
+            try:
+                parser = parser_enum.create_parser()
+            except ImportError:
+                continue
+            crawler = HackerNewsCrawlerEntryAdapter(
+                logger=NullLogger(), parser=parser, session=StaticSession(page)
+            )
+            number_of_entries = len(crawler.get_entries(SOURCE))
+            if number_of_entries != size:
+                raise AssertionError(
+                    f"{parser_enum.value} parsed {number_of_entries} entries out of {size}"
+                )
+            seconds = measure(lambda: crawler.get_entries(SOURCE), min_time=min_time)
+            results.append(
+                BenchResult(
+                    name=f"parsing/{parser_enum.value}/{size}",
+                    group="parsing",
+                    size=size,
+                    seconds=seconds,
+                )
+            )
+    return results
@@ -0,0 +1,87 @@
+import contextlib
+import math
+
+from benchmarks.common import BenchResult, measure
+from benchmarks.synthetic import generate_entries
+from src.domain.entities import (
+    FilterAndEntity,
+    FilterEntity,
+    FilterFieldEnum,
+    FilterOperatorEnum,
+    OrderDirectionEnum,
+    OrderEntity,
+    OrderFieldEnum,
+)
+from src.usecases import GetEntries, vectorized
+
+# Titles with more than 5 words and at least 10 comments
+FILTER = FilterAndEntity(
+    [
+        FilterEntity(
+            field=FilterFieldEnum.number_of_words,
+            operator=FilterOperatorEnum.gt,
+            value=5,
+        ),
+        FilterEntity(
+            field=FilterFieldEnum.number_of_comments,
+            operator=FilterOperatorEnum.ge,
+            value=10,
+        ),
+    ]
+)
+# Most commented first, the points breaking the ties
+ORDER = [
+    OrderEntity(field=OrderFieldEnum.comments, direction=OrderDirectionEnum.desc),
+    OrderEntity(field=OrderFieldEnum.points, direction=OrderDirectionEnum.desc),
+]
+TOP_K = 30
+
+
+@contextlib.contextmanager
+def vectorize_threshold(threshold: float):
+    """Force the pure-Python (inf) or the numpy (0) path of GetEntries."""
+    previous_threshold = vectorized.VECTORIZE_THRESHOLD
+    vectorized.VECTORIZE_THRESHOLD = threshold
+    try:
+        yield
+    finally:
+        vectorized.VECTORIZE_THRESHOLD = previous_threshold
+
+
+def bench_usecase(sizes: list[int], min_time: float = 0.2) -> list[BenchResult]:
+    """Time GetEntries.filter_entries and order_entries (full sort and top-k).
+
+    Each case runs on the pure-Python path, and on the numpy path when numpy
+    is installed, whatever VECTORIZE_THRESHOLD.
+
+    Args:
+        sizes (list[int]): numbers of entries.
+        min_time (float): seconds spent timing each case.
+
+    Returns:
+        results (list[BenchResult]): a result per case, path and size.
+    """
+    paths = {"python": math.inf}
+    if vectorized.np is not None:
+        paths["numpy"] = 0
+    cases = {
+        "filter": lambda entries: GetEntries.filter_entries(entries, FILTER),
+        "order": lambda entries: GetEntries.order_entries(entries, ORDER),
+        "top_k": lambda entries: GetEntries.order_entries(entries, ORDER, TOP_K),
+    }
+    results = []
+    for size in sizes:
+        entries = generate_entries(size)
+        for case, function in cases.items():
+            for path, threshold in paths.items():
+                with vectorize_threshold(threshold):
+                    seconds = measure(lambda: function(entries), min_time=min_time)
+                results.append(
+                    BenchResult(
+                        name=f"{case}/{path}/{size}",
+                        group=case,
+                        size=size,
+                        seconds=seconds,
+                    )
+                )
+    return results
@@ -0,0 +1,92 @@
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from src.domain.entities import LogEntity
+from src.domain.repositories import LogRepositoryInterface
+
+
+@dataclass
+class BenchResult:
+    """Measure of a benchmark.
+
+    Attributes:
+        name (str): unique name, as group/variant/size.
+        group (str): parsing, filter, order or logger.
+        size (int): number of entries (or of log calls).
+        seconds (float): best time of a run.
+    """
+
+    name: str
+    group: str
+    size: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Entries (or log calls) per second."""
+        return self.size / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "group": self.group,
+            "size": self.size,
+            "seconds": self.seconds,
+            "throughput": self.throughput,
+        }
+
+
+def measure(
+    function: Callable[[], object], min_time: float = 0.2, max_repeat: int = 10
+) -> float:
+    """Get the best time of a function, run until min_time seconds are spent.
+
+    Args:
+        function (Callable): the function to time.
+        min_time (float): seconds after which no new run is started.
+        max_repeat (int): maximum number of runs.
+
+    Returns:
+        seconds (float): the time of the fastest run.
+    """
+    timings = []
+    started_at = time.perf_counter()
+    while len(timings) < max_repeat:
+        run_started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - run_started_at)
+        if time.perf_counter() - started_at >= min_time:
+            break
+    return min(timings)
+
+
+class NullLogger(LogRepositoryInterface):
+    """Logger doing nothing, so the other benchmarks don't measure logging."""
+
+    def __init__(self):
+        super().__init__(log_level=0)
+
+    def log_request(self, log_entity: LogEntity):
+        pass
+
+    def log_debug(self, message: str) -> None:
+        pass
+
+
+@dataclass
+class StaticPage:
+    """Response of the StaticSession."""
+
+    text: str
+    status_code: int = 200
+
+
+@dataclass
+class StaticSession:
+    """HTTP session serving the same page for every url, without network."""
+
+    text: str
+
+    def get(self, url: str, **kwargs) -> StaticPage:
+        return StaticPage(self.text)
@@ -0,0 +1,145 @@
+import json
+import platform
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import typer
+from typing_extensions import Annotated
+
+from benchmarks.bench_loggers import bench_loggers
+from benchmarks.bench_parsing import bench_parsing
+from benchmarks.bench_usecase import bench_usecase
+from benchmarks.common import BenchResult
+from src.usecases import vectorized
+
+PARSING_SIZES = [30, 1_000, 10_000]
+USECASE_SIZES = [30, 1_000, 10_000, 100_000]
+# The bs4 backends take several seconds per page of 100k entries
+FULL_PARSING_SIZES = PARSING_SIZES + [100_000]
+BENCHMARKS_DIRECTORY = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARKS_DIRECTORY / "results.json"
+DEFAULT_THRESHOLDS = BENCHMARKS_DIRECTORY / "thresholds.json"
+
+
+def check_thresholds(results: list[BenchResult], thresholds: dict) -> list[str]:
+    """Get the results slower than the minimum throughput of their threshold.
+
+    Args:
+        results (list[BenchResult]): the results.
+        thresholds (dict): minimum throughput of the result names, as
+            {"name": {"min_throughput": float}}.
+
+    Returns:
+        regressions (list[str]): a message per result under its threshold.
+    """
+    regressions = []
+    for result in results:
+        threshold = thresholds.get(result.name)
+        if threshold is None:
+            continue
+        if result.throughput < threshold["min_throughput"]:
+            regressions.append(
+                f"{result.name}: {result.throughput:.0f}/s is under the threshold"
+                f" of {threshold['min_throughput']:.0f}/s"
+            )
+    return regressions
+
+
+def check_baseline(
+    results: list[BenchResult], baseline: dict, tolerance: float
+) -> list[str]:
+    """Get the results slower than the ones of a former run, beyond the tolerance.
+
+    Args:
+        results (list[BenchResult]): the results.
+        baseline (dict): a results file written by a former run.
+        tolerance (float): accepted slowdown, 0.25 for 25%.
+
+    Returns:
+        regressions (list[str]): a message per result slower than its baseline.
+    """
+    baseline_throughputs = {
+        result["name"]: result["throughput"] for result in baseline["results"]
+    }
+    regressions = []
+    for result in results:
+        baseline_throughput = baseline_throughputs.get(result.name)
+        if baseline_throughput is None:
+            continue
+        if result.throughput < baseline_throughput * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: {result.throughput:.0f}/s is"
+                f" {1 - result.throughput / baseline_throughput:.0%} slower"
+                f" than the baseline ({baseline_throughput:.0f}/s)"
+            )
+    return regressions
+
+
+def main(
+    full: Annotated[
+        bool, typer.Option(help="Also parse pages of 100k entries (slow).")
+    ] = False,
+    min_time: Annotated[
+        float, typer.Option(help="Seconds spent timing each case.")
+    ] = 0.2,
+    output: Annotated[Path, typer.Option(help="Results file (JSON).")] = DEFAULT_OUTPUT,
+    thresholds: Annotated[
+        Path, typer.Option(help="Minimum throughputs file (JSON).")
+    ] = DEFAULT_THRESHOLDS,
+    baseline: Annotated[
+        Optional[Path], typer.Option(help="Results file of a former run to compare.")
+    ] = None,
+    tolerance: Annotated[
+        float, typer.Option(help="Accepted slowdown against the baseline.")
+    ] = 0.25,
+):
+    """Run the benchmarks, write the results, and exit with 1 on a regression."""
+    if min_time <= 0:
+        raise typer.BadParameter("must be positive", param_hint="--min-time")
+    if not 0 <= tolerance < 1:
+        raise typer.BadParameter("must be between 0 and 1", param_hint="--tolerance")
+
+    parsing_sizes = FULL_PARSING_SIZES if full else PARSING_SIZES
+    results = []
+    results.extend(bench_parsing(parsing_sizes, min_time=min_time))
+    results.extend(bench_usecase(USECASE_SIZES, min_time=min_time))
+    results.extend(bench_loggers())
+    for result in results:
+        typer.echo(
+            f"{result.name:<32} {result.seconds * 1000:>10.2f} ms"
+            f" {result.throughput:>14,.0f}/s"
+        )
+
+    output.write_text(
+        json.dumps(
+            {
+                "created_at": datetime.now().isoformat(sep=" ", timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "numpy": None if vectorized.np is None else vectorized.np.__version__,
+                "results": [result.to_dict() for result in results],
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+    typer.echo(f"Results written in {output}")
+
+    regressions = []
+    if thresholds.exists():
+        regressions.extend(
+            check_thresholds(results, json.loads(thresholds.read_text()))
+        )
+    if baseline is not None:
+        regressions.extend(
+            check_baseline(results, json.loads(baseline.read_text()), tolerance)
+        )
+    for regression in regressions:
+        typer.echo(f"REGRESSION {regression}", err=True)
+    if regressions:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,96 @@
+import random
+
+from src.domain.entities import EntryEntity
+
+WORDS = (
+    "the a of to and in for on with how why what new open source rust python "
+    "database compiler kernel browser linux memory performance distributed "
+    "systems show ask hn launch startup model learning security release study "
+    "design engine network cache query async parser vector graph protocol"
+).split()
+
+PAGE_HEADER = """<html lang="en" op="news"><head><meta name="referrer" content="origin">
+<title>Hacker News</title></head><body><center>
+<table id="hnmain" border="0" cellpadding="0" cellspacing="0" width="85%">
+<tr><td><table border="0" cellpadding="0" cellspacing="0">
+<tr id="pagespace" title="" style="height:10px"></tr><tr><td>
+<table border="0" cellpadding="0" cellspacing="0"><tbody>
+"""
+
+ENTRY_ROWS = """<tr class="athing" id="{item_id}">
+      <td align="right" valign="top" class="title"><span class="rank">{rank}.</span></td>      <td valign="top" class="votelinks"><center><a id="up_{item_id}" href="vote?id={item_id}&amp;how=up&amp;goto=news"><div class="votearrow" title="upvote"></div></a></center></td><td class="title"><span class="titleline"><a href="https://{site}/{slug}">{title}</a><span class="sitebit comhead"> (<a href="from?site={site}"><span class="sitestr">{site}</span></a>)</span></span></td></tr><tr><td colspan="2"></td><td class="subtext"><span class="subline">
+          <span class="score" id="score_{item_id}">{points} points</span> by <a href="user?id={user}" class="hnuser">{user}</a> <span class="age" title="2024-06-08T15:17:53"><a href="item?id={item_id}">1 hour ago</a></span> <span id="unv_{item_id}"></span> | <a href="hide?id={item_id}&amp;goto=news">hide</a> | <a href="item?id={item_id}">{comments}</a>        </span>
+              </td></tr>
+      <tr class="spacer" style="height:5px"></tr>
+"""
+
+PAGE_FOOTER = """</tbody></table></td></tr></table></td></tr></table></center></body></html>
+"""
+
+
+def generate_hn_page(
+    number_of_entries: int, seed: int = 0, first_item_id: int = 40_000_000
+) -> str:
+    """Generate a listing page with the markup of HackerNews.
+
+    The titles (3 to 12 words, some with an escaped &), points and comments
+    are drawn from a seeded generator, so a size always gives the same page.
+    About one entry in ten has no comment ("discuss").
+
+    Args:
+        number_of_entries (int): number of entries of the page.
+        seed (int): seed of the generator.
+        first_item_id (int): item id of the first entry.
+
+    Returns:
+        page (str): the html of the page.
+    """
+    generator = random.Random(seed)
+    rows = []
+    for rank in range(1, number_of_entries + 1):
+        words = generator.choices(WORDS, k=generator.randint(3, 12))
+        if generator.random() < 0.05:
+            words.insert(1, "&amp;")
+        total_comments = generator.randint(0, 500)
+        if generator.random() < 0.1:
+            comments = "discuss"
+        else:
+            comments = f"{total_comments}&nbsp;comments"
+        rows.append(
+            ENTRY_ROWS.format(
+                item_id=first_item_id + rank,
+                rank=rank,
+                site=f"{generator.choice(WORDS)}.example.com",
+                slug="-".join(words[:3]),
+                title=" ".join(words).capitalize(),
+                points=generator.randint(1, 999),
+                user=f"user{generator.randint(1, 10_000)}",
+                comments=comments,
+            )
+        )
+    return PAGE_HEADER + "".join(rows) + PAGE_FOOTER
+
+
+def generate_entries(number_of_entries: int, seed: int = 0) -> list[EntryEntity]:
+    """Generate the entries of a listing, without the html (same distributions
+    as generate_hn_page), for the benchmarks of the filters and orders.
+
+    Args:
+        number_of_entries (int): number of entries.
+        seed (int): seed of the generator.
+
+    Returns:
+        entries (list[EntryEntity]): the entries.
+    """
+    generator = random.Random(seed)
+    return [
+        EntryEntity(
+            index=rank,
+            title=" ".join(generator.choices(WORDS, k=generator.randint(3, 12))),
+            total_points=generator.randint(1, 999),
+            total_comments=generator.randint(0, 500),
+            source="https://news.ycombinator.com/",
+            item_id=40_000_000 + rank,
+        )
+        for rank in range(1, number_of_entries + 1)
+    ]
@@ -1,5 +1,67 @@
+from .async_adapters import AsyncEntryRepositoryAdapter, AsyncLogRepositoryAdapter
 from .crawler import HackerNewsCrawlerEntryAdapter
 from .file_logger import FileLoggerAdapter
+from .generic_crawler import (
+    HACKER_NEWS_PROFILE,
+    GenericCrawlerEntryAdapter,
+    SelectorProfile,
+    SelectorProfileHtmlParser,
+    load_profiles,
+)
 from .db_logger import DBLoggerAdapter
+from .db_snapshot import DBSnapshotAdapter
+from .entry_cache import EntryCache
+from .html_parsers import (
+    BeautifulSoupHtmlParser,
+    HtmlParserEnum,
+    HtmlParserInterface,
+    SelectolaxHtmlParser,
+    StreamingHtmlParser,
+)
+from .hn_api import HACKER_NEWS_API_URL, HackerNewsApiEntryAdapter
+from .http_cache import HttpCache
+from .http_session import create_session
+from .rate_limiter import (
+    HostRateLimiter,
+    PoliteSession,
+    RateLimitExceededError,
+    RobotsDisallowedError,
+    TokenBucket,
+)
+from .single_flight import SingleFlightEntryAdapter
+from .queue_file_logger import QueueFileLoggerAdapter
+from .snapshot_cache import CachedEntryAdapter
+from .source_registry import SourceRegistry
 
-__all__ = [HackerNewsCrawlerEntryAdapter, FileLoggerAdapter, DBLoggerAdapter]
+__all__ = [
+    HackerNewsCrawlerEntryAdapter,
+    HackerNewsApiEntryAdapter,
+    HACKER_NEWS_API_URL,
+    GenericCrawlerEntryAdapter,
+    HACKER_NEWS_PROFILE,
+    SelectorProfile,
+    SelectorProfileHtmlParser,
+    load_profiles,
+    SourceRegistry,
+    FileLoggerAdapter,
+    QueueFileLoggerAdapter,
+    DBLoggerAdapter,
+    DBSnapshotAdapter,
+    EntryCache,
+    BeautifulSoupHtmlParser,
+    HtmlParserEnum,
+    HtmlParserInterface,
+    SelectolaxHtmlParser,
+    StreamingHtmlParser,
+    HttpCache,
+    create_session,
+    HostRateLimiter,
+    PoliteSession,
+    RateLimitExceededError,
+    RobotsDisallowedError,
+    TokenBucket,
+    AsyncEntryRepositoryAdapter,
+    AsyncLogRepositoryAdapter,
+    CachedEntryAdapter,
+    SingleFlightEntryAdapter,
+]
@@ -0,0 +1,74 @@
+import asyncio
+from dataclasses import dataclass
+
+from src.adapters.db_logger import DBLoggerAdapter
+from src.adapters.queue_file_logger import QueueFileLoggerAdapter
+from src.adapters.snapshot_cache import CachedEntryAdapter
+from src.domain.entities import EntryEntity, LogEntity
+from src.domain.repositories import (
+    AsyncEntryRepositoryInterface,
+    AsyncLogRepositoryInterface,
+    EntryRepositoryInterface,
+    LogRepositoryInterface,
+)
+
+
+@dataclass
+class AsyncEntryRepositoryAdapter(AsyncEntryRepositoryInterface):
+    """Asynchronous wrapper of a blocking Entry repository.
+
+    The blocking calls run in the default executor of the event loop, so
+    several sources can be fetched concurrently without blocking the loop.
+    A fresh snapshot of a CachedEntryAdapter is served from the loop, a
+    thread being only used when the source has to be fetched.
+
+    Attributes:
+        repository (EntryRepositoryInterface): the wrapped repository.
+    """
+
+    repository: EntryRepositoryInterface
+
+    async def get_entries(self, source: str) -> list[EntryEntity]:
+        if isinstance(self.repository, CachedEntryAdapter):
+            entries = self.repository.get_snapshot(source)
+            if entries is not None:
+                return entries
+        return await asyncio.to_thread(self.repository.get_entries, source)
+
+
+# Loggers whose calls only enqueue the records, a writer thread writing them
+NON_BLOCKING_LOGGERS = (QueueFileLoggerAdapter, DBLoggerAdapter)
+
+
+@dataclass
+class AsyncLogRepositoryAdapter(AsyncLogRepositoryInterface):
+    """Asynchronous wrapper of a Log repository.
+
+    The calls of a blocking logger run in the default executor of the event
+    loop. The ones of a non-blocking logger (which only enqueue) are made
+    directly from the loop, without a thread per call.
+
+    Attributes:
+        repository (LogRepositoryInterface): the wrapped logger.
+        blocking (Optional(bool)): run the calls in a thread, by default
+            unless the logger is a QueueFileLoggerAdapter or a DBLoggerAdapter.
+    """
+
+    repository: LogRepositoryInterface
+    blocking: bool | None = None
+
+    def __post_init__(self):
+        if self.blocking is None:
+            self.blocking = not isinstance(self.repository, NON_BLOCKING_LOGGERS)
+
+    async def log_request(self, log_entity: LogEntity):
+        if self.blocking:
+            await asyncio.to_thread(self.repository.log_request, log_entity)
+        else:
+            self.repository.log_request(log_entity)
+
+    async def log_debug(self, message: str):
+        if self.blocking:
+            await asyncio.to_thread(self.repository.log_debug, message)
+        else:
+            self.repository.log_debug(message)
@@ -1,10 +1,19 @@
-from dataclasses import dataclass
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 import requests
-from bs4 import BeautifulSoup, Tag
 
+from src.adapters.entry_cache import EntryCache
+from src.adapters.html_parsers import BeautifulSoupHtmlParser, HtmlParserInterface
+from src.adapters.http_cache import HttpCache
+from src.adapters.http_session import DEFAULT_TIMEOUT, create_session
 from src.domain.entities import EntryEntity
 from src.domain.repositories import EntryRepositoryInterface, LogRepositoryInterface
 
+ENTRIES_PER_PAGE = 30
+
 
 @dataclass
 class HackerNewsCrawlerEntryAdapter(EntryRepositoryInterface):
@@ -12,118 +21,183 @@ class HackerNewsCrawlerEntryAdapter(EntryRepositoryInterface):
 
     Attributes:
         logger (Logger): logger.
+        max_entries (Optional(int)): stop once this many entries are collected.
+        max_pages (Optional(int)): maximum number of pages (?p=N) to crawl.
+        max_workers (int): size of the thread pool fetching the pages.
+        session (requests.Session): pooled HTTP session used for every request.
+        timeout (tuple[float, float]): connect and read timeouts, in seconds.
+        cache (Optional(HttpCache)): conditional-GET cache of the pages.
+        entry_cache (Optional(EntryCache)): cache of the entries parsed from a page.
+        parser (HtmlParserInterface): backend used to parse the pages.
     """
 
     logger: LogRepositoryInterface
+    max_entries: int | None = None
+    max_pages: int | None = None
+    max_workers: int = 4
+    session: requests.Session = field(default_factory=create_session)
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    cache: HttpCache | None = None
+    entry_cache: EntryCache | None = None
+    parser: HtmlParserInterface = field(default_factory=BeautifulSoupHtmlParser)
+
+    # The html extractors of the default backend, kept on the crawler.
+    get_entry_index_from_html = staticmethod(
+        BeautifulSoupHtmlParser.get_entry_index_from_html
+    )
+    get_entry_title_from_html = staticmethod(
+        BeautifulSoupHtmlParser.get_entry_title_from_html
+    )
+    get_entry_points_from_html = staticmethod(
+        BeautifulSoupHtmlParser.get_entry_points_from_html
+    )
+    get_entry_comments_from_html = staticmethod(
+        BeautifulSoupHtmlParser.get_entry_comments_from_html
+    )
+
+    def __post_init__(self):
+        if self.max_entries is not None and self.max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1: {self.max_entries}")
+        if self.max_pages is not None and self.max_pages < 1:
+            raise ValueError(f"max_pages must be at least 1: {self.max_pages}")
 
     @staticmethod
-    def get_entry_index_from_html(html: Tag) -> int | None:
-        """Get the index of the entry from the html code.
+    def get_page_url(source: str, page_number: int, page_parameter: str = "p") -> str:
+        """Get the url of a page of the source.
 
         Args
-            html (Tag): represent an entry node in the html.
+            source (str): url of the first page.
+            page_number (int): number of the page, starting at 1.
+            page_parameter (str): query parameter of the page number.
 
         Returns:
-            index (Optional(int)): the index of the entry.
+            page_url (str): the url of the page.
         """
-        html_rank = html.find("span", class_="rank")
-        try:
-            index = int(html_rank.get_text().strip("."))
-        except AttributeError:
-            return None
-        return index
-
-    @staticmethod
-    def get_entry_title_from_html(html: Tag) -> str | None:
-        """Get the title of the entry from the html code.
+        if page_number == 1:
+            return source
+        url_parts = urlsplit(source)
+        query = [
+            (key, value)
+            for key, value in parse_qsl(url_parts.query)
+            if key != page_parameter
+        ]
+        query.append((page_parameter, str(page_number)))
+        return urlunsplit(url_parts._replace(query=urlencode(query)))
+
+    def get_number_of_pages(self) -> int:
+        """Get the number of pages to crawl according to max_entries and max_pages."""
+        number_of_pages = self.max_pages
+        if self.max_entries is not None:
+            needed_pages = math.ceil(self.max_entries / ENTRIES_PER_PAGE)
+            if number_of_pages is None or needed_pages < number_of_pages:
+                number_of_pages = needed_pages
+        if number_of_pages is None:
+            return 1
+        return max(number_of_pages, 1)
+
+    def fetch_page(self, page_url: str):
+        """Fetch a page, through the cache if there is one.
 
         Args
-            html (Tag): represent an entry node in the html.
+            page_url (str): url of the page to fetch.
 
         Returns:
-            title (Optional(str)): the title of the entry.
+            page: the page, with text and status_code.
+        """
+        if self.cache is None:
+            return self.session.get(page_url, timeout=self.timeout)
+        return self.cache.fetch(self.session, page_url, self.timeout)
+
+    def get_page_entries(self, page_url: str, source: str) -> list[EntryEntity]:
+        """Fetch one page and extract its entries.
 
+        Args
+            page_url (str): url of the page to fetch.
+            source (str): url of the source, stored on each entry.
+
+        Returns:
+            entries (list[EntryEntity]): the entries of the page.
         """
-        html_titleline = html.find("span", class_="titleline")
+        entries = []
         try:
-            title = html_titleline.a.get_text()
-        except AttributeError:
-            return None
-        return title
+            page = self.fetch_page(page_url)
+        except requests.RequestException as exception:
+            self.logger.log_debug(f"can't access source {page_url}: {exception}")
+            return entries
+        if not page.status_code == 200:
+            self.logger.log_debug(f"can't access source {page_url}")
+            return entries
+        if self.entry_cache is None:
+            return self.parse_entries(page.text, source)
+        # The parser (and its profile) is part of the key
+        key = self.entry_cache.get_key(source, page.text, repr(self.parser))
+        entries = self.entry_cache.get(key)
+        if entries is None:
+            entries = self.parse_entries(page.text, source)
+            self.entry_cache.set(key, entries)
+        return entries
 
-    @staticmethod
-    def get_entry_points_from_html(html: Tag) -> int | None:
-        """Get the number of points of the entry from the html code.
+    def parse_entries(self, text: str, source: str) -> list[EntryEntity]:
+        """Extract the entries from the html of a page.
 
         Args
-            html (Tag): represent an entry node in the html.
+            text (str): html of the page.
+            source (str): url of the source, stored on each entry.
 
         Returns:
-            total_points (Optional(int)): number of points of an entry if found.
-
+            entries (list[EntryEntity]): the entries of the page.
         """
-        try:
-            total_points_node = html.next_sibling.find("span", class_="score")
-            total_points = int(total_points_node.get_text().strip(" points"))
-        except AttributeError:
-            return None
-        return total_points
+        return self.parser.parse_entries(text, source)
 
-    @staticmethod
-    def get_entry_comments_from_html(html: Tag) -> int | None:
-        """Get the number of comments of the entry from the html code.
+    def get_pages_entries(self, page_urls: list[str], source: str) -> list[EntryEntity]:
+        """Fetch several pages in parallel and merge them in rank order.
 
-        Manage the case with 0 comments.
+        Pages are consumed in order, so the pending ones are cancelled as soon
+        as enough entries are collected or a page comes back empty. A story
+        moving to the next page during the crawl is kept once, at its first
+        rank, using its item id.
 
         Args
-            html (Tag): represent an entry node in the html.
+            page_urls (list[str]): urls of the pages, in rank order.
+            source (str): url of the source, stored on each entry.
 
         Returns:
-            total_comments (Optional(int)): number of comments of an entry if found.
-
+            entries (list[EntryEntity]): the merged entries.
         """
-        subline_nodes = html.next_sibling.find_all("a")
-
-        # Check if string is present in each string in the list using enumerate
-        for item in subline_nodes:
-            node_text = item.get_text()
-            if isinstance(node_text, str) and "comment" in node_text:
-                total_comments = int(node_text.split()[0])
-                return total_comments
-            if isinstance(node_text, str) and "discuss" in node_text:
-                return 0
-        return None
-
-    def get_entries(self, source: str) -> list[EntryEntity]:
-        # TODO: get to page 2 until i get 30 entries
         entries = []
-        page = requests.get(source)
-        if not page.status_code == 200:
-            self.logger.log_debug(f"can't access source {source}")
-            return entries
-        soup = BeautifulSoup(page.text, "html.parser")
-        html_entries = soup.find_all("tr", class_="athing")
-
-        for html_entry in html_entries:
-            index = self.get_entry_index_from_html(html_entry)
-            if index is None:
-                continue
-            title = self.get_entry_title_from_html(html_entry)
-            if title is None:
-                continue
-            total_points = self.get_entry_points_from_html(html_entry)
-            if total_points is None:
-                continue
-            total_comments = self.get_entry_comments_from_html(html_entry)
-            if total_comments is None:
-                continue
-            entry = EntryEntity(
-                index=index,
-                title=title,
-                total_points=total_points,
-                total_comments=total_comments,
-                source=source,
-            )
-            entries.append(entry)
+        seen_item_ids = set()
+        workers = min(self.max_workers, len(page_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.get_page_entries, page_url, source)
+                for page_url in page_urls
+            ]
+            for future in futures:
+                page_entries = future.result()
+                for entry in page_entries:
+                    if entry.item_id is not None:
+                        if entry.item_id in seen_item_ids:
+                            continue
+                        seen_item_ids.add(entry.item_id)
+                    entries.append(entry)
+                enough_entries = (
+                    self.max_entries is not None and len(entries) >= self.max_entries
+                )
+                if not page_entries or enough_entries:
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    break
+        return entries
 
+    def get_entries(self, source: str) -> list[EntryEntity]:
+        page_urls = [
+            self.get_page_url(source, page_number)
+            for page_number in range(1, self.get_number_of_pages() + 1)
+        ]
+        if len(page_urls) == 1:
+            entries = self.get_page_entries(page_urls[0], source)
+        else:
+            entries = self.get_pages_entries(page_urls, source)
+        if self.max_entries is not None:
+            entries = entries[: self.max_entries]
         return entries
@@ -1,22 +1,52 @@
 from datetime import datetime
+import atexit
 import logging
+import queue
 import sqlite3
+import threading
+import time
 
-from src.domain.entities import LogEntity
+from src.domain.entities import FilterEntity, LogEntity, get_orders
 from src.domain.repositories import LogRepositoryInterface
 
+# Markers asking the writer to write the current batch, and to stop after it
+FLUSH = object()
+STOP = object()
+
+INSERT_QUERIES = {
+    "log_request": "INSERT INTO log_request VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "log_debug": "INSERT INTO log_debug VALUES (?, ?)",
+}
+
 
 class DBLoggerAdapter(LogRepositoryInterface):
     """SQLite DB Logger implementation.
 
     This logger will log the request information in a SQLite database.
 
+    The rows are only queued by log_request and log_debug. A background
+    thread writes them in batches (executemany, one commit per batch) when
+    batch_size rows are queued or flush_interval seconds have passed, and at
+    close. The database uses the WAL journal with synchronous=NORMAL, so a
+    commit does not wait for a fsync.
+
     """
 
-    def __init__(self, log_level: int):
+    def __init__(
+        self,
+        log_level: int,
+        db_path: str = "data/app.db",
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ):
         self.log_level = log_level
-        self.con = sqlite3.connect("data/app.db")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # The connection is only used by the writer thread after the setup
+        self.con = sqlite3.connect(db_path, check_same_thread=False)
         self.cur = self.con.cursor()
+        self.cur.execute("PRAGMA journal_mode=WAL")
+        self.cur.execute("PRAGMA synchronous=NORMAL")
         self.cur.execute(
             """CREATE TABLE IF NOT EXISTS log_request(
                 request_time TEXT,
@@ -24,10 +54,12 @@ class DBLoggerAdapter(LogRepositoryInterface):
                 filter_operator TEXT,
                 filter_value INT,
                 order_field TEXT,
-                order_direction TEXT
+                order_direction TEXT,
+                filter_expression TEXT
             )
         """
         )
+        self.migrate_log_request()
         self.cur.execute(
             """CREATE TABLE IF NOT EXISTS log_debug(
                 debug_time TEXT,
@@ -35,10 +67,82 @@ class DBLoggerAdapter(LogRepositoryInterface):
             )
             """
         )
+        self.con.commit()
+        self.queue = queue.Queue()
+        self.closed = False
+        self.writer = threading.Thread(target=self.write_rows, daemon=True)
+        self.writer.start()
+        atexit.register(self.close)
+
+    def migrate_log_request(self) -> None:
+        """Add the columns missing in a log_request table created by a former version."""
+        columns = [row[1] for row in self.cur.execute("PRAGMA table_info(log_request)")]
+        if "filter_expression" not in columns:
+            self.cur.execute(
+                "ALTER TABLE log_request ADD COLUMN filter_expression TEXT"
+            )
+
+    def write_rows(self) -> None:
+        """Write the queued rows in batches, until close."""
+        batch = []
+        received = 0
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = FLUSH
+            else:
+                received += 1
+                if item is not FLUSH and item is not STOP:
+                    batch.append(item)
+            if (
+                item is FLUSH
+                or item is STOP
+                or len(batch) >= self.batch_size
+                or time.monotonic() >= deadline
+            ):
+                self.write_batch(batch)
+                for _ in range(received):
+                    self.queue.task_done()
+                batch, received = [], 0
+                deadline = time.monotonic() + self.flush_interval
+            if item is STOP:
+                return
+
+    def write_batch(self, batch: list[tuple[str, tuple]]) -> None:
+        """Insert the rows of a batch, with a single commit."""
+        if not batch:
+            return
+        try:
+            with self.con:
+                for table, query in INSERT_QUERIES.items():
+                    rows = [row for row_table, row in batch if row_table == table]
+                    if rows:
+                        self.con.executemany(query, rows)
+        except sqlite3.Error as exception:
+            logging.getLogger(__name__).error(f"can't write the logs: {exception}")
+
+    def flush(self) -> None:
+        """Wait until the queued rows are written."""
+        if self.closed:
+            return
+        self.queue.put(FLUSH)
+        self.queue.join()
+
+    def close(self) -> None:
+        """Write the queued rows, then stop the writer and close the database."""
+        if self.closed:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+        self.queue.put(STOP)
+        self.writer.join()
+        self.con.close()
 
     def log_request(self, log_entity: LogEntity):
         log_filter_data = (None, None, None)
-        if log_entity.filter is not None:
+        if isinstance(log_entity.filter, FilterEntity):
             log_filter_data = (
                 log_entity.filter.field.value,
                 log_entity.filter.operator.value,
@@ -46,28 +150,17 @@ class DBLoggerAdapter(LogRepositoryInterface):
             )
         log_order_data = (None, None)
         if log_entity.order is not None:
+            orders = get_orders(log_entity.order)
             log_order_data = (
-                log_entity.order.field.value,
-                log_entity.order.direction.value,
+                ",".join(order.field.value for order in orders),
+                ",".join(order.direction.value for order in orders),
             )
-        log_data = (log_entity.request_time,)
+        log_data = (log_entity.request_time.isoformat(sep=" "),)
         log_data += log_filter_data
         log_data += log_order_data
-        self.cur.execute(
-            """
-                INSERT INTO log_request VALUES
-                (?, ?, ?, ?, ?, ?)
-            """,
-            log_data,
-        )
-        self.con.commit()
+        log_data += (None if log_entity.filter is None else str(log_entity.filter),)
+        self.queue.put(("log_request", log_data))
 
     def log_debug(self, message: str) -> None:
-        if self.log_level >= logging.DEBUG:
-            self.cur.execute(
-                """
-                    INSERT INTO log_debug VALUES
-                    (?, ?)
-                """,
-                (datetime.now(), message),
-            )
+        if self.log_level <= logging.DEBUG:
+            self.queue.put(("log_debug", (datetime.now().isoformat(sep=" "), message)))
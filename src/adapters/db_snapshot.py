@@ -0,0 +1,153 @@
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from src.domain.entities import EntryEntity, EntryObservationEntity
+from src.domain.repositories import SnapshotRepositoryInterface
+
+# Condition of the crawls having at least one entry
+NOT_EMPTY = """EXISTS (
+    SELECT 1 FROM entry_observation
+    WHERE entry_observation.crawl_id = crawl.crawl_id
+)"""
+
+
+@dataclass
+class DBSnapshotAdapter(SnapshotRepositoryInterface):
+    """SQLite implementation of the history of the crawled entries.
+
+    Each crawl is a row of the crawl table, and its entries are bulk inserted
+    in the entry_observation table. The crawls are indexed by source and time,
+    and the observations by HackerNews item id, so the history of a story and
+    the last crawl of a source are read from the indexes.
+
+    Attributes:
+        db_path (str): SQLite database of the snapshots.
+    """
+
+    db_path: str = "data/app.db"
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    con: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Open the database and create the tables on first use."""
+        if self.con is None:
+            self.con = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.con.executescript(
+                """CREATE TABLE IF NOT EXISTS crawl(
+                    crawl_id INTEGER PRIMARY KEY,
+                    source TEXT,
+                    crawled_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS crawl_source_crawled_at
+                    ON crawl(source, crawled_at);
+                CREATE TABLE IF NOT EXISTS entry_observation(
+                    crawl_id INTEGER REFERENCES crawl(crawl_id),
+                    item_id INTEGER,
+                    rank INTEGER,
+                    title TEXT,
+                    total_points INTEGER,
+                    total_comments INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS entry_observation_item_id
+                    ON entry_observation(item_id);
+                CREATE INDEX IF NOT EXISTS entry_observation_crawl_id
+                    ON entry_observation(crawl_id);
+                """
+            )
+        return self.con
+
+    def save_snapshot(
+        self, source: str, entries: list[EntryEntity], crawled_at: datetime
+    ) -> None:
+        with self.lock:
+            con = self.get_connection()
+            with con:
+                cursor = con.execute(
+                    "INSERT INTO crawl(source, crawled_at) VALUES (?, ?)",
+                    (source, crawled_at.isoformat()),
+                )
+                crawl_id = cursor.lastrowid
+                con.executemany(
+                    "INSERT INTO entry_observation VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            crawl_id,
+                            entry.item_id,
+                            entry.index,
+                            entry.title,
+                            entry.total_points,
+                            entry.total_comments,
+                        )
+                        for entry in entries
+                    ],
+                )
+
+    def get_last_snapshot(
+        self, source: str, before: datetime | None = None
+    ) -> list[EntryEntity]:
+        # The empty crawls (a failed fetch) are not a snapshot of the source
+        with self.lock:
+            con = self.get_connection()
+            if before is None:
+                row = con.execute(
+                    f"""SELECT crawl_id FROM crawl WHERE source = ? AND {NOT_EMPTY}
+                    ORDER BY crawled_at DESC LIMIT 1""",
+                    (source,),
+                ).fetchone()
+            else:
+                row = con.execute(
+                    f"""SELECT crawl_id FROM crawl
+                    WHERE source = ? AND crawled_at < ? AND {NOT_EMPTY}
+                    ORDER BY crawled_at DESC LIMIT 1""",
+                    (source, before.isoformat()),
+                ).fetchone()
+            if row is None:
+                return []
+            rows = con.execute(
+                """SELECT rank, title, total_points, total_comments, item_id
+                FROM entry_observation WHERE crawl_id = ? ORDER BY rowid""",
+                row,
+            ).fetchall()
+        return [
+            EntryEntity(
+                index=index,
+                title=title,
+                total_points=total_points,
+                total_comments=total_comments,
+                source=source,
+                item_id=item_id,
+            )
+            for index, title, total_points, total_comments, item_id in rows
+        ]
+
+    def get_item_history(self, item_id: int) -> list[EntryObservationEntity]:
+        with self.lock:
+            rows = (
+                self.get_connection()
+                .execute(
+                    """SELECT crawl.crawled_at, crawl.source, rank, title,
+                        total_points, total_comments
+                    FROM entry_observation
+                    JOIN crawl ON crawl.crawl_id = entry_observation.crawl_id
+                    WHERE item_id = ?
+                    ORDER BY crawl.crawled_at""",
+                    (item_id,),
+                )
+                .fetchall()
+            )
+        return [
+            EntryObservationEntity(
+                crawled_at=datetime.fromisoformat(crawled_at),
+                entry=EntryEntity(
+                    index=index,
+                    title=title,
+                    total_points=total_points,
+                    total_comments=total_comments,
+                    source=source,
+                    item_id=item_id,
+                ),
+            )
+            for crawled_at, source, index, title, total_points, total_comments in rows
+        ]
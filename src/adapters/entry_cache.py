@@ -0,0 +1,146 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field, fields
+
+from src.domain.entities import EntryEntity
+
+
+@dataclass
+class EntryCache:
+    """Cache of the entries parsed from a page, keyed by the hash of the page.
+
+    The entries are kept in memory with a LRU eviction, and optionally in a
+    SQLite table so that the next runs of the CLI can skip the parsing too.
+    The rows of the table older than max_age seconds are ignored, and they
+    are deleted at each write, as the oldest rows beyond max_rows.
+
+    Attributes:
+        max_size (int): maximum number of pages kept in memory.
+        db_path (Optional(str)): SQLite database of the persistent tier.
+        max_age (float): seconds during which a persisted page is kept.
+        max_rows (int): maximum number of persisted pages.
+    """
+
+    max_size: int = 128
+    db_path: str | None = None
+    max_age: float = 86400
+    max_rows: int = 1000
+    memory: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    con: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+
+    @staticmethod
+    def get_key(source: str, text: str, parser: str = "") -> str:
+        """Get the key of a page: the hash of its source, of its body and of
+        the parser, so that another parser (or profile) parses the page again."""
+        return hashlib.sha256(f"{source}\0{parser}\0{text}".encode()).hexdigest()
+
+    @staticmethod
+    def serialize(entries: list[EntryEntity]) -> str:
+        """Serialize the entries in JSON, keeping only their init fields."""
+        init_fields = [
+            entry_field.name for entry_field in fields(EntryEntity) if entry_field.init
+        ]
+        return json.dumps(
+            [
+                {
+                    name: value
+                    for name, value in asdict(entry).items()
+                    if name in init_fields
+                }
+                for entry in entries
+            ]
+        )
+
+    @staticmethod
+    def deserialize(data: str) -> list[EntryEntity]:
+        """Build back the entries from their JSON serialization."""
+        return [EntryEntity(**entry) for entry in json.loads(data)]
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Open the persistent tier on first use."""
+        if self.con is None:
+            self.con = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.con.execute(
+                """CREATE TABLE IF NOT EXISTS entry_cache(
+                    key TEXT PRIMARY KEY,
+                    entries TEXT,
+                    cached_at REAL
+                )
+                """
+            )
+            columns = [
+                row[1] for row in self.con.execute("PRAGMA table_info(entry_cache)")
+            ]
+            if "cached_at" not in columns:
+                # The rows of a former version have no age, they are dropped
+                self.con.execute("ALTER TABLE entry_cache ADD COLUMN cached_at REAL")
+        return self.con
+
+    def prune(self, con: sqlite3.Connection) -> None:
+        """Delete the expired rows, then the oldest ones beyond max_rows."""
+        con.execute(
+            "DELETE FROM entry_cache WHERE cached_at IS NULL OR cached_at < ?",
+            (time.time() - self.max_age,),
+        )
+        con.execute(
+            """DELETE FROM entry_cache WHERE key NOT IN (
+                SELECT key FROM entry_cache ORDER BY cached_at DESC LIMIT ?
+            )""",
+            (self.max_rows,),
+        )
+
+    def get(self, key: str) -> list[EntryEntity] | None:
+        """Get the entries of the page if they are cached.
+
+        Args:
+            key (str): key of the page.
+
+        Returns:
+            entries (Optional(list[EntryEntity])): the cached entries.
+        """
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return list(self.memory[key])
+            if self.db_path is None:
+                return None
+            row = (
+                self.get_connection()
+                .execute(
+                    "SELECT entries FROM entry_cache WHERE key = ? AND cached_at >= ?",
+                    (key, time.time() - self.max_age),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        entries = self.deserialize(row[0])
+        self.set(key, entries, persist=False)
+        return list(entries)
+
+    def set(self, key: str, entries: list[EntryEntity], persist: bool = True) -> None:
+        """Cache the entries of a page.
+
+        Args:
+            key (str): key of the page.
+            entries (list[EntryEntity]): the entries parsed from the page.
+            persist (bool): also store them in the persistent tier.
+        """
+        with self.lock:
+            self.memory[key] = list(entries)
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_size:
+                self.memory.popitem(last=False)
+            if persist and self.db_path is not None:
+                con = self.get_connection()
+                con.execute(
+                    "INSERT OR REPLACE INTO entry_cache VALUES (?, ?, ?)",
+                    (key, self.serialize(entries), time.time()),
+                )
+                self.prune(con)
+                con.commit()
@@ -1,6 +1,6 @@
 import logging
 
-from src.domain.entities import LogEntity
+from src.domain.entities import LogEntity, get_orders
 from src.domain.repositories import LogRepositoryInterface
 
 
@@ -23,19 +23,23 @@ class FileLoggerAdapter(LogRepositoryInterface):
         )
         self.logger.setLevel(self.log_level)
 
-    def log_request(self, log_entity: LogEntity):
+    @staticmethod
+    def get_request_fields(log_entity: LogEntity) -> tuple[str, str]:
+        """Get the texts of the filter and of the order of the request."""
         if log_entity.filter is None:
             filter_log = "Nothing"
         else:
-            filter_log = f"{log_entity.filter.field.value} {log_entity.filter.operator.value} {log_entity.filter.value}"
+            filter_log = str(log_entity.filter)
         if log_entity.order is None:
             order_log = "Nothing"
         else:
-            order_log = (
-                f"{log_entity.order.field.value} {log_entity.order.direction.value}"
-            )
+            order_log = ", ".join(str(order) for order in get_orders(log_entity.order))
+        return filter_log, order_log
+
+    def log_request(self, log_entity: LogEntity):
+        filter_log, order_log = self.get_request_fields(log_entity)
         log_message = f"Filter by: {filter_log} - Order by: {order_log}"
         self.logger.info(log_message)
 
     def log_debug(self, message: str) -> None:
-        logging.debug(message)
+        self.logger.debug(message)
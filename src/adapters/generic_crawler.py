@@ -0,0 +1,195 @@
+import functools
+import json
+import re
+from dataclasses import dataclass
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+from src.adapters.crawler import HackerNewsCrawlerEntryAdapter
+from src.adapters.html_parsers import TreeHtmlParserInterface
+from src.domain.entities import EntryEntity
+
+NUMBER_REGEX = re.compile(r"\d[\d,]*")
+
+
+@functools.lru_cache(maxsize=None)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once, the compiled selectors being shared."""
+    return soupsieve.compile(selector)
+
+
+def parse_number(text: str) -> int | None:
+    """Get the first number of a text ("1,234 points"), None if there is none."""
+    match = NUMBER_REGEX.search(text)
+    if match is None:
+        return None
+    return int(match[0].replace(",", ""))
+
+
+@dataclass(frozen=True)
+class SelectorProfile:
+    """CSS selectors locating the entries of a listing page.
+
+    The title, rank, score and comments selectors are applied inside each row
+    (or inside the row following it for score and comments when
+    details_in_next_row is True). Without a rank selector, the rank is the
+    position of the row; without a score or comments selector, the value is
+    0. A row whose selected node is missing is skipped.
+
+    Attributes:
+        row (str): selector of the entry rows.
+        title (str): selector of the title in a row.
+        rank (Optional(str)): selector of the rank in a row.
+        score (Optional(str)): selector of the score.
+        comments (Optional(str)): selector of the comments link; a text
+            without number ("discuss") means 0 comments.
+        details_in_next_row (bool): score and comments are in the next row.
+        item_id_attribute (Optional(str)): attribute of the row holding the item id.
+        page_parameter (Optional(str)): query parameter of the page number,
+            None if the source has a single page.
+    """
+
+    row: str
+    title: str
+    rank: str | None = None
+    score: str | None = None
+    comments: str | None = None
+    details_in_next_row: bool = False
+    item_id_attribute: str | None = "id"
+    page_parameter: str | None = None
+
+
+HACKER_NEWS_PROFILE = SelectorProfile(
+    row="tr.athing",
+    title="span.titleline > a",
+    rank="span.rank",
+    score="span.score",
+    comments="span.subline > a:last-of-type",
+    details_in_next_row=True,
+    page_parameter="p",
+)
+
+
+def load_profiles(path: str) -> dict[str, SelectorProfile]:
+    """Load the selector profiles of a JSON file.
+
+    The file maps the url prefix of each source to the fields of its profile,
+    ex: {"https://lobste.rs/": {"row": "li.story", "title": "a.u-url"}}.
+
+    Args:
+        path (str): path of the JSON file.
+
+    Returns:
+        profiles (dict[str, SelectorProfile]): the profile of each url prefix.
+    """
+    with open(path, "r") as file:
+        profiles = json.load(file)
+    return {prefix: SelectorProfile(**profile) for prefix, profile in profiles.items()}
+
+
+@dataclass
+class SelectorProfileHtmlParser(TreeHtmlParserInterface):
+    """BeautifulSoup parser driven by a selector profile.
+
+    Attributes:
+        profile (SelectorProfile): the selectors of the source.
+        features (str): tree builder of BeautifulSoup.
+    """
+
+    profile: SelectorProfile
+    features: str = "html.parser"
+
+    def select_text(self, html: Tag | None, selector: str) -> str | None:
+        """Get the text of the first node matching the selector."""
+        if html is None:
+            return None
+        node = compile_selector(selector).select_one(html)
+        if node is None:
+            return None
+        return node.get_text()
+
+    def get_details_node(self, html: Tag) -> Tag | None:
+        if self.profile.details_in_next_row:
+            return html.find_next_sibling()
+        return html
+
+    def find_entry_nodes(self, text: str) -> list[Tag]:
+        soup = BeautifulSoup(text, self.features)
+        return compile_selector(self.profile.row).select(soup)
+
+    def get_entry_item_id_from_html(self, html: Tag) -> int | None:
+        if self.profile.item_id_attribute is None:
+            return None
+        return self.parse_item_id(html.get(self.profile.item_id_attribute))
+
+    def get_entry_index_from_html(self, html: Tag) -> int | None:
+        if self.profile.rank is None:
+            # Replaced by the position of the row in parse_entries
+            return 0
+        rank_text = self.select_text(html, self.profile.rank)
+        if rank_text is None:
+            return None
+        return parse_number(rank_text)
+
+    def get_entry_title_from_html(self, html: Tag) -> str | None:
+        return self.select_text(html, self.profile.title)
+
+    def get_entry_points_from_html(self, html: Tag) -> int | None:
+        if self.profile.score is None:
+            return 0
+        score_text = self.select_text(self.get_details_node(html), self.profile.score)
+        if score_text is None:
+            return None
+        return parse_number(score_text)
+
+    def get_entry_comments_from_html(self, html: Tag) -> int | None:
+        if self.profile.comments is None:
+            return 0
+        comments_text = self.select_text(
+            self.get_details_node(html), self.profile.comments
+        )
+        if comments_text is None:
+            return None
+        return parse_number(comments_text) or 0
+
+    def parse_entries(self, text: str, source: str) -> list[EntryEntity]:
+        entries = super().parse_entries(text, source)
+        if self.profile.rank is None:
+            for position, entry in enumerate(entries, start=1):
+                entry.index = position
+        return entries
+
+
+@dataclass
+class GenericCrawlerEntryAdapter(HackerNewsCrawlerEntryAdapter):
+    """Crawler of any listing page described by a selector profile.
+
+    It shares the fetching, caching and pagination of the HackerNews crawler,
+    and parses the pages with the selectors of the profile.
+
+    Attributes:
+        profile (SelectorProfile): the selectors of the source.
+    """
+
+    profile: SelectorProfile = HACKER_NEWS_PROFILE
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.parser = SelectorProfileHtmlParser(profile=self.profile)
+
+    def get_page_url(self, source: str, page_number: int) -> str:
+        return super().get_page_url(source, page_number, self.profile.page_parameter)
+
+    def get_number_of_pages(self) -> int:
+        if self.profile.page_parameter is None:
+            return 1
+        return super().get_number_of_pages()
+
+    def get_entries(self, source: str) -> list[EntryEntity]:
+        entries = super().get_entries(source)
+        if self.profile.rank is None:
+            # The positions of the rows restart at 1 on each page
+            for position, entry in enumerate(entries, start=1):
+                entry.index = position
+        return entries
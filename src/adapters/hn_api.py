@@ -0,0 +1,153 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import requests
+
+from src.adapters.http_session import DEFAULT_TIMEOUT, create_session
+from src.domain.entities import EntryEntity
+from src.domain.repositories import EntryRepositoryInterface, LogRepositoryInterface
+
+HACKER_NEWS_API_URL = "https://hacker-news.firebaseio.com/v0"
+
+
+@dataclass
+class HackerNewsApiEntryAdapter(EntryRepositoryInterface):
+    """HackerNews API implementation (https://github.com/HackerNews/API).
+
+    The source is the url of a stories list (topstories.json, newstories.json,
+    etc.). The items of the list are fetched concurrently and kept in an
+    in-process cache, so the next calls only fetch the expired items. The
+    expired items are evicted after each call, as the oldest ones beyond
+    max_cached_items.
+
+    Attributes:
+        logger (Logger): logger.
+        max_entries (int): number of stories of the list to fetch.
+        max_workers (int): size of the thread pool fetching the items.
+        item_ttl (float): seconds during which a fetched item is reused.
+        max_cached_items (int): maximum number of items kept in the cache.
+        session (requests.Session): pooled HTTP session used for every request.
+        timeout (tuple[float, float]): connect and read timeouts, in seconds.
+    """
+
+    logger: LogRepositoryInterface
+    max_entries: int = 30
+    max_workers: int = 8
+    item_ttl: float = 60
+    max_cached_items: int = 1000
+    session: requests.Session = field(default_factory=create_session)
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT
+    item_cache: dict = field(default_factory=dict, init=False, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @staticmethod
+    def get_item_url(source: str, item_id: int) -> str:
+        """Get the url of an item from the url of the stories list.
+
+        Args
+            source (str): url of the stories list (ex: .../v0/topstories.json).
+            item_id (int): id of the item.
+
+        Returns:
+            item_url (str): the url of the item.
+        """
+        api_url = source.rsplit("/", 1)[0]
+        return f"{api_url}/item/{item_id}.json"
+
+    def get_json(self, url: str):
+        """Get the JSON document of the url, None if it can't be fetched."""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as exception:
+            self.logger.log_debug(f"can't access source {url}: {exception}")
+            return None
+        if not response.status_code == 200:
+            self.logger.log_debug(f"can't access source {url}")
+            return None
+        try:
+            return response.json()
+        except ValueError as exception:
+            self.logger.log_debug(f"invalid JSON from source {url}: {exception}")
+            return None
+
+    def get_item(self, item_url: str) -> dict | None:
+        """Get an item, from the cache if it has not expired.
+
+        Args
+            item_url (str): url of the item.
+
+        Returns:
+            item (Optional(dict)): the item.
+        """
+        with self.lock:
+            cached_item = self.item_cache.get(item_url)
+        if cached_item is not None:
+            fetched_at, item = cached_item
+            if time.monotonic() - fetched_at < self.item_ttl:
+                return item
+        item = self.get_json(item_url)
+        if item is not None:
+            with self.lock:
+                # Re-inserted, so the cache stays ordered by fetch time
+                self.item_cache.pop(item_url, None)
+                self.item_cache[item_url] = (time.monotonic(), item)
+        return item
+
+    def evict_items(self) -> None:
+        """Remove the expired items, then the oldest ones beyond max_cached_items."""
+        expired_before = time.monotonic() - self.item_ttl
+        with self.lock:
+            for item_url, (fetched_at, _) in list(self.item_cache.items()):
+                if (
+                    fetched_at >= expired_before
+                    and len(self.item_cache) <= self.max_cached_items
+                ):
+                    break
+                del self.item_cache[item_url]
+
+    @staticmethod
+    def get_entry_from_item(item: dict | None, index: int, source: str):
+        """Build the entry of an item, None if it is not a story with comments.
+
+        Args
+            item (Optional(dict)): the item of the API.
+            index (int): rank of the item in the stories list.
+            source (str): url of the source, stored on the entry.
+
+        Returns:
+            entry (Optional(EntryEntity)): the entry.
+        """
+        if item is None or item.get("deleted") or item.get("dead"):
+            return None
+        try:
+            return EntryEntity(
+                index=index,
+                title=item["title"],
+                total_points=item["score"],
+                total_comments=item["descendants"],
+                source=source,
+                item_id=item["id"],
+            )
+        except KeyError:
+            return None
+
+    def get_entries(self, source: str) -> list[EntryEntity]:
+        item_ids = self.get_json(source)
+        if not item_ids:
+            return []
+        item_urls = [
+            self.get_item_url(source, item_id)
+            for item_id in item_ids[: self.max_entries]
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            items = list(executor.map(self.get_item, item_urls))
+        self.evict_items()
+
+        entries = []
+        for index, item in enumerate(items, start=1):
+            entry = self.get_entry_from_item(item, index, source)
+            if entry is not None:
+                entries.append(entry)
+        return entries
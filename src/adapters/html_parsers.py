@@ -0,0 +1,473 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from html.parser import HTMLParser
+from typing import Any, Iterable, Iterator
+
+from bs4 import BeautifulSoup, Tag, builder_registry
+
+from src.domain.entities import EntryEntity
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover
+    LexborHTMLParser = None
+
+
+class HtmlParserInterface(ABC):
+    """Abstract interface of the parsers of a HackerNews listing page.
+
+    The text to int conversions are shared, so every backend returns the
+    same entries for the same page.
+
+    """
+
+    @abstractmethod
+    def parse_entries(self, text: str, source: str) -> list[EntryEntity]:
+        """Extract the entries from the html of a page.
+
+        Args:
+            text (str): html of the page.
+            source (str): url of the source, stored on each entry.
+
+        Returns:
+            entries (list[EntryEntity]): the entries of the page.
+        """
+        ...
+
+    @staticmethod
+    def parse_item_id(id_text: str | None) -> int | None:
+        """Convert the id attribute of the entry row to the item id, if any."""
+        try:
+            return int(id_text)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def parse_index(rank_text: str) -> int:
+        """Convert the text of the rank ("12.") to the index."""
+        return int(rank_text.strip("."))
+
+    @staticmethod
+    def parse_points(score_text: str) -> int:
+        """Convert the text of the score ("121 points") to the points."""
+        return int(score_text.strip(" points"))
+
+    @staticmethod
+    def parse_comments(link_texts: list[str]) -> int | None:
+        """Get the number of comments from the texts of the subline links.
+
+        Manage the case with 0 comments.
+        """
+        for link_text in link_texts:
+            if "comment" in link_text:
+                return int(link_text.split()[0])
+            if "discuss" in link_text:
+                return 0
+        return None
+
+
+class TreeHtmlParserInterface(HtmlParserInterface):
+    """Abstract interface of the parsers building a tree of the page.
+
+    Each backend finds the entry rows of the page and implements the five
+    extractors.
+
+    """
+
+    @abstractmethod
+    def find_entry_nodes(self, text: str) -> list[Any]:
+        """Get the nodes of the entries (tr.athing) of the page.
+
+        Args:
+            text (str): html of the page.
+
+        Returns:
+            nodes (list): the entry nodes of the backend.
+        """
+        ...
+
+    @abstractmethod
+    def get_entry_item_id_from_html(self, html: Any) -> int | None: ...
+
+    @abstractmethod
+    def get_entry_index_from_html(self, html: Any) -> int | None: ...
+
+    @abstractmethod
+    def get_entry_title_from_html(self, html: Any) -> str | None: ...
+
+    @abstractmethod
+    def get_entry_points_from_html(self, html: Any) -> int | None: ...
+
+    @abstractmethod
+    def get_entry_comments_from_html(self, html: Any) -> int | None: ...
+
+    def parse_entries(self, text: str, source: str) -> list[EntryEntity]:
+        entries = []
+        for html_entry in self.find_entry_nodes(text):
+            index = self.get_entry_index_from_html(html_entry)
+            if index is None:
+                continue
+            title = self.get_entry_title_from_html(html_entry)
+            if title is None:
+                continue
+            total_points = self.get_entry_points_from_html(html_entry)
+            if total_points is None:
+                continue
+            total_comments = self.get_entry_comments_from_html(html_entry)
+            if total_comments is None:
+                continue
+            entry = EntryEntity(
+                index=index,
+                title=title,
+                total_points=total_points,
+                total_comments=total_comments,
+                source=source,
+                item_id=self.get_entry_item_id_from_html(html_entry),
+            )
+            entries.append(entry)
+        return entries
+
+
+@dataclass
+class BeautifulSoupHtmlParser(TreeHtmlParserInterface):
+    """BeautifulSoup parser, with the pure-Python or the lxml tree builder.
+
+    Attributes:
+        features (str): tree builder of BeautifulSoup ("html.parser" or "lxml").
+    """
+
+    features: str = "html.parser"
+
+    def __post_init__(self):
+        if builder_registry.lookup(self.features) is None:
+            raise ImportError(
+                f"{self.features} is required for the {self.features} parser"
+            )
+
+    def find_entry_nodes(self, text: str) -> list[Tag]:
+        soup = BeautifulSoup(text, self.features)
+        return soup.find_all("tr", class_="athing")
+
+    @staticmethod
+    def get_entry_item_id_from_html(html: Tag) -> int | None:
+        """Get the HackerNews item id of the entry from the html code.
+
+        Args
+            html (Tag): represent an entry node in the html.
+
+        Returns:
+            item_id (Optional(int)): the id attribute of the entry row.
+        """
+        return HtmlParserInterface.parse_item_id(html.get("id"))
+
+    @staticmethod
+    def get_entry_index_from_html(html: Tag) -> int | None:
+        """Get the index of the entry from the html code.
+
+        Args
+            html (Tag): represent an entry node in the html.
+
+        Returns:
+            index (Optional(int)): the index of the entry.
+        """
+        html_rank = html.find("span", class_="rank")
+        try:
+            index = HtmlParserInterface.parse_index(html_rank.get_text())
+        except AttributeError:
+            return None
+        return index
+
+    @staticmethod
+    def get_entry_title_from_html(html: Tag) -> str | None:
+        """Get the title of the entry from the html code.
+
+        Args
+            html (Tag): represent an entry node in the html.
+
+        Returns:
+            title (Optional(str)): the title of the entry.
+
+        """
+        html_titleline = html.find("span", class_="titleline")
+        try:
+            title = html_titleline.a.get_text()
+        except AttributeError:
+            return None
+        return title
+
+    @staticmethod
+    def get_entry_points_from_html(html: Tag) -> int | None:
+        """Get the number of points of the entry from the html code.
+
+        Args
+            html (Tag): represent an entry node in the html.
+
+        Returns:
+            total_points (Optional(int)): number of points of an entry if found.
+
+        """
+        try:
+            total_points_node = html.next_sibling.find("span", class_="score")
+            total_points = HtmlParserInterface.parse_points(
+                total_points_node.get_text()
+            )
+        except AttributeError:
+            return None
+        return total_points
+
+    @staticmethod
+    def get_entry_comments_from_html(html: Tag) -> int | None:
+        """Get the number of comments of the entry from the html code.
+
+        Manage the case with 0 comments.
+
+        Args
+            html (Tag): represent an entry node in the html.
+
+        Returns:
+            total_comments (Optional(int)): number of comments of an entry if found.
+
+        """
+        subline_nodes = html.next_sibling.find_all("a")
+        return HtmlParserInterface.parse_comments(
+            [item.get_text() for item in subline_nodes]
+        )
+
+
+@dataclass
+class SelectolaxHtmlParser(TreeHtmlParserInterface):
+    """Parser using the CSS selector engine of selectolax (lexbor backend)."""
+
+    def __post_init__(self):
+        if LexborHTMLParser is None:
+            raise ImportError("selectolax is required for the selectolax parser")
+
+    def find_entry_nodes(self, text: str) -> list[Any]:
+        return LexborHTMLParser(text).css("tr.athing")
+
+    @staticmethod
+    def get_subtext_node(html: Any) -> Any | None:
+        """Get the row following the entry row, with the score and comments."""
+        node = html.next
+        while node is not None and node.tag != "tr":
+            node = node.next
+        return node
+
+    def get_entry_item_id_from_html(self, html: Any) -> int | None:
+        return self.parse_item_id(html.attributes.get("id"))
+
+    def get_entry_index_from_html(self, html: Any) -> int | None:
+        html_rank = html.css_first("span.rank")
+        if html_rank is None:
+            return None
+        return self.parse_index(html_rank.text())
+
+    def get_entry_title_from_html(self, html: Any) -> str | None:
+        html_title = html.css_first("span.titleline a")
+        if html_title is None:
+            return None
+        return html_title.text()
+
+    def get_entry_points_from_html(self, html: Any) -> int | None:
+        subtext_node = self.get_subtext_node(html)
+        if subtext_node is None:
+            return None
+        total_points_node = subtext_node.css_first("span.score")
+        if total_points_node is None:
+            return None
+        return self.parse_points(total_points_node.text())
+
+    def get_entry_comments_from_html(self, html: Any) -> int | None:
+        subtext_node = self.get_subtext_node(html)
+        if subtext_node is None:
+            return None
+        return self.parse_comments([item.text() for item in subtext_node.css("a")])
+
+
+class HackerNewsEntryTokenizer(HTMLParser):
+    """Incremental tokenizer emitting the entries of a HackerNews page.
+
+    The html is fed chunk by chunk and never turned into a tree: the state of
+    the entry row (tr.athing) and of the subtext row following it is kept
+    until the subtext row is closed, then the entry is appended to entries.
+
+    Attributes:
+        source (str): url of the source, stored on each entry.
+        entries (list[EntryEntity]): entries completed since the last drain.
+    """
+
+    def __init__(self, source: str):
+        super().__init__()
+        self.source = source
+        self.entries = []
+        self.row = None
+        self.row_depth = 0
+        self.capture = None
+        self.captured_text = []
+
+    def start_row(self, item_id: str | None) -> None:
+        self.row = {
+            "state": "entry",
+            "item_id": item_id,
+            "rank": None,
+            "title": None,
+            "score": None,
+            "links": [],
+            "in_titleline": False,
+        }
+
+    def end_row(self) -> None:
+        """Emit the entry of the completed rows if all its fields were found."""
+        row, self.row = self.row, None
+        if row is None or row["rank"] is None or row["title"] is None:
+            return
+        total_comments = HtmlParserInterface.parse_comments(row["links"])
+        if row["score"] is None or total_comments is None:
+            return
+        try:
+            index = HtmlParserInterface.parse_index(row["rank"])
+            total_points = HtmlParserInterface.parse_points(row["score"])
+        except ValueError:
+            return
+        self.entries.append(
+            EntryEntity(
+                index=index,
+                title=row["title"],
+                total_points=total_points,
+                total_comments=total_comments,
+                source=self.source,
+                item_id=HtmlParserInterface.parse_item_id(row["item_id"]),
+            )
+        )
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+        if tag == "tr":
+            if "athing" in classes:
+                self.end_row()
+                self.start_row(attributes.get("id"))
+                self.row_depth = 1
+            elif self.row is not None and self.row_depth == 0:
+                if self.row["state"] == "entry":
+                    self.row["state"] = "subtext"
+                    self.row_depth = 1
+                else:
+                    self.end_row()
+            elif self.row is not None:
+                self.row_depth += 1
+            return
+        if self.row is None or self.row_depth == 0:
+            return
+        if self.row["state"] == "entry":
+            if tag == "span" and "rank" in classes:
+                self.start_capture("rank")
+            elif tag == "span" and "titleline" in classes:
+                self.row["in_titleline"] = True
+            elif tag == "a" and self.row["in_titleline"] and self.row["title"] is None:
+                self.start_capture("title")
+        else:
+            if tag == "span" and "score" in classes:
+                self.start_capture("score")
+            elif tag == "a":
+                self.start_capture("links")
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.row is None:
+            return
+        if tag == "tr" and self.row_depth > 0:
+            self.row_depth -= 1
+            if self.row_depth == 0 and self.row["state"] == "subtext":
+                self.end_row()
+            return
+        if self.capture is None:
+            return
+        if (tag == "a" and self.capture in ("title", "links")) or (
+            tag == "span" and self.capture in ("rank", "score")
+        ):
+            self.end_capture()
+
+    def handle_data(self, data: str) -> None:
+        if self.capture is not None:
+            self.captured_text.append(data)
+
+    def start_capture(self, field_name: str) -> None:
+        self.capture = field_name
+        self.captured_text = []
+
+    def end_capture(self) -> None:
+        text = "".join(self.captured_text)
+        if self.capture == "links":
+            self.row["links"].append(text)
+        else:
+            self.row[self.capture] = text
+        self.capture = None
+        self.captured_text = []
+
+    def drain(self) -> list[EntryEntity]:
+        """Get the entries completed since the last drain."""
+        entries, self.entries = self.entries, []
+        return entries
+
+    def close(self) -> None:
+        super().close()
+        self.end_row()
+
+
+@dataclass
+class StreamingHtmlParser(HtmlParserInterface):
+    """Single-pass parser streaming the page through a SAX-style tokenizer.
+
+    It never builds a tree of the page, and each entry is available as soon
+    as its subtext row is complete.
+    """
+
+    def iter_entries(self, chunks: Iterable[str], source: str) -> Iterator[EntryEntity]:
+        """Stream the entries of a page fed chunk by chunk.
+
+        Args:
+            chunks (Iterable[str]): the html of the page, in chunks.
+            source (str): url of the source, stored on each entry.
+
+        Yields:
+            entry (EntryEntity): each entry, as soon as it is complete.
+        """
+        tokenizer = HackerNewsEntryTokenizer(source=source)
+        for chunk in chunks:
+            tokenizer.feed(chunk)
+            yield from tokenizer.drain()
+        tokenizer.close()
+        yield from tokenizer.drain()
+
+    def parse_entries(self, text: str, source: str) -> list[EntryEntity]:
+        return list(self.iter_entries([text], source))
+
+
+class HtmlParserEnum(Enum):
+    """Enum of the html parser backends.
+
+    Attributes:
+        html_parser: BeautifulSoup with the pure-Python tree builder.
+        lxml: BeautifulSoup with the lxml tree builder.
+        selectolax: selectolax CSS selector engine.
+        streaming: single-pass tokenizer, without any tree.
+
+    """
+
+    html_parser = "html.parser"
+    lxml = "lxml"
+    selectolax = "selectolax"
+    streaming = "streaming"
+
+    def create_parser(self) -> HtmlParserInterface:
+        """Returns the parser instance according to the enum string."""
+        match self.value:
+            case "html.parser":
+                return BeautifulSoupHtmlParser(features="html.parser")
+            case "lxml":
+                return BeautifulSoupHtmlParser(features="lxml")
+            case "selectolax":
+                return SelectolaxHtmlParser()
+            case "streaming":
+                return StreamingHtmlParser()
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+
+import requests
+
+
+@dataclass
+class CachedPage:
+    """Page served from the cache, with the same interface as a response.
+
+    Attributes:
+        text (str): body of the page.
+        status_code (int): always 200, the cache only stores successful pages.
+    """
+
+    text: str
+    status_code: int = 200
+
+
+@dataclass
+class HttpCache:
+    """On-disk cache of the crawled pages using conditional GET requests.
+
+    Each page is stored in its own JSON file, keyed by the hash of its url,
+    with its body and validators (ETag, Last-Modified). The next fetch of the
+    url sends If-None-Match/If-Modified-Since and reuses the stored body when
+    the server answers 304 Not Modified.
+
+    Attributes:
+        directory (str): directory of the cache files.
+        ttl (float): age in seconds under which a stored page is served
+            without any network request. 0 means always revalidate.
+    """
+
+    directory: str = "data/http_cache"
+    ttl: float = 0
+
+    def get_path(self, url: str) -> str:
+        """Get the path of the cache file of the url."""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, url: str) -> dict | None:
+        """Load the stored record of the url if there is one."""
+        try:
+            with open(self.get_path(url), "r") as file:
+                record = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if record.get("url") != url:
+            return None
+        return record
+
+    def store(self, url: str, record: dict) -> None:
+        """Store the record of the url, atomically replacing the previous one."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.get_path(url)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(record, file)
+        os.replace(temporary_path, path)
+
+    def fetch(
+        self,
+        session: requests.Session,
+        url: str,
+        timeout: tuple[float, float],
+    ) -> requests.Response | CachedPage:
+        """Fetch the url, going through the cache.
+
+        Args:
+            session (requests.Session): session used for the network requests.
+            url (str): url of the page.
+            timeout (tuple[float, float]): connect and read timeouts.
+
+        Returns:
+            page (Response | CachedPage): the page, with text and status_code.
+        """
+        record = self.load(url)
+        now = time.time()
+        if record is not None and now - record["fetched_at"] < self.ttl:
+            return CachedPage(text=record["body"])
+
+        headers = {}
+        if record is not None:
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+        page = session.get(url, timeout=timeout, headers=headers)
+
+        if page.status_code == 304 and record is not None:
+            record["fetched_at"] = now
+            self.store(url, record)
+            return CachedPage(text=record["body"])
+        if page.status_code == 200:
+            record = {
+                "url": url,
+                "etag": page.headers.get("ETag"),
+                "last_modified": page.headers.get("Last-Modified"),
+                "fetched_at": now,
+                "body": page.text,
+            }
+            self.store(url, record)
+        return page
@@ -0,0 +1,62 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.adapters.rate_limiter import (
+    RETRY_METHODS,
+    RETRY_STATUS_CODES,
+    HostRateLimiter,
+    PoliteSession,
+)
+
+DEFAULT_TIMEOUT = (3.05, 10.0)
+
+
+def create_session(
+    pool_size: int = 10,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    rate_limiter: HostRateLimiter | None = None,
+) -> requests.Session:
+    """Create a pooled HTTP session shared by the adapters.
+
+    The connections are kept alive and reused between the requests, and the
+    requests failing with a 5xx or a 429 status are retried with an
+    exponential backoff (honouring the Retry-After header).
+
+    With a rate limiter, the requests are paced per host and checked against
+    the robots.txt, and the 429 and 5xx are retried by the session itself,
+    so every retry waits for its turn and a Retry-After pauses the host for
+    all the threads sharing the limiter (during max_retry_after at most).
+    urllib3 then only retries the connection errors.
+
+    Args:
+        pool_size (int): number of connections kept alive per host.
+        retries (int): maximum number of retries of a request.
+        backoff_factor (float): base of the exponential backoff, in seconds.
+        rate_limiter (Optional(HostRateLimiter)): politeness scheduler of the hosts.
+
+    Returns:
+        session (requests.Session): the configured session.
+    """
+    status_forcelist = RETRY_STATUS_CODES
+    if rate_limiter is not None:
+        # Retried by the PoliteSession, through the limiter
+        status_forcelist = ()
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=frozenset(RETRY_METHODS),
+        respect_retry_after_header=rate_limiter is None,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    if rate_limiter is not None:
+        session = PoliteSession(rate_limiter, retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,129 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+from datetime import datetime
+
+from src.adapters.file_logger import FileLoggerAdapter
+from src.domain.entities import LogEntity
+
+TEXT_FORMAT = "%(levelname)s - %(asctime)-s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+REQUEST_MESSAGE = "Filter by: %s - Order by: %s"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format each record as a JSON object on its own line.
+
+    The filter and order of the requests are kept as separate keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        document = {
+            "time": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key in ("filter", "order"):
+            if hasattr(record, key):
+                document[key] = getattr(record, key)
+        return json.dumps(document)
+
+
+class EnqueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler putting the records in the queue as they are.
+
+    The stock QueueHandler formats and copies each record in the caller's
+    thread. Here the formatting is left to the handler of the listener, so
+    logging only costs an enqueue. The objects logged with a record must
+    not be changed afterwards, as the LogEntity of the requests.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class QueueFileLoggerAdapter(FileLoggerAdapter):
+    """Non-blocking File Logger implementation.
+
+    The records are put in a queue by a QueueHandler, and a QueueListener
+    thread writes them with a dedicated file handler, so logging only costs
+    an enqueue: the texts of the filter and order of a request are built
+    by the listener thread too. The root logger is left untouched.
+
+    The file is rotated at each interval if when is set (time rotation),
+    else each time it reaches max_bytes if it is set (size rotation). The
+    queued records are written at close, and at interpreter exit.
+
+    Attributes:
+        log_level (int): Level of logging (INFO, DEBUG, etc).
+        filename (str): path of the log file.
+        max_bytes (int): size of the file triggering a rotation, 0 to disable.
+        when (Optional(str)): interval of the time rotation ("midnight", "H", etc).
+        backup_count (int): number of rotated files kept.
+        json_lines (bool): write JSON lines instead of text lines.
+
+    """
+
+    def __init__(
+        self,
+        log_level: int,
+        filename: str = "./data/app.log",
+        max_bytes: int = 0,
+        when: str | None = None,
+        backup_count: int = 0,
+        json_lines: bool = False,
+    ):
+        self.log_level = log_level
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if when is not None:
+            self.handler = logging.handlers.TimedRotatingFileHandler(
+                filename, when=when, backupCount=backup_count, delay=True
+            )
+        else:
+            self.handler = logging.handlers.RotatingFileHandler(
+                filename, maxBytes=max_bytes, backupCount=backup_count, delay=True
+            )
+        if json_lines:
+            self.handler.setFormatter(JsonLinesFormatter())
+        else:
+            self.handler.setFormatter(
+                logging.Formatter(fmt=TEXT_FORMAT, datefmt=DATE_FORMAT)
+            )
+        self.handler.addFilter(self.add_request_fields)
+        self.queue = queue.SimpleQueue()
+        self.queue_handler = EnqueueHandler(self.queue)
+        self.listener = logging.handlers.QueueListener(self.queue, self.handler)
+        self.logger = logging.getLogger(f"queue_file_logger.{id(self)}")
+        self.logger.setLevel(self.log_level)
+        self.logger.propagate = False
+        self.logger.addHandler(self.queue_handler)
+        self.closed = False
+        self.listener.start()
+        atexit.register(self.close)
+
+    @classmethod
+    def add_request_fields(cls, record: logging.LogRecord) -> bool:
+        """Set the filter and order texts of a request record (listener thread)."""
+        log_entity = getattr(record, "log_entity", None)
+        if log_entity is not None:
+            record.filter, record.order = cls.get_request_fields(log_entity)
+            record.args = (record.filter, record.order)
+        return True
+
+    def log_request(self, log_entity: LogEntity):
+        self.logger.info(REQUEST_MESSAGE, extra={"log_entity": log_entity})
+
+    def close(self) -> None:
+        """Write the queued records, then stop the listener and close the file."""
+        if self.closed:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+        self.listener.stop()
+        self.logger.removeHandler(self.queue_handler)
+        self.handler.close()
@@ -0,0 +1,292 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+ROBOTS_TIMEOUT = (3.05, 10.0)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_AFTER_STATUS_CODES = (429, 503)
+RETRY_METHODS = ("GET", "HEAD")
+
+
+class RobotsDisallowedError(requests.RequestException):
+    """The robots.txt of the host disallows the url."""
+
+
+class RateLimitExceededError(requests.RequestException):
+    """The turn of the request to its host is later than the maximum wait."""
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Get the seconds to wait of a Retry-After header (seconds or HTTP date).
+
+    Args:
+        value (Optional(str)): value of the header.
+
+    Returns:
+        seconds (Optional(float)): the seconds to wait, None if the value is not valid.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket of a host, refilled at rate tokens per second.
+
+    A request reserves a token, the bucket going into debt when it is empty,
+    so the callers sleep outside of any lock and are spaced by 1/rate.
+
+    Attributes:
+        rate (float): tokens added per second.
+        capacity (float): maximum number of tokens (the allowed burst).
+        tokens (float): available tokens, negative when reserved in advance.
+        updated_at (float): monotonic time of the last refill.
+    """
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated_at: float
+
+    def reserve(self, now: float) -> float:
+        """Take a token.
+
+        Returns:
+            wait (float): seconds to wait before using the token.
+        """
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def refund(self) -> None:
+        """Give back a reserved token that is not used."""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def defer(self, until: float) -> None:
+        """Give no token before the monotonic time until."""
+        if until > self.updated_at:
+            self.tokens = min(self.tokens, 1)
+            self.updated_at = until
+
+
+@dataclass
+class HostRateLimiter:
+    """Politeness scheduler shared by the adapters and their threads.
+
+    Each host has its own token bucket, so the hosts are crawled in parallel
+    at full speed while every host gets at most rate requests per second
+    (after a burst of burst requests). The robots.txt of each host is fetched
+    once and cached during robots_ttl seconds; its Crawl-delay (or
+    Request-rate) lowers the rate of the host. A Retry-After answer pauses
+    the host for every thread, during max_retry_after seconds at most. A
+    request whose turn is more than max_wait seconds away fails instead of
+    sleeping.
+
+    Attributes:
+        rate (float): requests per second per host.
+        burst (float): requests sent without waiting by an idle host.
+        robots_ttl (float): seconds during which a robots.txt is reused.
+        respect_robots (bool): check the urls against the robots.txt.
+        max_wait (Optional(float)): longest wait for a turn, unlimited by default.
+        max_retry_after (float): longest pause of a host asked by a Retry-After.
+        clock (Callable): monotonic clock.
+        sleep (Callable): sleeps the given seconds.
+    """
+
+    rate: float = 4.0
+    burst: float = 8.0
+    robots_ttl: float = 3600
+    respect_robots: bool = True
+    max_wait: float | None = None
+    max_retry_after: float = 300
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], None] = time.sleep
+    buckets: dict[str, TokenBucket] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    robots: dict[str, tuple[float, RobotFileParser]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    robots_locks: dict[str, threading.Lock] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.rate <= 0:
+            raise ValueError(f"the rate must be positive: {self.rate}")
+        if self.burst < 1:
+            raise ValueError(f"the burst must be at least 1: {self.burst}")
+
+    @staticmethod
+    def get_origin(url: str) -> str:
+        """Get the scheme and host of an url (ex: https://news.ycombinator.com)."""
+        url_parts = urlsplit(url)
+        return f"{url_parts.scheme}://{url_parts.netloc.lower()}"
+
+    def get_bucket(self, origin: str) -> TokenBucket:
+        """Get the bucket of a host, limited by its robots.txt (lock held)."""
+        rate, capacity = self.rate, self.burst
+        cached_robots = self.robots.get(origin)
+        if cached_robots is not None:
+            robots_rate = self.get_robots_rate(cached_robots[1])
+            if robots_rate is not None and robots_rate < rate:
+                rate, capacity = robots_rate, 1
+        bucket = self.buckets.get(origin)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate, capacity, tokens=capacity, updated_at=self.clock()
+            )
+            self.buckets[origin] = bucket
+        bucket.rate, bucket.capacity = rate, capacity
+        return bucket
+
+    @staticmethod
+    def get_robots_rate(robots: RobotFileParser, user_agent: str = "*") -> float | None:
+        """Get the requests per second allowed by a robots.txt, None if unlimited."""
+        crawl_delay = robots.crawl_delay(user_agent)
+        if crawl_delay:
+            return 1 / float(crawl_delay)
+        request_rate = robots.request_rate(user_agent)
+        if request_rate is not None and request_rate.seconds:
+            return request_rate.requests / request_rate.seconds
+        return None
+
+    def get_robots(
+        self, url: str, fetch: Callable[[str], requests.Response]
+    ) -> RobotFileParser:
+        """Get the parsed robots.txt of the host of the url.
+
+        It is fetched once per host and per robots_ttl, even by concurrent
+        threads. As urllib.robotparser, a 401 or 403 disallows everything,
+        and another error status or a network error allows everything.
+
+        Args:
+            url (str): url on the host.
+            fetch (Callable): fetches an url.
+
+        Returns:
+            robots (RobotFileParser): the rules of the host.
+        """
+        origin = self.get_origin(url)
+        with self.lock:
+            origin_lock = self.robots_locks.setdefault(origin, threading.Lock())
+        with origin_lock:
+            cached_robots = self.robots.get(origin)
+            if (
+                cached_robots is not None
+                and self.clock() - cached_robots[0] < self.robots_ttl
+            ):
+                return cached_robots[1]
+            robots = RobotFileParser(f"{origin}/robots.txt")
+            try:
+                response = fetch(robots.url)
+            except requests.RequestException:
+                robots.allow_all = True
+            else:
+                if response.status_code in (401, 403):
+                    robots.disallow_all = True
+                elif response.status_code >= 400:
+                    robots.allow_all = True
+                else:
+                    robots.parse(response.text.splitlines())
+            robots.modified()
+            with self.lock:
+                self.robots[origin] = (self.clock(), robots)
+            return robots
+
+    def acquire(self, url: str) -> None:
+        """Wait for the turn of a request to the host of the url.
+
+        Raises:
+            RateLimitExceededError: if the turn is more than max_wait seconds away.
+        """
+        origin = self.get_origin(url)
+        with self.lock:
+            bucket = self.get_bucket(origin)
+            wait = bucket.reserve(self.clock())
+            if self.max_wait is not None and wait > self.max_wait:
+                bucket.refund()
+                raise RateLimitExceededError(
+                    f"{url} would wait {wait:.1f}s for its turn"
+                )
+        if wait > 0:
+            self.sleep(wait)
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Send no request to the host of the url during the given seconds."""
+        origin = self.get_origin(url)
+        with self.lock:
+            self.get_bucket(origin).defer(self.clock() + seconds)
+
+
+class PoliteSession(requests.Session):
+    """HTTP session whose requests go through a HostRateLimiter.
+
+    The urls disallowed by the robots.txt of their host raise a
+    RobotsDisallowedError. The GET and HEAD answered with a 429 or a 5xx are
+    retried up to retries times, each retry waiting for its turn: a
+    Retry-After header (429 or 503) pauses the host, else the host backs
+    off exponentially. A Retry-After longer than the max_retry_after of the
+    limiter is not waited for: the host is paused during max_retry_after
+    seconds, and the answer is returned.
+
+    Attributes:
+        rate_limiter (HostRateLimiter): the shared scheduler.
+        retries (int): maximum number of retries of a request.
+    """
+
+    def __init__(self, rate_limiter: HostRateLimiter, retries: int = 3):
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.retries = retries
+
+    def fetch_robots(self, robots_url: str) -> requests.Response:
+        self.rate_limiter.acquire(robots_url)
+        return super().request("GET", robots_url, timeout=ROBOTS_TIMEOUT)
+
+    def request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        if self.rate_limiter.respect_robots:
+            robots = self.rate_limiter.get_robots(url, self.fetch_robots)
+            if not robots.can_fetch(self.headers.get("User-Agent", "*"), url):
+                raise RobotsDisallowedError(f"{url} is disallowed by robots.txt")
+        for attempt in range(self.retries + 1):
+            self.rate_limiter.acquire(url)
+            response = super().request(method, url, *args, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            retry_after = None
+            if response.status_code in RETRY_AFTER_STATUS_CODES:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                max_retry_after = self.rate_limiter.max_retry_after
+                self.rate_limiter.defer(url, min(retry_after, max_retry_after))
+                if retry_after > max_retry_after:
+                    return response
+            if method.upper() not in RETRY_METHODS or attempt == self.retries:
+                return response
+            if retry_after is None:
+                # Without Retry-After, back off exponentially
+                self.rate_limiter.defer(url, 2**attempt / self.rate_limiter.rate)
+        return response
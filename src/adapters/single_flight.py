@@ -0,0 +1,47 @@
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from src.domain.entities import EntryEntity
+from src.domain.repositories import EntryRepositoryInterface
+
+
+@dataclass
+class SingleFlightEntryAdapter(EntryRepositoryInterface):
+    """Entry repository coalescing the concurrent fetches of a source.
+
+    The first caller of a source fetches it through the wrapped repository,
+    the callers arriving while that fetch is in flight wait for it and share
+    its result (or its exception) instead of fetching the source again.
+
+    Attributes:
+        repository (EntryRepositoryInterface): the wrapped repository.
+    """
+
+    repository: EntryRepositoryInterface
+    in_flight: dict = field(default_factory=dict, init=False, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get_entries(self, source: str) -> list[EntryEntity]:
+        with self.lock:
+            future = self.in_flight.get(source)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self.in_flight[source] = future
+        if not is_leader:
+            return list(future.result())
+
+        try:
+            entries = self.repository.get_entries(source)
+        except BaseException as exception:
+            # Even an interrupted leader (KeyboardInterrupt, SystemExit)
+            # must release the followers
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(entries)
+        finally:
+            with self.lock:
+                del self.in_flight[source]
+        return list(entries)
@@ -0,0 +1,59 @@
+import threading
+import time
+from dataclasses import dataclass, field
+
+from src.domain.entities import EntryEntity
+from src.domain.repositories import EntryRepositoryInterface
+
+
+@dataclass
+class CachedEntryAdapter(EntryRepositoryInterface):
+    """Entry repository serving a snapshot of each source for a while.
+
+    The entries of a source are fetched once by the wrapped repository, then
+    every call during the ttl is served from that snapshot, so the different
+    filter/order requests don't each trigger a new crawl. Beyond max_sources
+    snapshots, the least recently fetched one is evicted. An empty result
+    (the crawlers return no entry when a fetch fails) is not kept, so the
+    next call fetches the source again.
+
+    Attributes:
+        repository (EntryRepositoryInterface): the wrapped repository.
+        ttl (float): seconds during which a snapshot is served.
+        max_sources (int): maximum number of snapshots kept.
+    """
+
+    repository: EntryRepositoryInterface
+    ttl: float = 60
+    max_sources: int = 128
+    snapshots: dict = field(default_factory=dict, init=False, repr=False)
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get_snapshot(self, source: str) -> list[EntryEntity] | None:
+        """Get the entries of the snapshot of a source, without any fetch.
+
+        Returns:
+            entries (Optional(list[EntryEntity])): the entries, None if the
+                source has no snapshot younger than the ttl.
+        """
+        with self.lock:
+            snapshot = self.snapshots.get(source)
+        if snapshot is not None:
+            fetched_at, entries = snapshot
+            if time.monotonic() - fetched_at < self.ttl:
+                return list(entries)
+        return None
+
+    def get_entries(self, source: str) -> list[EntryEntity]:
+        entries = self.get_snapshot(source)
+        if entries is not None:
+            return entries
+        entries = self.repository.get_entries(source)
+        if not entries:
+            return []
+        with self.lock:
+            self.snapshots.pop(source, None)
+            self.snapshots[source] = (time.monotonic(), entries)
+            while len(self.snapshots) > self.max_sources:
+                del self.snapshots[next(iter(self.snapshots))]
+        return list(entries)
@@ -0,0 +1,65 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Callable
+
+from src.domain.entities import EntryEntity
+from src.domain.repositories import EntryRepositoryInterface
+
+RepositoryFactory = Callable[[], EntryRepositoryInterface]
+
+
+@dataclass
+class SourceRegistry(EntryRepositoryInterface):
+    """Entry repository dispatching each source to the adapter of its url.
+
+    The adapters are registered by url prefix, the longest matching prefix
+    winning, and the sources without match go to the default adapter. Each
+    adapter is built on first use then shared by all its sources.
+
+    Attributes:
+        default_factory (Callable): builds the adapter of the unknown sources.
+    """
+
+    default_factory: RepositoryFactory
+    factories: dict[str, RepositoryFactory] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    repositories: dict[str | None, EntryRepositoryInterface] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def register(self, prefix: str, factory: RepositoryFactory) -> None:
+        """Register the adapter of the sources starting with the prefix.
+
+        Args:
+            prefix (str): url prefix of the sources (ex: https://lobste.rs/).
+            factory (Callable): builds the adapter.
+        """
+        self.factories[prefix] = factory
+
+    def get_prefix(self, source: str) -> str | None:
+        """Get the longest registered prefix of the source, None if there is none."""
+        prefixes = [prefix for prefix in self.factories if source.startswith(prefix)]
+        return max(prefixes, key=len, default=None)
+
+    def get_repository(self, source: str) -> EntryRepositoryInterface:
+        """Get the adapter of the source.
+
+        Args:
+            source (str): url of the source.
+
+        Returns:
+            repository (EntryRepositoryInterface): the adapter.
+        """
+        prefix = self.get_prefix(source)
+        with self.lock:
+            if prefix not in self.repositories:
+                factory = self.default_factory
+                if prefix is not None:
+                    factory = self.factories[prefix]
+                self.repositories[prefix] = factory()
+            return self.repositories[prefix]
+
+    def get_entries(self, source: str) -> list[EntryEntity]:
+        return self.get_repository(source).get_entries(source)
@@ -0,0 +1,159 @@
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
+from fastapi import FastAPI, HTTPException, Query
+
+from src.adapters import (
+    AsyncEntryRepositoryAdapter,
+    AsyncLogRepositoryAdapter,
+    HACKER_NEWS_API_URL,
+    CachedEntryAdapter,
+    QueueFileLoggerAdapter,
+    HostRateLimiter,
+    SingleFlightEntryAdapter,
+    create_session,
+)
+from src.controllers.cli import CliController
+from src.domain.dtos.get_entries import (
+    GetEntriesDto,
+)
+from src.domain.entities import (
+    FilterEntity,
+    FilterExpression,
+    OrderEntity,
+    OrderExpression,
+    combine_filters,
+    combine_orders,
+)
+from src.domain.repositories import EntryRepositoryInterface, LogRepositoryInterface
+from src.usecases import AsyncGetEntries
+
+DEFAULT_SOURCE = "https://news.ycombinator.com/"
+
+
+def parse_filter(
+    filters: list[str] | None, match_any: bool = False
+) -> FilterExpression | None:
+    """Build the filter from its query strings (ex: number_of_words:lt:5).
+
+    Raises:
+        HTTPException: 422 if a filter is not valid.
+    """
+    filter_entities = []
+    for filter in filters or []:
+        try:
+            filter_entities.append(FilterEntity.from_string(filter))
+        except ValueError:
+            raise HTTPException(status_code=422, detail=f"Invalid filter: {filter}")
+    return combine_filters(filter_entities, match_any=match_any)
+
+
+def parse_order(orders: list[str] | None) -> OrderExpression | None:
+    """Build the order from its query strings (ex: comments:desc).
+
+    Raises:
+        HTTPException: 422 if an order is not valid.
+    """
+    order_entities = []
+    for order in orders or []:
+        try:
+            order_entities.append(OrderEntity.from_string(order))
+        except ValueError:
+            raise HTTPException(status_code=422, detail=f"Invalid order: {order}")
+    return combine_orders(order_entities)
+
+
+def create_app(
+    entry_repository: EntryRepositoryInterface | None = None,
+    logger_repository: LogRepositoryInterface | None = None,
+    snapshot_ttl: float = 60,
+    allowed_sources: list[str] | None = None,
+    max_snapshots: int = 128,
+) -> FastAPI:
+    """Create the FastAPI application.
+
+    The logger, the crawler (and its rate limited HTTP session) and the
+    usecase are built once and shared by all the requests. The entries of a source are served
+    from a snapshot during snapshot_ttl seconds, whatever the filter/order,
+    and the concurrent requests refreshing a snapshot share a single crawl.
+    By default the sources are dispatched by the registry of the CLI.
+
+    The server only fetches the sources starting with an allowed url prefix
+    (the HackerNews site and API by default), the other ones are refused
+    with a 403, so a client can't make it request any url.
+
+    Run it with: uvicorn --factory src.controllers.api:create_app
+
+    Args:
+        entry_repository (Optional(EntryRepositoryInterface)): the crawler.
+        logger_repository (Optional(LogRepositoryInterface)): the logger.
+        snapshot_ttl (float): seconds during which a snapshot is served.
+        allowed_sources (Optional(list[str])): url prefixes of the sources
+            that can be requested.
+        max_snapshots (int): maximum number of sources whose snapshot is kept.
+
+    Returns:
+        app (FastAPI): the application.
+    """
+    if logger_repository is None:
+        logger_repository = QueueFileLoggerAdapter(log_level=logging.INFO)
+    if entry_repository is None:
+        entry_repository = CliController.create_registry(
+            logger_repository,
+            cache_ttl=None,
+            session=create_session(rate_limiter=HostRateLimiter()),
+        )
+    if allowed_sources is None:
+        allowed_sources = [DEFAULT_SOURCE, f"{HACKER_NEWS_API_URL}/"]
+    usecase = AsyncGetEntries(
+        AsyncEntryRepositoryAdapter(
+            CachedEntryAdapter(
+                repository=SingleFlightEntryAdapter(repository=entry_repository),
+                ttl=snapshot_ttl,
+                max_sources=max_snapshots,
+            )
+        ),
+        AsyncLogRepositoryAdapter(logger_repository),
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        await usecase.wait_pending_logs()
+        logger_repository.close()
+
+    app = FastAPI(title="StackBuilders Crawler", lifespan=lifespan)
+
+    @app.get("/entries")
+    async def get_entries(
+        source: str = DEFAULT_SOURCE,
+        filter: list[str] | None = Query(None),
+        order: list[str] | None = Query(None),
+        match_any: bool = False,
+        limit: int | None = Query(None, ge=0),
+    ) -> list[dict]:
+        """Get the entries of the source, filtered and ordered.
+
+        Args
+            source (str): url of the source to use.
+            filter (Optional(list[str])): field:operator:value (ex: number_of_words:lt:5),
+                can be repeated.
+            order (Optional(list[str])): field:direction (ex: comments:desc), can be
+                repeated for the ties.
+            match_any (bool): OR the filters if True, else AND them.
+            limit (Optional(int)): maximum number of entries to return.
+
+        """
+        if not any(source.startswith(prefix) for prefix in allowed_sources):
+            raise HTTPException(status_code=403, detail=f"Source not allowed: {source}")
+        dto = GetEntriesDto(
+            source=source,
+            filter=parse_filter(filter, match_any),
+            order=parse_order(order),
+            limit=limit,
+        )
+        entries = await usecase.execute(dto=dto)
+        return [asdict(entry) for entry in entries]
+
+    return app
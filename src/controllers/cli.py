@@ -2,27 +2,43 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
+import requests
 import typer
 from typing_extensions import Annotated
 
 from src.adapters import (
+    HACKER_NEWS_API_URL,
+    HackerNewsApiEntryAdapter,
+    HostRateLimiter,
     HackerNewsCrawlerEntryAdapter,
-    FileLoggerAdapter,
+    QueueFileLoggerAdapter,
     DBLoggerAdapter,
+    DBSnapshotAdapter,
+    EntryCache,
+    GenericCrawlerEntryAdapter,
+    HtmlParserEnum,
+    HttpCache,
+    SelectorProfile,
+    SourceRegistry,
+    create_session,
+    load_profiles,
 )
 from src.domain.dtos.get_entries import (
     GetEntriesDto,
 )
 from src.domain.entities import (
     FilterEntity,
-    FilterFieldEnum,
-    FilterOperatorEnum,
-    OrderDirectionEnum,
+    FilterExpression,
     OrderEntity,
-    OrderFieldEnum,
+    OrderExpression,
+    combine_filters,
+    combine_orders,
 )
 from src.domain.entities.entry import EntryEntity
-from src.usecases import GetEntries
+from src.domain.repositories import LogRepositoryInterface
+from src.usecases import GetEntries, GetItemHistory, PollingSchedule, WatchEntries
+
+DEFAULT_SOURCE = "https://news.ycombinator.com/"
 
 
 @dataclass
@@ -34,62 +50,221 @@ class CliController:
         output_string = f"{entry.index}. {entry.title} | Total Points : {entry.total_points} | Total Comments : {entry.total_comments}"
         typer.echo(output_string)
 
+    def history(self, item_id: int):
+        """Call the GetItemHistory usecase.
+
+        Print in the console the item at each saved crawl
+        Args
+            item_id (int): id of the item on HackerNews.
+
+        """
+        observations = GetItemHistory(DBSnapshotAdapter()).execute(item_id)
+        typer.echo(f"---HISTORY OF ITEM : {item_id}---")
+        for observation in observations:
+            typer.echo(f"{observation.crawled_at.isoformat(sep=' ')} | ", nl=False)
+            self.print_entry_output(observation.entry)
+
+    @staticmethod
+    def create_registry(
+        logger_repo: LogRepositoryInterface,
+        max_entries: int | None = None,
+        max_pages: int | None = None,
+        cache_ttl: float | None = 0,
+        parser: HtmlParserEnum = HtmlParserEnum.html_parser,
+        profiles: dict[str, SelectorProfile] | None = None,
+        session: requests.Session | None = None,
+    ) -> SourceRegistry:
+        """Build the registry of the entry adapters of the sources.
+
+        The HackerNews API urls go to the API adapter, the urls of the
+        profiles to a generic crawler using their selectors, and the other
+        urls to the HackerNews crawler. The adapters share the session, and
+        so its connections and its rate limiter.
+
+        Args
+            logger_repo (LogRepositoryInterface): logger of the adapters.
+            max_entries (Optional(int)): Maximum number of entries to crawl.
+            max_pages (Optional(int)): Maximum number of pages to crawl.
+            cache_ttl (Optional(float)): Seconds during which a cached page is reused
+                without revalidation, None to disable the HTTP and entry caches.
+            parser (HtmlParserEnum): Backend used to parse the HackerNews pages.
+            profiles (Optional(dict[str, SelectorProfile])): selector profile
+                of each url prefix.
+            session (Optional(requests.Session)): HTTP session of the adapters,
+                a new one per adapter by default.
+
+        Returns:
+            registry (SourceRegistry): the registry.
+        """
+        cache = None
+        entry_cache = None
+        if cache_ttl is not None:
+            cache = HttpCache(ttl=cache_ttl)
+            entry_cache = EntryCache(db_path="data/app.db")
+        crawler_options = {
+            "logger": logger_repo,
+            "max_entries": max_entries,
+            "max_pages": max_pages,
+            "cache": cache,
+            "entry_cache": entry_cache,
+        }
+        session_options = {} if session is None else {"session": session}
+        crawler_options.update(session_options)
+        registry = SourceRegistry(
+            default_factory=lambda: HackerNewsCrawlerEntryAdapter(
+                parser=parser.create_parser(), **crawler_options
+            )
+        )
+        api_options = dict(session_options)
+        if max_entries is not None:
+            api_options["max_entries"] = max_entries
+        registry.register(
+            HACKER_NEWS_API_URL,
+            lambda: HackerNewsApiEntryAdapter(logger=logger_repo, **api_options),
+        )
+        for prefix, profile in (profiles or {}).items():
+            registry.register(
+                prefix,
+                lambda profile=profile: GenericCrawlerEntryAdapter(
+                    profile=profile, **crawler_options
+                ),
+            )
+        return registry
+
     def run(
         self,
-        source: str,
-        filter: FilterEntity | None,
-        order: OrderEntity | None,
+        source: str | list[str],
+        filter: FilterExpression | None,
+        order: OrderExpression | None,
         log_in_db: bool,
         verbose: bool,
+        max_entries: int | None = None,
+        max_pages: int | None = None,
+        cache_ttl: float | None = 0,
+        parser: HtmlParserEnum = HtmlParserEnum.html_parser,
+        limit: int | None = None,
+        snapshot: bool = False,
+        since_last: bool = False,
+        profiles: dict[str, SelectorProfile] | None = None,
+        deadline: float | None = None,
+        rate: float = 4.0,
+        respect_robots: bool = True,
+        watch: float | None = None,
+        max_runs: int | None = None,
     ):
         """Call the GetEntries usecase.
 
         Print in the console the output
         Args
-            source (str): url of the source to use.
-            filter (Optional(FilterEntity)): Representation of a filter to use if there is one.
-            order (Optional(OrderEntity)): Representation of an order query to use if there is one.
+            source (str | list[str]): url of the source to use, or urls of several
+                sources fetched concurrently.
+            filter (Optional(FilterExpression)): Representation of the filter(s) to use if there is one.
+            order (Optional(OrderExpression)): Representation of the order key(s) to use if there is one.
             log_in_db (bool): DbLogger if True else FileLogger
             verbose (bool): LogLevel.DEBUG if verbose is True, else LogLevel.INFO
+            max_entries (Optional(int)): Maximum number of entries to crawl.
+            max_pages (Optional(int)): Maximum number of pages to crawl.
+            cache_ttl (Optional(float)): Seconds during which a cached page is reused
+                without revalidation, None to disable the HTTP and entry caches.
+            parser (HtmlParserEnum): Backend used to parse the pages.
+            limit (Optional(int)): Maximum number of entries to output.
+            snapshot (bool): Save the crawled entries in the history if True.
+            since_last (bool): Output only the entries that changed since the
+                last saved crawl of the source if True (implies snapshot).
+            profiles (Optional(dict[str, SelectorProfile])): selector profile
+                of each url prefix, crawled by the generic crawler.
+            deadline (Optional(float)): Seconds to wait for several sources, the
+                late ones being left out.
+            rate (float): Maximum number of requests per second to each host.
+            respect_robots (bool): Follow the robots.txt (and Crawl-delay) of the
+                hosts if True.
+            watch (Optional(float)): Poll the sources again, every watch seconds
+                at first, the interval adapting to the change rate of the entries.
+            max_runs (Optional(int)): Number of polls in watch mode, unlimited
+                by default.
 
         """
         log_level = logging.INFO
         if verbose:
             log_level = logging.DEBUG
-        logger_repo = FileLoggerAdapter(log_level=log_level)
+        logger_repo = QueueFileLoggerAdapter(log_level=log_level)
         if log_in_db:
             logger_repo = DBLoggerAdapter(log_level=log_level)
 
-        # TODO: if not source == "HackerNews" then use Default Crawler
-        crawler_repo = HackerNewsCrawlerEntryAdapter(logger=logger_repo)
+        registry = self.create_registry(
+            logger_repo,
+            max_entries=max_entries,
+            max_pages=max_pages,
+            cache_ttl=cache_ttl,
+            parser=parser,
+            profiles=profiles,
+            session=create_session(
+                rate_limiter=HostRateLimiter(
+                    rate=rate,
+                    burst=2 * rate,
+                    respect_robots=respect_robots,
+                    # A request can't wait for its turn beyond the deadline
+                    max_wait=deadline,
+                )
+            ),
+        )
+        crawler_repo = registry
+        if isinstance(source, str):
+            crawler_repo = registry.get_repository(source)
+
+        dto = GetEntriesDto(
+            source=source,
+            filter=filter,
+            order=order,
+            limit=limit,
+            since_last=since_last,
+            deadline=deadline,
+        )
+        snapshot_repo = DBSnapshotAdapter() if snapshot or since_last else None
+        usecase = GetEntries(crawler_repo, logger_repo, snapshot_repo)
+
+        sources = source if isinstance(source, str) else ", ".join(source)
 
-        dto = GetEntriesDto(source=source, filter=filter, order=order)
-        result_entries = GetEntries(crawler_repo, logger_repo).execute(dto=dto)
+        def print_entries(result_entries: list[EntryEntity], *_):
+            typer.echo(f"---RESULT FROM SOURCE : {sources}---")
+            for entry in result_entries:
+                self.print_entry_output(entry)
 
-        typer.echo(f"---RESULT FROM SOURCE : {source}---")
-        for entry in result_entries:
-            self.print_entry_output(entry)
+        if watch is None:
+            print_entries(usecase.execute(dto=dto))
+        else:
+            # The crawlers, their session and the logger are reused by every poll
+            watcher = WatchEntries(usecase, PollingSchedule(interval=watch))
+            try:
+                watcher.execute(dto, on_entries=print_entries, max_runs=max_runs)
+            except KeyboardInterrupt:
+                pass
+        logger_repo.close()
 
 
 def main(
     source: Annotated[
-        str, typer.Argument(help="Source to get entries", show_default=True)
-    ] = "https://news.ycombinator.com/",
+        list[str],
+        typer.Argument(
+            help="Source(s) to get entries, several ones are fetched concurrently",
+            show_default=True,
+        ),
+    ] = [DEFAULT_SOURCE],
     filter: Annotated[
-        Optional[tuple[FilterFieldEnum, FilterOperatorEnum, int]],
+        Optional[list[str]],
         typer.Option(
             "--filter",
             "-f",
-            help="Options for the filter (ex titles with more than 5 words: number_of_words lt 5)",
+            help="Filter, can be repeated (ex titles with less than 5 words: number_of_words:lt:5)",
             show_default=False,
         ),
     ] = None,
     order: Annotated[
-        Optional[tuple[OrderFieldEnum, OrderDirectionEnum]],
+        Optional[list[str]],
         typer.Option(
             "--order",
             "-o",
-            help="Options for the order (ex order by points desc: number_of_points desc)",
+            help="Order, can be repeated for the ties (ex order by points desc: points:desc)",
             show_default=False,
         ),
     ] = None,
@@ -99,35 +274,212 @@ def main(
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="If True, set Log Level to DEBUG"
     ),
+    max_entries: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-entries",
+            "-n",
+            help="Crawl the next pages until N entries are collected",
+            show_default=False,
+        ),
+    ] = None,
+    max_pages: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-pages",
+            help="Maximum number of pages to crawl",
+            show_default=False,
+        ),
+    ] = None,
+    cache_ttl: Annotated[
+        float,
+        typer.Option(
+            "--cache-ttl",
+            help="Seconds during which a cached page is reused without revalidation",
+        ),
+    ] = 0,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache", help="If True, do not use the HTTP and entry caches"
+        ),
+    ] = False,
+    parser: Annotated[
+        HtmlParserEnum,
+        typer.Option("--parser", "-p", help="Backend used to parse the pages"),
+    ] = HtmlParserEnum.html_parser,
+    match_any: Annotated[
+        bool,
+        typer.Option(
+            "--match-any",
+            help="If True, keep the entries passing any of the filters instead of all",
+        ),
+    ] = False,
+    limit: Annotated[
+        Optional[int],
+        typer.Option(
+            "--limit",
+            "-l",
+            help="Output only the first K entries (the top K with --order)",
+            show_default=False,
+        ),
+    ] = None,
+    snapshot: Annotated[
+        bool,
+        typer.Option(
+            "--snapshot",
+            help="If True, save the crawled entries in the history (SQLite db)",
+        ),
+    ] = False,
+    since_last: Annotated[
+        bool,
+        typer.Option(
+            "--since-last",
+            help="If True, output only the new, moved and updated entries since the last saved crawl",
+        ),
+    ] = False,
+    profiles: Annotated[
+        Optional[str],
+        typer.Option(
+            "--profiles",
+            help="JSON file of the CSS selectors of other sources, by url prefix",
+            show_default=False,
+        ),
+    ] = None,
+    deadline: Annotated[
+        Optional[float],
+        typer.Option(
+            "--deadline",
+            help="Seconds to wait for several sources, the late ones are left out",
+            show_default=False,
+        ),
+    ] = None,
+    rate: Annotated[
+        float,
+        typer.Option(
+            "--rate",
+            help="Maximum number of requests per second to each host",
+        ),
+    ] = 4.0,
+    ignore_robots: Annotated[
+        bool,
+        typer.Option(
+            "--ignore-robots",
+            help="If True, do not follow the robots.txt (and Crawl-delay) of the hosts",
+        ),
+    ] = False,
+    watch: Annotated[
+        Optional[float],
+        typer.Option(
+            "--watch",
+            help="Poll the sources every INTERVAL seconds, adapted to how often the entries change",
+            metavar="INTERVAL",
+            show_default=False,
+        ),
+    ] = None,
+    max_runs: Annotated[
+        Optional[int],
+        typer.Option(
+            "--max-runs",
+            help="Stop the --watch mode after N polls",
+            show_default=False,
+        ),
+    ] = None,
+    history: Annotated[
+        Optional[int],
+        typer.Option(
+            "--history",
+            help="Print the saved history of a HackerNews item id, without crawling",
+            show_default=False,
+        ),
+    ] = None,
 ):
     """CLI entrypoint.
 
     Print in the console the output
     Args
-        source (str): url of the source to use.
-        filter (Optional(FilterEntity)): Representation of a filter to use if there is one.
-        order (Optional(OrderEntity)): Representation of an order query to use if there is one.
+        source (list[str]): url(s) of the source(s) to use.
+        filter (Optional(list[str])): Filters to use, as field:operator:value.
+        order (Optional(list[str])): Order keys to use, as field:direction.
         log_in_db (bool): DbLogger if True else FileLogger
         verbose (bool): LogLevel.DEBUG if verbose is True, else LogLevel.INFO
+        max_entries (Optional(int)): Maximum number of entries to crawl.
+        max_pages (Optional(int)): Maximum number of pages to crawl.
+        cache_ttl (float): Seconds during which a cached page is reused without revalidation.
+        no_cache (bool): Disable the HTTP and entry caches if True.
+        parser (HtmlParserEnum): Backend used to parse the pages.
+        match_any (bool): OR the filters if True, else AND them.
+        limit (Optional(int)): Maximum number of entries to output.
+        snapshot (bool): Save the crawled entries in the history if True.
+        since_last (bool): Output only the entries changed since the last saved crawl if True.
+        profiles (Optional(str)): JSON file of the selector profiles of other sources.
+        deadline (Optional(float)): Seconds to wait for several sources.
+        rate (float): Maximum number of requests per second to each host.
+        ignore_robots (bool): Do not follow the robots.txt of the hosts if True.
+        watch (Optional(float)): Initial interval of the polls, in seconds.
+        max_runs (Optional(int)): Number of polls in watch mode.
+        history (Optional(int)): Item id of which to print the history, without crawling.
 
     """
 
-    filter_cls = None
-    if filter is not None:
-        filter_field, operator, value = filter
-        filter_cls = FilterEntity(
-            field=filter_field,
-            operator=operator,
-            value=value,
+    if history is not None:
+        CliController().history(history)
+        return
+
+    filters = []
+    for filter_string in filter or []:
+        try:
+            filters.append(FilterEntity.from_string(filter_string))
+        except ValueError:
+            raise typer.BadParameter(
+                f"invalid filter {filter_string!r}", param_hint="--filter"
+            )
+    filter_cls = combine_filters(filters, match_any=match_any)
+    orders = []
+    for order_string in order or []:
+        try:
+            orders.append(OrderEntity.from_string(order_string))
+        except ValueError:
+            raise typer.BadParameter(
+                f"invalid order {order_string!r}", param_hint="--order"
+            )
+    order_cls = combine_orders(orders)
+    try:
+        parser.create_parser()
+    except ImportError as exception:
+        raise typer.BadParameter(str(exception), param_hint="--parser")
+    if rate <= 0:
+        raise typer.BadParameter("the rate must be positive", param_hint="--rate")
+    if limit is not None and limit < 0:
+        raise typer.BadParameter("the limit can't be negative", param_hint="--limit")
+    if max_entries is not None and max_entries < 1:
+        raise typer.BadParameter(
+            "the number of entries must be at least 1", param_hint="--max-entries"
+        )
+    if max_pages is not None and max_pages < 1:
+        raise typer.BadParameter(
+            "the number of pages must be at least 1", param_hint="--max-pages"
         )
-    order_cls = None
-    if order is not None:
-        order_field, direction = order
-        order_cls = OrderEntity(field=order_field, direction=direction)
+    if watch is not None and watch <= 0:
+        raise typer.BadParameter("the interval must be positive", param_hint="--watch")
+    sources = [source] if isinstance(source, str) else list(source)
     CliController().run(
-        source=source,
+        source=sources[0] if len(sources) == 1 else sources,
         filter=filter_cls,
         order=order_cls,
         log_in_db=log_in_db,
         verbose=verbose,
+        max_entries=max_entries,
+        max_pages=max_pages,
+        cache_ttl=None if no_cache else cache_ttl,
+        parser=parser,
+        limit=limit,
+        snapshot=snapshot,
+        since_last=since_last,
+        profiles=None if profiles is None else load_profiles(profiles),
+        deadline=deadline,
+        rate=rate,
+        respect_robots=not ignore_robots,
+        watch=watch,
+        max_runs=max_runs,
     )
@@ -1,10 +1,27 @@
 from dataclasses import dataclass
 
-from src.domain.entities import FilterEntity, OrderEntity
+from src.domain.entities import FilterExpression, OrderExpression
 
 
 @dataclass
 class GetEntriesDto:
-    source: str
-    filter: FilterEntity | None
-    order: OrderEntity | None
+    """Parameters of the GetEntries usecase.
+
+    Attributes:
+        source: url of the source, or urls of several sources fetched
+            concurrently, whose entries are merged.
+        filter: the filter(s) to apply, if any.
+        order: the order key(s) to apply, if any.
+        limit: maximum number of entries to return.
+        since_last: only keep the entries that changed since the last crawl.
+        deadline: seconds to wait for several sources, the late ones being
+            left out.
+
+    """
+
+    source: str | list[str]
+    filter: FilterExpression | None
+    order: OrderExpression | None
+    limit: int | None = None
+    since_last: bool = False
+    deadline: float | None = None
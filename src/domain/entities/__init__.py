@@ -1,15 +1,48 @@
-from .entry import EntryEntity
-from .filter import FilterEntity, FilterFieldEnum, FilterOperatorEnum
+from .delta import EntryChangeEnum, EntryDeltaEntity, get_entries_delta
+from .entry import EntryEntity, count_words
+from .entry_batch import EntryBatch
+from .filter import (
+    FilterAndEntity,
+    FilterEntity,
+    FilterExpression,
+    FilterFieldEnum,
+    FilterNotEntity,
+    FilterOperatorEnum,
+    FilterOrEntity,
+    combine_filters,
+)
 from .log import LogEntity
-from .order import OrderDirectionEnum, OrderEntity, OrderFieldEnum
+from .order import (
+    OrderDirectionEnum,
+    OrderEntity,
+    OrderExpression,
+    OrderFieldEnum,
+    combine_orders,
+    get_orders,
+)
+from .snapshot import EntryObservationEntity
 
 __all__ = [
+    EntryChangeEnum,
+    EntryDeltaEntity,
+    get_entries_delta,
     EntryEntity,
+    count_words,
+    EntryBatch,
+    FilterAndEntity,
     FilterEntity,
+    FilterExpression,
     FilterFieldEnum,
+    FilterNotEntity,
     FilterOperatorEnum,
+    FilterOrEntity,
+    combine_filters,
     LogEntity,
     OrderDirectionEnum,
     OrderEntity,
+    OrderExpression,
     OrderFieldEnum,
+    combine_orders,
+    get_orders,
+    EntryObservationEntity,
 ]
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from src.domain.entities.entry import EntryEntity
+
+
+class EntryChangeEnum(Enum):
+    """Enum of the changes of an entry since the previous crawl.
+
+    Attributes:
+        new: The entry was not in the previous crawl.
+        moved: Only the rank (index) of the entry changed.
+        updated: The points, comments or title of the entry changed.
+
+    """
+
+    new = "new"
+    moved = "moved"
+    updated = "updated"
+
+
+@dataclass
+class EntryDeltaEntity:
+    """Represents an entry that changed since the previous crawl.
+
+    Attributes:
+        entry: The entry of the new crawl.
+        change: The kind of change.
+        previous: The entry of the previous crawl, None if it is new.
+
+    """
+
+    entry: EntryEntity
+    change: EntryChangeEnum
+    previous: EntryEntity | None = None
+
+
+def get_entries_delta(
+    previous_entries: list[EntryEntity], entries: list[EntryEntity]
+) -> list[EntryDeltaEntity]:
+    """Compare the entries of a crawl to the ones of the previous crawl.
+
+    The entries are matched by item id, or by title when an entry has no
+    item id. The equal entries are unchanged and left out.
+
+    Args:
+        previous_entries (list[EntryEntity]): entries of the previous crawl.
+        entries (list[EntryEntity]): entries of the new crawl.
+
+    Returns:
+        delta (list[EntryDeltaEntity]): the new, moved and updated entries.
+    """
+    previous_by_item_id = {
+        entry.item_id: entry for entry in previous_entries if entry.item_id is not None
+    }
+    previous_by_title = {entry.title: entry for entry in previous_entries}
+    delta = []
+    for entry in entries:
+        if entry.item_id is not None and entry.item_id in previous_by_item_id:
+            previous = previous_by_item_id[entry.item_id]
+        else:
+            previous = previous_by_title.get(entry.title)
+        if previous is None:
+            delta.append(EntryDeltaEntity(entry=entry, change=EntryChangeEnum.new))
+        elif entry == previous:
+            continue
+        elif (entry.title, entry.total_points, entry.total_comments) != (
+            previous.title,
+            previous.total_points,
+            previous.total_comments,
+        ):
+            delta.append(
+                EntryDeltaEntity(
+                    entry=entry, change=EntryChangeEnum.updated, previous=previous
+                )
+            )
+        elif entry.index != previous.index:
+            delta.append(
+                EntryDeltaEntity(
+                    entry=entry, change=EntryChangeEnum.moved, previous=previous
+                )
+            )
+    return delta
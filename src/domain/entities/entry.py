@@ -1,16 +1,43 @@
-from dataclasses import dataclass
+import re
+import sys
+from dataclasses import dataclass, field
 
+# A word has at least one letter or digit, the lone symbols ("-", "|") are not words
+WORD_REGEX = re.compile(r"[^\W_]")
 
-@dataclass
+
+def count_words(title: str) -> int:
+    """Count the spaced words of a title, excluding the symbols.
+
+    For instance, "This is - a self-explained example" has 5 words.
+
+    Args:
+        title (str): the title.
+
+    Returns:
+        word_count (int): the number of words.
+    """
+    return sum(1 for word in title.split() if WORD_REGEX.search(word))
+
+
+@dataclass(slots=True)
 class EntryEntity:
     """Entity of an Entry.
 
+    The entries are slotted (no per-instance __dict__) and their source is
+    interned, so the entries of a crawl share a single source string.
+
     Attributes:
         index (int): Index of the entry according to the source.
         title (str): The title of the entry.
         total_points (int): The number of points of the entry (~upvotes).
         total_comments (int): The number of comments of the entry.
         source (str): The url of the source of the entry.
+        item_id (Optional(int)): The id of the item on HackerNews, stable when
+            the ranking changes.
+        word_count (int): The number of words of the title (derived).
+        points_per_comment (float): total_points / total_comments, the comments
+            being counted as 1 when there is none (derived).
 
     """
 
@@ -19,3 +46,11 @@ class EntryEntity:
     total_points: int
     total_comments: int
     source: str
+    item_id: int | None = None
+    word_count: int = field(init=False, repr=False, compare=False)
+    points_per_comment: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.source = sys.intern(self.source)
+        self.word_count = count_words(self.title)
+        self.points_per_comment = self.total_points / max(self.total_comments, 1)
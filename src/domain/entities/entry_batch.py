@@ -0,0 +1,106 @@
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from .entry import EntryEntity
+from .filter import FilterFieldEnum
+from .order import OrderFieldEnum
+
+
+@dataclass
+class EntryBatch:
+    """Columnar container of entries.
+
+    Each numeric field is stored in a typed array (8 bytes per entry), the
+    titles in a shared list and the sources interned, instead of one object
+    per entry. The entries are referenced by their row in the batch.
+
+    Attributes:
+        indexes (array): index of each entry according to its source.
+        titles (list[str]): title of each entry.
+        total_points (array): number of points of each entry.
+        total_comments (array): number of comments of each entry.
+        word_counts (array): number of words of the title of each entry.
+        sources (list[str]): interned url of the source of each entry.
+        item_ids (list[Optional(int)]): HackerNews id of each entry.
+
+    """
+
+    indexes: array = field(default_factory=lambda: array("q"))
+    titles: list[str] = field(default_factory=list)
+    total_points: array = field(default_factory=lambda: array("q"))
+    total_comments: array = field(default_factory=lambda: array("q"))
+    word_counts: array = field(default_factory=lambda: array("q"))
+    sources: list[str] = field(default_factory=list)
+    item_ids: list[int | None] = field(default_factory=list)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[EntryEntity]) -> "EntryBatch":
+        """Build a batch from entries."""
+        batch = cls()
+        for entry in entries:
+            batch.append(entry)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def append(self, entry: EntryEntity) -> None:
+        """Add an entry at the end of the batch."""
+        self.indexes.append(entry.index)
+        self.titles.append(entry.title)
+        self.total_points.append(entry.total_points)
+        self.total_comments.append(entry.total_comments)
+        self.word_counts.append(entry.word_count)
+        self.sources.append(sys.intern(entry.source))
+        self.item_ids.append(entry.item_id)
+
+    def get_entry(self, row: int) -> EntryEntity:
+        """Build the entry of a row of the batch."""
+        return EntryEntity(
+            index=self.indexes[row],
+            title=self.titles[row],
+            total_points=self.total_points[row],
+            total_comments=self.total_comments[row],
+            source=self.sources[row],
+            item_id=self.item_ids[row],
+        )
+
+    def to_entries(self) -> list[EntryEntity]:
+        """Build the entries of the batch, in order."""
+        return [self.get_entry(row) for row in range(len(self))]
+
+    def take(self, rows: Iterable[int]) -> "EntryBatch":
+        """Build the batch of the given rows, in the given order."""
+        rows = list(rows)
+        return EntryBatch(
+            indexes=array("q", [self.indexes[row] for row in rows]),
+            titles=[self.titles[row] for row in rows],
+            total_points=array("q", [self.total_points[row] for row in rows]),
+            total_comments=array("q", [self.total_comments[row] for row in rows]),
+            word_counts=array("q", [self.word_counts[row] for row in rows]),
+            sources=[self.sources[row] for row in rows],
+            item_ids=[self.item_ids[row] for row in rows],
+        )
+
+    def get_points_per_comment(self, row: int) -> float:
+        """Get the points per comment of a row, as EntryEntity.points_per_comment."""
+        return self.total_points[row] / max(self.total_comments[row], 1)
+
+    def get_filter_getters(self) -> dict[FilterFieldEnum, Callable[[int], int]]:
+        """Get the function reading the value of each filter field of a row."""
+        return {
+            FilterFieldEnum.index: self.indexes.__getitem__,
+            FilterFieldEnum.number_of_words: self.word_counts.__getitem__,
+            FilterFieldEnum.number_of_points: self.total_points.__getitem__,
+            FilterFieldEnum.number_of_comments: self.total_comments.__getitem__,
+        }
+
+    def get_order_getters(self) -> dict[OrderFieldEnum, Callable[[int], float]]:
+        """Get the function reading the value of each order field of a row."""
+        return {
+            OrderFieldEnum.points: self.total_points.__getitem__,
+            OrderFieldEnum.comments: self.total_comments.__getitem__,
+            OrderFieldEnum.points_per_comment: self.get_points_per_comment,
+        }
@@ -1,6 +1,11 @@
+import functools
 import operator
+import re
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Callable, Union
+
+Predicate = Callable[[Any], bool]
 
 
 class FilterFieldEnum(Enum):
@@ -21,6 +26,18 @@ class FilterFieldEnum(Enum):
     number_of_points = "number_of_points"
     number_of_comments = "number_of_comments"
 
+    def get_entry_getter(self) -> Callable[[Any], int]:
+        """Returns the function reading the field value of an entry."""
+        match self.value:
+            case "index":
+                return operator.attrgetter("index")
+            case "number_of_words":
+                return operator.attrgetter("word_count")
+            case "number_of_points":
+                return operator.attrgetter("total_points")
+            case "number_of_comments":
+                return operator.attrgetter("total_comments")
+
 
 class FilterOperatorEnum(Enum):
     """Enum of the operator of the filter.
@@ -69,3 +86,150 @@ class FilterEntity:
     field: FilterFieldEnum
     operator: FilterOperatorEnum
     value: int
+
+    def __str__(self) -> str:
+        return f"{self.field.value} {self.operator.value} {self.value}"
+
+    @classmethod
+    def from_string(cls, text: str) -> "FilterEntity":
+        """Build a filter from "field:operator:value" (or "field operator value").
+
+        Raises:
+            ValueError: if the text is not a valid filter.
+        """
+        filter_field, filter_operator, value = re.split(r"[:\s]+", text.strip())
+        return cls(
+            field=FilterFieldEnum(filter_field),
+            operator=FilterOperatorEnum(filter_operator),
+            value=int(value),
+        )
+
+    def compile(self, field_getters: dict | None = None) -> Predicate:
+        """Compile the filter into a predicate.
+
+        Args:
+            field_getters (Optional(dict)): function reading the value of each
+                field, the attributes of the entries by default.
+
+        Returns:
+            predicate (Callable): returns True if the entry passes the filter.
+        """
+        if field_getters is None:
+            get_value = self.field.get_entry_getter()
+        else:
+            get_value = field_getters[self.field]
+        operator_func = self.operator.convert_str_to_operator()
+        value = self.value
+        return lambda entry: operator_func(get_value(entry), value)
+
+    def mask(self, columns: dict) -> Any:
+        """Evaluate the filter on columns of values, as a boolean mask.
+
+        Args:
+            columns (dict): array of the values of each field (ex: numpy).
+
+        Returns:
+            mask (array): True for the entries passing the filter.
+        """
+        operator_func = self.operator.convert_str_to_operator()
+        return operator_func(columns[self.field], self.value)
+
+
+@dataclass
+class FilterAndEntity:
+    """Represents the conjunction of several filters.
+
+    Attributes:
+        filters: The filters that must all pass.
+
+    """
+
+    filters: list["FilterExpression"]
+
+    def __str__(self) -> str:
+        return "(" + " AND ".join(str(filter) for filter in self.filters) + ")"
+
+    def compile(self, field_getters: dict | None = None) -> Predicate:
+        predicates = [filter.compile(field_getters) for filter in self.filters]
+        return lambda entry: all(predicate(entry) for predicate in predicates)
+
+    def mask(self, columns: dict) -> Any:
+        masks = [filter.mask(columns) for filter in self.filters]
+        if not masks:
+            # Every entry passes an empty conjunction
+            index = columns[FilterFieldEnum.index]
+            return index == index
+        return functools.reduce(operator.and_, masks)
+
+
+@dataclass
+class FilterOrEntity:
+    """Represents the disjunction of several filters.
+
+    Attributes:
+        filters: The filters of which at least one must pass.
+
+    """
+
+    filters: list["FilterExpression"]
+
+    def __str__(self) -> str:
+        return "(" + " OR ".join(str(filter) for filter in self.filters) + ")"
+
+    def compile(self, field_getters: dict | None = None) -> Predicate:
+        predicates = [filter.compile(field_getters) for filter in self.filters]
+        return lambda entry: any(predicate(entry) for predicate in predicates)
+
+    def mask(self, columns: dict) -> Any:
+        masks = [filter.mask(columns) for filter in self.filters]
+        if not masks:
+            # No entry passes an empty disjunction
+            index = columns[FilterFieldEnum.index]
+            return index != index
+        return functools.reduce(operator.or_, masks)
+
+
+@dataclass
+class FilterNotEntity:
+    """Represents the negation of a filter.
+
+    Attributes:
+        filter: The filter that must not pass.
+
+    """
+
+    filter: "FilterExpression"
+
+    def __str__(self) -> str:
+        return f"NOT {self.filter}"
+
+    def compile(self, field_getters: dict | None = None) -> Predicate:
+        predicate = self.filter.compile(field_getters)
+        return lambda entry: not predicate(entry)
+
+    def mask(self, columns: dict) -> Any:
+        return ~self.filter.mask(columns)
+
+
+FilterExpression = Union[FilterEntity, FilterAndEntity, FilterOrEntity, FilterNotEntity]
+
+
+def combine_filters(
+    filters: list[FilterExpression], match_any: bool = False
+) -> FilterExpression | None:
+    """Combine several filters in one expression.
+
+    Args:
+        filters (list[FilterExpression]): the filters to combine.
+        match_any (bool): OR the filters if True, else AND them.
+
+    Returns:
+        expression (Optional(FilterExpression)): None if there is no filter.
+    """
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    if match_any:
+        return FilterOrEntity(filters=list(filters))
+    return FilterAndEntity(filters=list(filters))
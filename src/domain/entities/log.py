@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.domain.entities.filter import FilterEntity
-from src.domain.entities.order import OrderEntity
+from src.domain.entities.filter import FilterExpression
+from src.domain.entities.order import OrderExpression
 
 
 @dataclass
@@ -11,11 +11,11 @@ class LogEntity:
 
     Attributes:
         request_time (datetime): Timestamp of the log.
-        filter (Filter): The Filter entity used by the time of the request.
-        order (Order): The Order entity used by the time of the request.
+        filter (FilterExpression): The Filter(s) used by the time of the request.
+        order (OrderExpression): The Order(s) used by the time of the request.
 
     """
 
     request_time: datetime
-    filter: FilterEntity
-    order: OrderEntity
+    filter: FilterExpression
+    order: OrderExpression
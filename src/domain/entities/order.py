@@ -1,5 +1,8 @@
+import operator
+import re
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Callable, Union
 
 
 class OrderFieldEnum(Enum):
@@ -10,11 +13,23 @@ class OrderFieldEnum(Enum):
     Attributes:
         points: Order by the number of points.
         comments: Order by the number of comments.
+        points_per_comment: Order by the ratio of points per comment.
 
     """
 
     points = "points"
     comments = "comments"
+    points_per_comment = "points_per_comment"
+
+    def get_entry_getter(self) -> Callable[[Any], int]:
+        """Returns the function reading the field value of an entry."""
+        match self.value:
+            case "points":
+                return operator.attrgetter("total_points")
+            case "comments":
+                return operator.attrgetter("total_comments")
+            case "points_per_comment":
+                return operator.attrgetter("points_per_comment")
 
 
 class OrderDirectionEnum(Enum):
@@ -42,3 +57,47 @@ class OrderEntity:
 
     field: OrderFieldEnum
     direction: OrderDirectionEnum
+
+    def __str__(self) -> str:
+        return f"{self.field.value} {self.direction.value}"
+
+    @classmethod
+    def from_string(cls, text: str) -> "OrderEntity":
+        """Build an order from "field:direction" (or "field direction").
+
+        Raises:
+            ValueError: if the text is not a valid order.
+        """
+        order_field, direction = re.split(r"[:\s]+", text.strip())
+        return cls(
+            field=OrderFieldEnum(order_field),
+            direction=OrderDirectionEnum(direction),
+        )
+
+
+OrderExpression = Union[OrderEntity, list[OrderEntity]]
+
+
+def get_orders(order: OrderExpression | None) -> list[OrderEntity]:
+    """Returns the list of the order keys, from the most to the least significant."""
+    if order is None:
+        return []
+    if isinstance(order, OrderEntity):
+        return [order]
+    return list(order)
+
+
+def combine_orders(orders: list[OrderEntity]) -> OrderExpression | None:
+    """Combine several order keys in one expression.
+
+    Args:
+        orders (list[OrderEntity]): the keys, from the most to the least significant.
+
+    Returns:
+        expression (Optional(OrderExpression)): None if there is no order.
+    """
+    if not orders:
+        return None
+    if len(orders) == 1:
+        return orders[0]
+    return list(orders)
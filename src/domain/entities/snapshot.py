@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.entities.entry import EntryEntity
+
+
+@dataclass
+class EntryObservationEntity:
+    """Entity of an entry as observed by a crawl.
+
+    Attributes:
+        crawled_at (datetime): Timestamp of the crawl.
+        entry (EntryEntity): The entry at that time.
+
+    """
+
+    crawled_at: datetime
+    entry: EntryEntity
@@ -1,4 +1,13 @@
+from .async_entry_repository import AsyncEntryRepositoryInterface
+from .async_log_repository import AsyncLogRepositoryInterface
 from .entry_repository import EntryRepositoryInterface
 from .log_repository import LogRepositoryInterface
+from .snapshot_repository import SnapshotRepositoryInterface
 
-__all__ = [EntryRepositoryInterface, LogRepositoryInterface]
+__all__ = [
+    AsyncEntryRepositoryInterface,
+    AsyncLogRepositoryInterface,
+    EntryRepositoryInterface,
+    LogRepositoryInterface,
+    SnapshotRepositoryInterface,
+]
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import EntryEntity
+
+
+class AsyncEntryRepositoryInterface(ABC):
+    """Abstract interface of the asynchronous Entry repo."""
+
+    @abstractmethod
+    async def get_entries(self, source: str) -> list[EntryEntity]:
+        """Get entries from source.
+
+        Args:
+            source: str
+
+        Returns:
+            entries: list[EntryEntity]
+        """
+        ...
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities import LogEntity
+
+
+class AsyncLogRepositoryInterface(ABC):
+    """Abstract interface of the asynchronous Log repo."""
+
+    @abstractmethod
+    async def log_request(self, log_entity: LogEntity):
+        """Log the request.
+
+        Args:
+            log_entity (LogEntity): Entity with all the informations for logging.
+
+        """
+        ...
+
+    @abstractmethod
+    async def log_debug(self, message: str):
+        """Log a debug message
+
+        Args:
+            message (str): a debug message.
+
+        """
+        ...
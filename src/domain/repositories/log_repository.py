@@ -34,3 +34,7 @@ class LogRepositoryInterface(ABC):
 
         """
         ...
+
+    def close(self) -> None:
+        """Flush the pending logs and release the resources of the logger."""
+        ...
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.entities import EntryEntity, EntryObservationEntity
+
+
+class SnapshotRepositoryInterface(ABC):
+    """Abstract interface of the repository of the crawled entries history."""
+
+    @abstractmethod
+    def save_snapshot(
+        self, source: str, entries: list[EntryEntity], crawled_at: datetime
+    ) -> None:
+        """Save the entries of a crawl.
+
+        Args:
+            source (str): url of the crawled source.
+            entries (list[EntryEntity]): the crawled entries.
+            crawled_at (datetime): timestamp of the crawl.
+
+        """
+        ...
+
+    @abstractmethod
+    def get_last_snapshot(
+        self, source: str, before: datetime | None = None
+    ) -> list[EntryEntity]:
+        """Get the entries of the last crawl of a source.
+
+        Args:
+            source (str): url of the crawled source.
+            before (Optional(datetime)): only consider the crawls before it.
+
+        Returns:
+            entries (list[EntryEntity]): the entries, empty if there is no crawl.
+        """
+        ...
+
+    @abstractmethod
+    def get_item_history(self, item_id: int) -> list[EntryObservationEntity]:
+        """Get every observation of an item, from the oldest to the newest.
+
+        Args:
+            item_id (int): id of the item on HackerNews.
+
+        Returns:
+            observations (list[EntryObservationEntity]): the observations.
+        """
+        ...
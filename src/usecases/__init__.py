@@ -1,3 +1,6 @@
+from .async_get_entries_usecase import AsyncGetEntries
 from .get_entries_usecase import GetEntries
+from .get_item_history_usecase import GetItemHistory
+from .watch_entries_usecase import PollingSchedule, WatchEntries
 
-__all__ = [GetEntries]
+__all__ = [AsyncGetEntries, GetEntries, GetItemHistory, PollingSchedule, WatchEntries]
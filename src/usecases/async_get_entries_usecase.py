@@ -0,0 +1,125 @@
+import asyncio
+from datetime import datetime
+
+from src.domain.dtos.get_entries import (
+    GetEntriesDto,
+)
+from src.domain.entities import (
+    EntryEntity,
+    FilterExpression,
+    LogEntity,
+    OrderExpression,
+)
+from src.domain.repositories import (
+    AsyncEntryRepositoryInterface,
+    AsyncLogRepositoryInterface,
+)
+from src.usecases.get_entries_usecase import GetEntries
+
+
+class AsyncGetEntries:
+    """Asynchronous version of the GetEntries usecase.
+
+    The logs are written in background tasks, off the response path. Call
+    wait_pending_logs before closing the event loop to flush them. The
+    crawls are not saved in any history, so since_last is not supported.
+
+    """
+
+    def __init__(
+        self,
+        entry_repository: AsyncEntryRepositoryInterface,
+        logger_repository: AsyncLogRepositoryInterface,
+    ) -> None:
+        self.entry_repository = entry_repository
+        self.logger_repository = logger_repository
+        self.pending_logs = set()
+        # The fetch in progress of each source, possibly left by a deadline
+        self.pending_fetches: dict[str, asyncio.Task] = {}
+
+    def schedule_log(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self.pending_logs.add(task)
+        task.add_done_callback(self.pending_logs.discard)
+
+    def log_debug(self, message: str) -> None:
+        self.schedule_log(self.logger_repository.log_debug(message))
+
+    def log_request(self, filter: FilterExpression, order: OrderExpression) -> None:
+        log = LogEntity(request_time=datetime.now(), filter=filter, order=order)
+        self.schedule_log(self.logger_repository.log_request(log))
+
+    async def wait_pending_logs(self) -> None:
+        """Wait for the logs written in background."""
+        if self.pending_logs:
+            await asyncio.gather(*self.pending_logs)
+
+    async def get_sources_entries(
+        self, sources: list[str], deadline: float | None = None
+    ) -> list[EntryEntity]:
+        """Get the merged entries of several sources, as GetEntries does.
+
+        The sources failing or not fetched before the deadline are left out.
+        The late fetches are not cancelled (a fetch running in a thread can't
+        be stopped): a source still being fetched is not fetched again, its
+        fetch is awaited instead, so the late fetches don't pile up.
+        """
+        sources = list(dict.fromkeys(sources))
+        tasks = [self.fetch_source(source) for source in sources]
+        if not tasks:
+            return []
+        done, _ = await asyncio.wait(tasks, timeout=deadline)
+        entries = []
+        for source, task in zip(sources, tasks):
+            if task not in done:
+                self.log_debug(f"source {source} exceeded the deadline of {deadline}s")
+            elif task.exception() is not None:
+                self.log_debug(
+                    f"can't get entries from source {source}: {task.exception()}"
+                )
+            else:
+                entries.extend(task.result())
+        return entries
+
+    def fetch_source(self, source: str) -> asyncio.Task:
+        """Start the fetch of a source, or get the one in progress."""
+        task = self.pending_fetches.get(source)
+        if task is None:
+            task = asyncio.create_task(self.entry_repository.get_entries(source=source))
+            self.pending_fetches[source] = task
+            task.add_done_callback(lambda _: self.forget_fetch(source, task))
+        return task
+
+    def forget_fetch(self, source: str, task: asyncio.Task) -> None:
+        if self.pending_fetches.get(source) is task:
+            del self.pending_fetches[source]
+        if not task.cancelled():
+            # The failure of a fetch nobody awaits anymore is not reported
+            task.exception()
+
+    async def execute(self, dto: GetEntriesDto) -> list[EntryEntity]:
+        if dto.since_last:
+            raise ValueError("since_last needs a snapshot repository")
+
+        # Get all entries
+        if isinstance(dto.source, str):
+            entries = await self.entry_repository.get_entries(source=dto.source)
+        else:
+            entries = await self.get_sources_entries(dto.source, dto.deadline)
+        self.log_debug(f"Number of entries : {len(entries)}")
+
+        # Filter entries
+        filtered_entries = entries
+        if dto.filter is not None:
+            filtered_entries = GetEntries.filter_entries(entries, dto.filter)
+        self.log_debug(f"Number of filtered entries : {len(filtered_entries)}")
+
+        # Order entries
+        ordered_entries = GetEntries.limit_entries(
+            filtered_entries, dto.order, dto.limit
+        )
+
+        # Log the request
+        self.log_request(dto.filter, dto.order)
+
+        return ordered_entries
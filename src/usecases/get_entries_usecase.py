@@ -1,19 +1,52 @@
+import heapq
+import operator
+import threading
+from concurrent.futures import Future, wait
 from datetime import datetime
+from typing import Any, Callable
 
 from src.domain.dtos.get_entries import (
     GetEntriesDto,
 )
 from src.domain.entities import (
+    EntryBatch,
     EntryEntity,
-    FilterEntity,
-    FilterFieldEnum,
-    FilterOperatorEnum,
+    FilterExpression,
     LogEntity,
     OrderDirectionEnum,
-    OrderEntity,
-    OrderFieldEnum,
+    OrderExpression,
+    get_entries_delta,
+    get_orders,
 )
-from src.domain.repositories import EntryRepositoryInterface, LogRepositoryInterface
+from src.domain.repositories import (
+    EntryRepositoryInterface,
+    LogRepositoryInterface,
+    SnapshotRepositoryInterface,
+)
+from src.usecases import vectorized
+
+
+def submit_daemon(function: Callable[..., Any], *args: Any) -> Future:
+    """Run a function in a daemon thread.
+
+    Unlike the workers of a ThreadPoolExecutor, the thread is not joined at
+    interpreter exit, so a call left running doesn't delay the exit.
+
+    Returns:
+        future (Future): the result of the call.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(function(*args))
+        except BaseException as exception:
+            future.set_exception(exception)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 class GetEntries:
@@ -21,78 +54,236 @@ class GetEntries:
         self,
         entry_repository: EntryRepositoryInterface,
         logger_repository: LogRepositoryInterface,
+        snapshot_repository: SnapshotRepositoryInterface | None = None,
     ) -> None:
         self.entry_repository = entry_repository
         self.logger_repository = logger_repository
+        self.snapshot_repository = snapshot_repository
+        # The fetch in progress of each source, possibly left by a deadline
+        self.pending_fetches: dict[str, Future] = {}
+        self.lock = threading.Lock()
 
     @staticmethod
     def filter_entries(
         entries: list[EntryEntity],
-        filter: FilterEntity,
+        filter: FilterExpression,
     ) -> list[EntryEntity]:
-        match filter.field:
-            case FilterFieldEnum.index:
-                operator_func = filter.operator.convert_str_to_operator()
-                filtered_entries = [
-                    entry
-                    for entry in entries
-                    if operator_func(entry.index, filter.value)
-                ]
-            case FilterFieldEnum.number_of_words:
-                operator_func = filter.operator.convert_str_to_operator()
-                filtered_entries = [
-                    entry
-                    for entry in entries
-                    if operator_func(len(entry.title.split()), filter.value)
-                ]
-            case FilterFieldEnum.number_of_points:
-                operator_func = filter.operator.convert_str_to_operator()
-                filtered_entries = [
-                    entry
-                    for entry in entries
-                    if operator_func(entry.total_points, filter.value)
-                ]
-            case FilterFieldEnum.number_of_comments:
-                operator_func = filter.operator.convert_str_to_operator()
-                filtered_entries = [
-                    entry
-                    for entry in entries
-                    if operator_func(entry.total_comments, filter.value)
-                ]
-        return filtered_entries
+        if vectorized.can_vectorize(len(entries)):
+            return vectorized.filter_entries(entries, filter)
+        predicate = filter.compile()
+        return [entry for entry in entries if predicate(entry)]
+
+    @staticmethod
+    def get_order_key(
+        order: OrderExpression,
+        field_getters: dict | None = None,
+        index_getter: Callable[[Any], int] = operator.attrgetter("index"),
+    ) -> Callable[[Any], tuple]:
+        """Build the sort key of a (multi-key) order.
+
+        The keys are compared from the first to the last order, the
+        descending ones being negated, then the index breaks the ties.
+
+        Args:
+            order (OrderExpression): the order(s).
+            field_getters (Optional(dict)): function reading the value of each
+                order field, the attributes of the entries by default.
+            index_getter (Callable): function reading the index.
+
+        Returns:
+            key (Callable): the sort key.
+        """
+        getters = []
+        for order_entity in get_orders(order):
+            if field_getters is None:
+                getter = order_entity.field.get_entry_getter()
+            else:
+                getter = field_getters[order_entity.field]
+            if order_entity.direction == OrderDirectionEnum.desc:
+                getters.append(lambda entry, getter=getter: -getter(entry))
+            else:
+                getters.append(getter)
+        return lambda entry: tuple(getter(entry) for getter in getters) + (
+            index_getter(entry),
+        )
 
     @staticmethod
     def order_entries(
-        entries: list[EntryEntity], order: OrderEntity
+        entries: list[EntryEntity], order: OrderExpression, limit: int | None = None
     ) -> list[EntryEntity]:
-        reverse = True if order.direction == OrderDirectionEnum.desc else False
-        match order.field:
-            case OrderFieldEnum.points:
-                ordered_entries = sorted(
-                    entries, key=lambda x: x.total_points, reverse=reverse
-                )
-            case OrderFieldEnum.comments:
-                ordered_entries = sorted(
-                    entries, key=lambda x: x.total_comments, reverse=reverse
-                )
-        return ordered_entries
+        if vectorized.can_vectorize(len(entries)):
+            return vectorized.order_entries(entries, order, limit)
+        key = GetEntries.get_order_key(order)
+        if limit is not None and limit < len(entries):
+            # Top-k selection, without sorting all the entries
+            return heapq.nsmallest(limit, entries, key=key)
+        return sorted(entries, key=key)
 
-    def log_request(self, filter: FilterEntity, order: OrderEntity):
+    @staticmethod
+    def filter_batch(batch: EntryBatch, filter: FilterExpression) -> EntryBatch:
+        """Filter a batch of entries, without building the entries."""
+        if vectorized.can_vectorize(len(batch)):
+            return vectorized.filter_batch(batch, filter)
+        predicate = filter.compile(field_getters=batch.get_filter_getters())
+        return batch.take(row for row in range(len(batch)) if predicate(row))
+
+    @staticmethod
+    def order_batch(
+        batch: EntryBatch, order: OrderExpression, limit: int | None = None
+    ) -> EntryBatch:
+        """Order a batch of entries (keeping the first limit ones), as order_entries."""
+        if vectorized.can_vectorize(len(batch)):
+            return vectorized.order_batch(batch, order, limit)
+        key = GetEntries.get_order_key(
+            order,
+            field_getters=batch.get_order_getters(),
+            index_getter=batch.indexes.__getitem__,
+        )
+        rows = range(len(batch))
+        if limit is not None and limit < len(batch):
+            return batch.take(heapq.nsmallest(limit, rows, key=key))
+        return batch.take(sorted(rows, key=key))
+
+    @staticmethod
+    def limit_entries(
+        entries: list[EntryEntity], order: OrderExpression | None, limit: int | None
+    ) -> list[EntryEntity]:
+        """Order the entries if there is an order, then keep the first limit ones."""
+        if limit is not None and limit < 0:
+            raise ValueError(f"the limit can't be negative: {limit}")
+        if order is not None:
+            return GetEntries.order_entries(entries, order, limit)
+        if limit is not None:
+            return entries[:limit]
+        return entries
+
+    def log_request(self, filter: FilterExpression, order: OrderExpression):
         log = LogEntity(request_time=datetime.now(), filter=filter, order=order)
         try:
             self.logger_repository.log_request(log)
         except Exception as exception:
             raise exception
 
-    def execute(self, dto: GetEntriesDto) -> list[EntryEntity]:
-        # Get all entries
+    def get_sources_entries(
+        self, sources: list[str], deadline: float | None = None
+    ) -> dict[str, list[EntryEntity]]:
+        """Get the entries of several sources concurrently.
+
+        The sources failing or not fetched before the deadline are left out,
+        so the wall time is the one of the slowest source, bounded by the
+        deadline. The fetches run in daemon threads, which don't delay the
+        exit, and a source still being fetched (by a former call) is not
+        fetched again: its fetch is awaited instead, so the late fetches
+        don't pile up.
+
+        Args:
+            sources (list[str]): urls of the sources.
+            deadline (Optional(float)): seconds to wait for the sources.
+
+        Returns:
+            sources_entries (dict[str, list[EntryEntity]]): entries of each
+                fetched source, in the order of the sources.
+        """
+        sources = list(dict.fromkeys(sources))
+        futures = {source: self.fetch_source(source) for source in sources}
+        done, _ = wait(futures.values(), timeout=deadline)
+        sources_entries = {}
+        for source, future in futures.items():
+            if future not in done:
+                self.logger_repository.log_debug(
+                    f"source {source} exceeded the deadline of {deadline}s"
+                )
+            elif future.exception() is not None:
+                self.logger_repository.log_debug(
+                    f"can't get entries from source {source}: {future.exception()}"
+                )
+            else:
+                sources_entries[source] = future.result()
+        return sources_entries
+
+    def fetch_source(self, source: str) -> Future:
+        """Start the fetch of a source, or get the one in progress."""
+        with self.lock:
+            future = self.pending_fetches.get(source)
+            if future is not None:
+                return future
+            future = submit_daemon(self.entry_repository.get_entries, source)
+            self.pending_fetches[source] = future
+        # Outside of the lock, as the callback runs at once if the fetch is done
+        future.add_done_callback(lambda _: self.forget_fetch(source, future))
+        return future
+
+    def forget_fetch(self, source: str, future: Future) -> None:
+        with self.lock:
+            if self.pending_fetches.get(source) is future:
+                del self.pending_fetches[source]
+
+    def track_entries(
+        self, source: str, entries: list[EntryEntity], since_last: bool
+    ) -> list[EntryEntity]:
+        """Save the entries of a source in the history.
+
+        An empty crawl (the crawlers return no entry when a fetch fails) is
+        not saved, so it doesn't replace the last snapshot of the source.
+
+        Returns:
+            entries (list[EntryEntity]): the entries, only the ones that changed
+                since the previous crawl of the source if since_last.
+        """
+        if not entries:
+            self.logger_repository.log_debug(
+                f"No entries from source {source}, the crawl is not saved"
+            )
+            return entries
+        if since_last:
+            previous_entries = self.snapshot_repository.get_last_snapshot(source)
+        if self.snapshot_repository is not None:
+            self.snapshot_repository.save_snapshot(
+                source, entries, crawled_at=datetime.now()
+            )
+
+        # Keep the entries that changed since the previous crawl
+        if since_last:
+            delta = get_entries_delta(previous_entries, entries)
+            entries = [entry_delta.entry for entry_delta in delta]
+            self.logger_repository.log_debug(
+                f"Number of changed entries : {len(entries)}"
+            )
+        return entries
+
+    def crawl_sources(self, dto: GetEntriesDto) -> dict[str, list[EntryEntity]]:
+        """Get the crawled entries of each source, before any processing.
+
+        Returns:
+            sources_entries (dict[str, list[EntryEntity]]): entries of each
+                fetched source.
+        """
+        if isinstance(dto.source, str):
+            entries = []
+            try:
+                entries = self.entry_repository.get_entries(source=dto.source)
+            except Exception as exception:
+                raise exception
+            return {dto.source: entries}
+        return self.get_sources_entries(dto.source, dto.deadline)
+
+    def process_entries(
+        self, dto: GetEntriesDto, sources_entries: dict[str, list[EntryEntity]]
+    ) -> list[EntryEntity]:
+        """Save, filter and order the crawled entries of the sources, as execute."""
         entries = []
-        try:
-            entries = self.entry_repository.get_entries(source=dto.source)
-        except Exception as exception:
-            raise exception
+        for source_entries in sources_entries.values():
+            entries.extend(source_entries)
         self.logger_repository.log_debug(f"Number of entries : {len(entries)}")
 
+        # Save the crawled entries in the history
+        if self.snapshot_repository is not None:
+            entries = []
+            for source, source_entries in sources_entries.items():
+                entries.extend(
+                    self.track_entries(source, source_entries, dto.since_last)
+                )
+
         # Filter entries
         filtered_entries = entries
         if dto.filter is not None:
@@ -102,11 +293,18 @@ class GetEntries:
         )
 
         # Order entries
-        ordered_entries = filtered_entries
-        if dto.order is not None:
-            ordered_entries = self.order_entries(filtered_entries, dto.order)
+        ordered_entries = self.limit_entries(filtered_entries, dto.order, dto.limit)
 
         # Log the request
         self.log_request(dto.filter, dto.order)
 
         return ordered_entries
+
+    def execute(self, dto: GetEntriesDto) -> list[EntryEntity]:
+        if dto.since_last and self.snapshot_repository is None:
+            raise ValueError("since_last needs a snapshot repository")
+
+        # Get all entries
+        sources_entries = self.crawl_sources(dto)
+
+        return self.process_entries(dto, sources_entries)
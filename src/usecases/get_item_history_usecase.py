@@ -0,0 +1,12 @@
+from src.domain.entities import EntryObservationEntity
+from src.domain.repositories import SnapshotRepositoryInterface
+
+
+class GetItemHistory:
+    """Get the evolution of an item from the saved crawls, without crawling."""
+
+    def __init__(self, snapshot_repository: SnapshotRepositoryInterface) -> None:
+        self.snapshot_repository = snapshot_repository
+
+    def execute(self, item_id: int) -> list[EntryObservationEntity]:
+        return self.snapshot_repository.get_item_history(item_id)
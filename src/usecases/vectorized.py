@@ -0,0 +1,138 @@
+import operator
+from typing import Any, Callable
+
+from src.domain.entities import (
+    EntryBatch,
+    EntryEntity,
+    FilterExpression,
+    FilterFieldEnum,
+    OrderDirectionEnum,
+    OrderExpression,
+    OrderFieldEnum,
+    get_orders,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Under this number of entries, building the arrays costs more than it saves
+VECTORIZE_THRESHOLD = 5000
+
+FILTER_COLUMNS = {
+    FilterFieldEnum.index: "index",
+    FilterFieldEnum.number_of_words: "word_count",
+    FilterFieldEnum.number_of_points: "total_points",
+    FilterFieldEnum.number_of_comments: "total_comments",
+}
+
+BATCH_COLUMNS = {
+    "index": "indexes",
+    "word_count": "word_counts",
+    "total_points": "total_points",
+    "total_comments": "total_comments",
+}
+
+
+def can_vectorize(size: int) -> bool:
+    """Returns True if numpy is installed and there are enough entries."""
+    return np is not None and size >= VECTORIZE_THRESHOLD
+
+
+class LazyColumns(dict):
+    """Arrays of the values of each column, built on first access.
+
+    Only the columns read by the filter and the order are built.
+    """
+
+    def __init__(self, loader: Callable[[Any], Any]):
+        super().__init__()
+        self.loader = loader
+
+    def __missing__(self, key: Any) -> Any:
+        column = self[key] = self.loader(key)
+        return column
+
+
+def get_entry_columns(entries: list[EntryEntity]) -> LazyColumns:
+    """Get the columns of a list of entries, keyed by attribute name."""
+    return LazyColumns(
+        lambda name: np.fromiter(
+            map(operator.attrgetter(name), entries),
+            dtype=np.int64,
+            count=len(entries),
+        )
+    )
+
+
+def get_batch_columns(batch: EntryBatch) -> LazyColumns:
+    """Get the columns of a batch, keyed by attribute name, without copies."""
+    return LazyColumns(
+        lambda name: np.asarray(getattr(batch, BATCH_COLUMNS[name]), dtype=np.int64)
+    )
+
+
+def get_order_column(columns: LazyColumns, order_field: OrderFieldEnum) -> Any:
+    """Get the array of the values of an order field."""
+    match order_field:
+        case OrderFieldEnum.points:
+            return columns["total_points"]
+        case OrderFieldEnum.comments:
+            return columns["total_comments"]
+        case OrderFieldEnum.points_per_comment:
+            return columns["total_points"] / np.maximum(columns["total_comments"], 1)
+
+
+def filter_rows(columns: LazyColumns, filter: FilterExpression) -> Any:
+    """Get the rows passing the filter, in order.
+
+    The operators of the filters are applied on the whole columns, and the
+    combinators combine the boolean masks.
+    """
+    filter_columns = LazyColumns(lambda field: columns[FILTER_COLUMNS[field]])
+    return np.flatnonzero(filter.mask(filter_columns))
+
+
+def order_rows(
+    columns: LazyColumns, order: OrderExpression, limit: int | None = None
+) -> Any:
+    """Get the rows in the order of GetEntries.get_order_key.
+
+    The keys are sorted with a stable lexsort, the last key being the primary
+    one: the index then the orders, from the last to the first.
+    """
+    keys = [columns["index"]]
+    for order_entity in reversed(get_orders(order)):
+        column = get_order_column(columns, order_entity.field)
+        if order_entity.direction == OrderDirectionEnum.desc:
+            column = -column
+        keys.append(column)
+    rows = np.lexsort(keys)
+    if limit is not None:
+        return rows[: max(limit, 0)]
+    return rows
+
+
+def filter_entries(
+    entries: list[EntryEntity], filter: FilterExpression
+) -> list[EntryEntity]:
+    rows = filter_rows(get_entry_columns(entries), filter)
+    return [entries[row] for row in rows.tolist()]
+
+
+def order_entries(
+    entries: list[EntryEntity], order: OrderExpression, limit: int | None = None
+) -> list[EntryEntity]:
+    rows = order_rows(get_entry_columns(entries), order, limit)
+    return [entries[row] for row in rows.tolist()]
+
+
+def filter_batch(batch: EntryBatch, filter: FilterExpression) -> EntryBatch:
+    return batch.take(filter_rows(get_batch_columns(batch), filter).tolist())
+
+
+def order_batch(
+    batch: EntryBatch, order: OrderExpression, limit: int | None = None
+) -> EntryBatch:
+    return batch.take(order_rows(get_batch_columns(batch), order, limit).tolist())
@@ -0,0 +1,144 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from src.domain.dtos.get_entries import (
+    GetEntriesDto,
+)
+from src.domain.entities import EntryDeltaEntity, EntryEntity, get_entries_delta
+from src.usecases.get_entries_usecase import GetEntries
+
+
+@dataclass
+class PollingSchedule:
+    """Interval between two polls, adapted to the change rate of the entries.
+
+    The interval is multiplied by backoff after a poll without change, and
+    by speedup after a poll where at least churn_threshold of the entries
+    changed, staying between min_interval and max_interval (a quarter and 8
+    times the initial interval by default). Each delay is randomised by
+    +/- jitter, so the polls of several watchers do not align.
+
+    Attributes:
+        interval (float): current interval, in seconds.
+        min_interval (Optional(float)): shortest interval.
+        max_interval (Optional(float)): longest interval.
+        backoff (float): factor applied when nothing changed.
+        speedup (float): factor applied when the entries churn.
+        churn_threshold (float): change rate from which the polls speed up.
+        jitter (float): relative randomisation of the delays.
+    """
+
+    interval: float
+    min_interval: float | None = None
+    max_interval: float | None = None
+    backoff: float = 1.5
+    speedup: float = 0.5
+    churn_threshold: float = 0.1
+    jitter: float = 0.1
+
+    def __post_init__(self):
+        if self.min_interval is None:
+            self.min_interval = self.interval / 4
+        if self.max_interval is None:
+            self.max_interval = self.interval * 8
+
+    def update(self, change_rate: float) -> float:
+        """Adapt the interval to the share of entries changed by the last poll.
+
+        Returns:
+            interval (float): the new interval.
+        """
+        if change_rate <= 0:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        elif change_rate >= self.churn_threshold:
+            self.interval = max(self.interval * self.speedup, self.min_interval)
+        return self.interval
+
+    def get_delay(self, random_value: float) -> float:
+        """Get the jittered delay before the next poll.
+
+        Args:
+            random_value (float): random number in [0, 1).
+        """
+        return self.interval * (1 + self.jitter * (2 * random_value - 1))
+
+
+class WatchEntries:
+    """Re-run GetEntries on a polling schedule, keeping its adapters warm.
+
+    The change rate of a poll is the share of the crawled entries that are
+    new, moved or updated since the previous poll, whatever the filter,
+    limit or since_last of the request, the first poll keeping the initial
+    interval. A failing poll (or one crawling no entry) is logged and backs
+    off as a poll without change.
+    """
+
+    def __init__(
+        self,
+        get_entries: GetEntries,
+        schedule: PollingSchedule,
+        sleep: Callable[[float], None] = time.sleep,
+        get_random: Callable[[], float] = random.random,
+    ) -> None:
+        self.get_entries = get_entries
+        self.schedule = schedule
+        self.sleep = sleep
+        self.get_random = get_random
+
+    @staticmethod
+    def get_change_rate(
+        delta: list[EntryDeltaEntity], entries: list[EntryEntity]
+    ) -> float:
+        return len(delta) / max(len(entries), 1)
+
+    def execute(
+        self,
+        dto: GetEntriesDto,
+        on_entries: Callable[[list[EntryEntity], list[EntryDeltaEntity]], None],
+        max_runs: int | None = None,
+    ) -> None:
+        """Poll the entries until max_runs polls (forever by default).
+
+        Args:
+            dto (GetEntriesDto): the request of each poll.
+            on_entries (Callable): called with the entries of the request and
+                the changes of the crawled entries after each successful poll.
+            max_runs (Optional(int)): number of polls.
+        """
+        if dto.since_last and self.get_entries.snapshot_repository is None:
+            raise ValueError("since_last needs a snapshot repository")
+        logger_repository = self.get_entries.logger_repository
+        previous_crawled = None
+        runs = 0
+        while max_runs is None or runs < max_runs:
+            runs += 1
+            change_rate = None
+            try:
+                sources_entries = self.get_entries.crawl_sources(dto)
+                crawled = [
+                    entry
+                    for source_entries in sources_entries.values()
+                    for entry in source_entries
+                ]
+                if not crawled:
+                    raise ValueError("no entry was crawled")
+                entries = self.get_entries.process_entries(dto, sources_entries)
+            except Exception as exception:
+                logger_repository.log_debug(f"poll failed: {exception}")
+                change_rate = 0.0
+            else:
+                # The churn of the pages, not of the filtered output
+                delta = get_entries_delta(previous_crawled or [], crawled)
+                if previous_crawled is not None:
+                    change_rate = self.get_change_rate(delta, crawled)
+                previous_crawled = crawled
+                on_entries(entries, delta)
+            if change_rate is not None:
+                interval = self.schedule.update(change_rate)
+                logger_repository.log_debug(
+                    f"Change rate : {change_rate:.2f} - Next poll in {interval:.1f}s"
+                )
+            if max_runs is None or runs < max_runs:
+                self.sleep(self.schedule.get_delay(self.get_random()))
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from src.adapters import (
+    AsyncEntryRepositoryAdapter,
+    AsyncLogRepositoryAdapter,
+    CachedEntryAdapter,
+    DBLoggerAdapter,
+    FileLoggerAdapter,
+    HackerNewsCrawlerEntryAdapter,
+    QueueFileLoggerAdapter,
+)
+from src.domain.entities import EntryEntity, LogEntity
+
+
+class TestAsyncAdapters:
+    def test_get_entries(self, mocker):
+        entries = [
+            EntryEntity(
+                index=1,
+                title="title",
+                total_points=12,
+                total_comments=12,
+                source="source",
+            )
+        ]
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mock_get_entries = mocker.patch.object(
+            crawler, "get_entries", return_value=entries
+        )
+        adapter = AsyncEntryRepositoryAdapter(crawler)
+        assert asyncio.run(adapter.get_entries("source")) == entries
+        mock_get_entries.assert_called_once_with("source")
+
+    def test_get_entries_snapshot_without_thread(self, mocker):
+        entries = [
+            EntryEntity(
+                index=1,
+                title="title",
+                total_points=12,
+                total_comments=12,
+                source="source",
+            )
+        ]
+        crawler = HackerNewsCrawlerEntryAdapter(
+            logger=FileLoggerAdapter(log_level=logging.INFO)
+        )
+        mock_get_entries = mocker.patch.object(
+            crawler, "get_entries", return_value=entries
+        )
+        adapter = AsyncEntryRepositoryAdapter(CachedEntryAdapter(crawler, ttl=60))
+        assert asyncio.run(adapter.get_entries("source")) == entries
+        # The snapshot is served without a thread
+        mock_to_thread = mocker.patch("asyncio.to_thread")
+        assert asyncio.run(adapter.get_entries("source")) == entries
+        mock_to_thread.assert_not_called()
+        mock_get_entries.assert_called_once_with("source")
+
+    def test_log_request(self, mocker):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        mock_log_request = mocker.patch.object(logger, "log_request")
+        mock_log_debug = mocker.patch.object(logger, "log_debug")
+        adapter = AsyncLogRepositoryAdapter(logger)
+        log_entity = LogEntity(request_time=datetime.now(), filter=None, order=None)
+        asyncio.run(adapter.log_request(log_entity))
+        asyncio.run(adapter.log_debug("message"))
+        mock_log_request.assert_called_once_with(log_entity)
+        mock_log_debug.assert_called_once_with("message")
+
+    def test_log_blocking(self, tmp_path):
+        file_logger = FileLoggerAdapter(log_level=logging.INFO)
+        queue_logger = QueueFileLoggerAdapter(
+            log_level=logging.INFO, filename=str(tmp_path / "app.log")
+        )
+        db_logger = DBLoggerAdapter(
+            log_level=logging.INFO, db_path=str(tmp_path / "app.db")
+        )
+        assert AsyncLogRepositoryAdapter(file_logger).blocking
+        assert not AsyncLogRepositoryAdapter(queue_logger).blocking
+        assert not AsyncLogRepositoryAdapter(db_logger).blocking
+        assert AsyncLogRepositoryAdapter(queue_logger, blocking=True).blocking
+        queue_logger.close()
+        db_logger.close()
+
+    def test_log_non_blocking_without_thread(self, tmp_path, mocker):
+        logger = QueueFileLoggerAdapter(
+            log_level=logging.INFO, filename=str(tmp_path / "app.log")
+        )
+        mock_log_request = mocker.patch.object(logger, "log_request")
+        mock_to_thread = mocker.patch("asyncio.to_thread")
+        adapter = AsyncLogRepositoryAdapter(logger)
+        log_entity = LogEntity(request_time=datetime.now(), filter=None, order=None)
+        asyncio.run(adapter.log_request(log_entity))
+        mock_log_request.assert_called_once_with(log_entity)
+        mock_to_thread.assert_not_called()
+        logger.close()
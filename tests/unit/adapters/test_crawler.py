@@ -1,10 +1,12 @@
 import logging
+import re
 from dataclasses import dataclass
 
 import pytest
+import requests
 from bs4 import BeautifulSoup, Tag
 
-from src.adapters import HackerNewsCrawlerEntryAdapter, FileLoggerAdapter
+from src.adapters import EntryCache, HackerNewsCrawlerEntryAdapter, FileLoggerAdapter
 from src.domain.entities.entry import EntryEntity
 
 
@@ -30,16 +32,19 @@ class TestCrawlerAdapter:
     def test_get_entries(self, html_page, mocker):
         logger = FileLoggerAdapter(log_level=logging.INFO)
         crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
-        mock_requests = mocker.patch("requests.get", return_value=html_page)
+        mock_requests = mocker.patch.object(
+            crawler.session, "get", return_value=html_page
+        )
         source = "source"
         entries = crawler.get_entries(source)
-        mock_requests.assert_called_once_with(source)
+        mock_requests.assert_called_once_with(source, timeout=crawler.timeout)
         expected_first_entry = EntryEntity(
             index=1,
             title="The Backrooms of the Internet Archive",
             total_points=121,
             total_comments=16,
             source=source,
+            item_id=40618079,
         )
         assert entries[0] == expected_first_entry
 
@@ -47,12 +52,129 @@ class TestCrawlerAdapter:
     def test_get_entries_requests_error(self, html_page, mocker):
         logger = FileLoggerAdapter(log_level=logging.INFO)
         crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
-        mock_requests = mocker.patch("requests.get", return_value=html_page)
+        mock_requests = mocker.patch.object(
+            crawler.session, "get", return_value=html_page
+        )
         mocker.patch("logging.debug")
         source = "source"
         entries = crawler.get_entries(source)
-        mock_requests.assert_called_once_with(source)
+        mock_requests.assert_called_once_with(source, timeout=crawler.timeout)
+        assert entries == []
+
+    @pytest.mark.parametrize("html_page", [200], indirect=True)
+    def test_get_entries_with_entry_cache(self, html_page, mocker):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger, entry_cache=EntryCache())
+        mocker.patch.object(crawler.session, "get", return_value=html_page)
+        spy_parse_entries = mocker.spy(crawler, "parse_entries")
+        first_entries = crawler.get_entries("source")
+        second_entries = crawler.get_entries("source")
+        assert first_entries == second_entries
+        spy_parse_entries.assert_called_once()
+
+    def test_get_entries_requests_timeout(self, mocker):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(crawler.session, "get", side_effect=requests.Timeout)
+        mock_log_debug = mocker.patch.object(logger, "log_debug")
+        entries = crawler.get_entries("source")
         assert entries == []
+        mock_log_debug.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "source,page_number,expected",
+        [
+            ("https://news.ycombinator.com/", 1, "https://news.ycombinator.com/"),
+            ("https://news.ycombinator.com/", 2, "https://news.ycombinator.com/?p=2"),
+            (
+                "https://news.ycombinator.com/newest?p=1",
+                3,
+                "https://news.ycombinator.com/newest?p=3",
+            ),
+        ],
+    )
+    def test_get_page_url(self, source, page_number, expected):
+        page_url = HackerNewsCrawlerEntryAdapter.get_page_url(source, page_number)
+        assert page_url == expected
+
+    @pytest.mark.parametrize(
+        "max_entries,max_pages,expected",
+        [
+            (None, None, 1),
+            (30, None, 1),
+            (45, None, 2),
+            (None, 3, 3),
+            (100, 2, 2),
+        ],
+    )
+    def test_get_number_of_pages(self, max_entries, max_pages, expected):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(
+            logger=logger, max_entries=max_entries, max_pages=max_pages
+        )
+        assert crawler.get_number_of_pages() == expected
+
+    @pytest.mark.parametrize(
+        "max_entries,max_pages", [(0, None), (-5, None), (None, 0)]
+    )
+    def test_invalid_max_entries_or_pages(self, max_entries, max_pages):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        with pytest.raises(ValueError):
+            HackerNewsCrawlerEntryAdapter(
+                logger=logger, max_entries=max_entries, max_pages=max_pages
+            )
+
+    @pytest.mark.parametrize("html_page", [200], indirect=True)
+    def test_get_entries_multiple_pages(self, html_page, mocker):
+        def get_page(url, timeout):
+            page_number = int(url.split("p=")[1]) if "p=" in url else 1
+            offset = (page_number - 1) * 30
+            text = re.sub(
+                r'class="rank">(\d+)\.',
+                lambda match: f'class="rank">{int(match[1]) + offset}.',
+                html_page.text,
+            )
+            text = re.sub(
+                r'class="athing" id="(\d+)"',
+                lambda match: f'class="athing" id="{int(match[1]) + offset}"',
+                text,
+            )
+            return type(html_page)(text=text, status_code=200)
+
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger, max_entries=45)
+        mock_requests = mocker.patch.object(
+            crawler.session, "get", side_effect=get_page
+        )
+        entries = crawler.get_entries("source")
+        assert mock_requests.call_count == 2
+        assert len(entries) == 45
+        assert [entry.index for entry in entries] == list(range(1, 46))
+
+    @pytest.mark.parametrize("html_page", [200], indirect=True)
+    def test_get_entries_deduplicates_moved_stories(self, html_page, mocker):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger, max_pages=2)
+        # The second page repeats the stories of the first one
+        mocker.patch.object(crawler.session, "get", return_value=html_page)
+        entries = crawler.get_entries("source")
+        item_ids = [entry.item_id for entry in entries]
+        assert len(entries) == 30
+        assert len(set(item_ids)) == 30
+        assert entries[0].index == 1
+
+    @pytest.mark.parametrize("html_page", [200], indirect=True)
+    def test_get_entries_stops_on_empty_page(self, html_page, mocker):
+        empty_page = type(html_page)(text="<html></html>", status_code=200)
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(
+            logger=logger, max_pages=3, max_workers=1
+        )
+        mocker.patch.object(
+            crawler.session, "get", side_effect=[html_page, empty_page, html_page]
+        )
+        entries = crawler.get_entries("source")
+        assert len(entries) == 30
 
     @pytest.mark.parametrize(
         "rank_html_string,expected",
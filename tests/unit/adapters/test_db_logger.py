@@ -1,8 +1,18 @@
 import logging
+import sqlite3
+import time
+from datetime import datetime
 
 from unittest.mock import patch
 
 from src.adapters.db_logger import DBLoggerAdapter
+from src.domain.entities import (
+    FilterAndEntity,
+    FilterEntity,
+    FilterFieldEnum,
+    FilterOperatorEnum,
+    LogEntity,
+)
 
 
 class TestLoggerAdapter:
@@ -12,3 +22,102 @@ class TestLoggerAdapter:
         assert logger is not None
         assert type(logger) == DBLoggerAdapter
         assert logger.log_level == logging.INFO
+
+    def test_log_request_filter_expression(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        filter = FilterAndEntity(
+            filters=[
+                FilterEntity(
+                    field=FilterFieldEnum.number_of_words,
+                    operator=FilterOperatorEnum.gt,
+                    value=5,
+                ),
+                FilterEntity(
+                    field=FilterFieldEnum.number_of_comments,
+                    operator=FilterOperatorEnum.ge,
+                    value=10,
+                ),
+            ]
+        )
+        logger = DBLoggerAdapter(log_level=logging.INFO)
+        logger.log_request(
+            LogEntity(request_time=datetime.now(), filter=filter, order=None)
+        )
+        logger.close()
+        rows = (
+            sqlite3.connect("data/app.db")
+            .execute("SELECT filter_field, filter_expression FROM log_request")
+            .fetchall()
+        )
+        assert rows == [
+            (None, "(number_of_words gt 5 AND number_of_comments ge 10)"),
+        ]
+
+    def test_migrate_log_request(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        con = sqlite3.connect("data/app.db")
+        con.execute(
+            """CREATE TABLE log_request(
+                request_time TEXT,
+                filter_field TEXT,
+                filter_operator TEXT,
+                filter_value INT,
+                order_field TEXT,
+                order_direction TEXT
+            )"""
+        )
+        con.commit()
+        DBLoggerAdapter(log_level=logging.INFO)
+        columns = [row[1] for row in con.execute("PRAGMA table_info(log_request)")]
+        assert columns[-1] == "filter_expression"
+
+    def test_log_debug_is_written_in_batches(self, tmp_path):
+        db_path = str(tmp_path / "app.db")
+        logger = DBLoggerAdapter(
+            log_level=logging.DEBUG, db_path=db_path, batch_size=2, flush_interval=60
+        )
+        logger.log_debug("first")
+        logger.log_debug("second")
+        logger.log_debug("third")
+        logger.flush()
+        con = sqlite3.connect(db_path)
+        rows = con.execute("SELECT message FROM log_debug").fetchall()
+        assert rows == [("first",), ("second",), ("third",)]
+        assert con.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        logger.close()
+
+    def test_log_debug_ignored_above_debug_level(self, tmp_path):
+        db_path = str(tmp_path / "app.db")
+        logger = DBLoggerAdapter(log_level=logging.INFO, db_path=db_path)
+        logger.log_debug("message")
+        logger.close()
+        rows = sqlite3.connect(db_path).execute("SELECT * FROM log_debug").fetchall()
+        assert rows == []
+
+    def test_log_request_is_not_written_inline(self, tmp_path, mocker):
+        logger = DBLoggerAdapter(
+            log_level=logging.INFO, db_path=str(tmp_path / "app.db")
+        )
+        spy_write_batch = mocker.spy(logger, "write_batch")
+        log = LogEntity(request_time=datetime.now(), filter=None, order=None)
+        for _ in range(3):
+            logger.log_request(log)
+        logger.close()
+        assert spy_write_batch.call_count == 1
+        assert len(spy_write_batch.call_args.args[0]) == 3
+
+    def test_flush_interval(self, tmp_path):
+        db_path = str(tmp_path / "app.db")
+        logger = DBLoggerAdapter(
+            log_level=logging.DEBUG, db_path=db_path, flush_interval=0.05
+        )
+        logger.log_debug("message")
+        con = sqlite3.connect(db_path)
+        for _ in range(100):
+            if con.execute("SELECT * FROM log_debug").fetchall():
+                break
+            time.sleep(0.01)
+        assert con.execute("SELECT message FROM log_debug").fetchall() == [("message",)]
+        logger.close()
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from src.adapters import DBSnapshotAdapter
+from src.domain.entities import EntryEntity, EntryObservationEntity
+
+SOURCE = "https://news.ycombinator.com/"
+
+
+def build_entry(index: int, item_id: int, total_points: int) -> EntryEntity:
+    return EntryEntity(
+        index=index,
+        title=f"title {item_id}",
+        total_points=total_points,
+        total_comments=total_points // 2,
+        source=SOURCE,
+        item_id=item_id,
+    )
+
+
+class TestDBSnapshotAdapter:
+    def test_get_last_snapshot_without_crawl(self, tmp_path):
+        adapter = DBSnapshotAdapter(db_path=str(tmp_path / "app.db"))
+        assert adapter.get_last_snapshot(SOURCE) == []
+
+    def test_get_last_snapshot(self, tmp_path):
+        adapter = DBSnapshotAdapter(db_path=str(tmp_path / "app.db"))
+        first = [build_entry(1, 10, 5), build_entry(2, 20, 3)]
+        second = [build_entry(1, 20, 30), build_entry(2, 10, 6)]
+        adapter.save_snapshot(SOURCE, first, crawled_at=datetime(2024, 1, 1, 12))
+        adapter.save_snapshot(SOURCE, second, crawled_at=datetime(2024, 1, 1, 13))
+        adapter.save_snapshot("other", [], crawled_at=datetime(2024, 1, 1, 14))
+        assert adapter.get_last_snapshot(SOURCE) == second
+        # An empty crawl is skipped
+        adapter.save_snapshot(SOURCE, [], crawled_at=datetime(2024, 1, 1, 15))
+        assert adapter.get_last_snapshot(SOURCE) == second
+        assert (
+            adapter.get_last_snapshot(SOURCE, before=datetime(2024, 1, 1, 13)) == first
+        )
+
+    def test_get_item_history(self, tmp_path):
+        db_path = str(tmp_path / "app.db")
+        adapter = DBSnapshotAdapter(db_path=db_path)
+        adapter.save_snapshot(
+            SOURCE, [build_entry(2, 10, 5)], crawled_at=datetime(2024, 1, 1, 12)
+        )
+        adapter.save_snapshot(
+            SOURCE,
+            [build_entry(1, 20, 1), build_entry(1, 10, 9)],
+            crawled_at=datetime(2024, 1, 1, 13),
+        )
+        # The history is read back by a new connection
+        history = DBSnapshotAdapter(db_path=db_path).get_item_history(10)
+        assert history == [
+            EntryObservationEntity(
+                crawled_at=datetime(2024, 1, 1, 12), entry=build_entry(2, 10, 5)
+            ),
+            EntryObservationEntity(
+                crawled_at=datetime(2024, 1, 1, 13), entry=build_entry(1, 10, 9)
+            ),
+        ]
+
+    def test_indexes(self, tmp_path):
+        adapter = DBSnapshotAdapter(db_path=str(tmp_path / "app.db"))
+        plan = adapter.get_connection().execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM entry_observation WHERE item_id = 1"
+        )
+        assert "entry_observation_item_id" in str(plan.fetchall())
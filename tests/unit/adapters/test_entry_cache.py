@@ -0,0 +1,67 @@
+from src.adapters.entry_cache import EntryCache
+from src.domain.entities import EntryEntity
+
+
+class TestEntryCache:
+    def build_entries(self, number: int) -> list[EntryEntity]:
+        return [
+            EntryEntity(
+                index=index,
+                title=f"title {index}",
+                total_points=index,
+                total_comments=index,
+                source="source",
+            )
+            for index in range(1, number + 1)
+        ]
+
+    def test_get_key(self):
+        key = EntryCache.get_key("source", "body")
+        assert key == EntryCache.get_key("source", "body")
+        assert key != EntryCache.get_key("source", "other body")
+        assert key != EntryCache.get_key("other source", "body")
+
+    def test_get_missing(self):
+        cache = EntryCache()
+        assert cache.get("key") is None
+
+    def test_set_and_get(self):
+        cache = EntryCache()
+        entries = self.build_entries(3)
+        cache.set("key", entries)
+        assert cache.get("key") == entries
+
+    def test_lru_eviction(self):
+        cache = EntryCache(max_size=2)
+        cache.set("first", self.build_entries(1))
+        cache.set("second", self.build_entries(2))
+        cache.get("first")
+        cache.set("third", self.build_entries(3))
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+
+    def test_persistent_tier(self, tmp_path):
+        db_path = str(tmp_path / "app.db")
+        entries = self.build_entries(3)
+        EntryCache(db_path=db_path).set("key", entries)
+        assert EntryCache(db_path=db_path).get("key") == entries
+
+    def test_get_key_parser(self):
+        assert EntryCache.get_key("source", "body", "parser") != EntryCache.get_key(
+            "source", "body", "other parser"
+        )
+
+    def test_persistent_tier_max_age(self, tmp_path, mocker):
+        db_path = str(tmp_path / "app.db")
+        EntryCache(db_path=db_path, max_age=60).set("key", self.build_entries(3))
+        mocker.patch("src.adapters.entry_cache.time.time", return_value=1e12)
+        assert EntryCache(db_path=db_path, max_age=60).get("key") is None
+
+    def test_persistent_tier_max_rows(self, tmp_path):
+        db_path = str(tmp_path / "app.db")
+        cache = EntryCache(db_path=db_path, max_rows=2)
+        for key in ["first", "second", "third"]:
+            cache.set(key, self.build_entries(1))
+        rows = cache.get_connection().execute("SELECT key FROM entry_cache")
+        assert sorted(row[0] for row in rows) == ["second", "third"]
@@ -64,6 +64,19 @@ class TestLoggerAdapter:
         )
         return entity
 
+    @pytest.fixture
+    def log_entity_multiple_orders(self):
+        order_entities = [
+            OrderEntity(
+                field=OrderFieldEnum.comments, direction=OrderDirectionEnum.desc
+            ),
+            OrderEntity(field=OrderFieldEnum.points, direction=OrderDirectionEnum.asc),
+        ]
+        entity = LogEntity(
+            request_time=datetime.now(), filter=None, order=order_entities
+        )
+        return entity
+
     def test_create_logger(self):
         logger = FileLoggerAdapter(log_level=logging.INFO)
         assert logger is not None
@@ -73,7 +86,7 @@ class TestLoggerAdapter:
 
     def test_log_debug(self, mocker):
         logger = FileLoggerAdapter(log_level=logging.DEBUG)
-        mock_log_debug = mocker.patch("logging.debug")
+        mock_log_debug = mocker.patch.object(logger.logger, "debug")
         message_log = "message_log"
         logger.log_debug(message_log)
         mock_log_debug.assert_called_once_with(message_log)
@@ -97,6 +110,10 @@ class TestLoggerAdapter:
                 "log_entity_full",
                 "Filter by: number_of_words lt 12 - Order by: comments desc",
             ),
+            (
+                "log_entity_multiple_orders",
+                "Filter by: Nothing - Order by: comments desc, points asc",
+            ),
         ],
     )
     def test_log_request(self, log_entity, expected, request, mocker):
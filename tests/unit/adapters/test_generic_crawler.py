@@ -0,0 +1,129 @@
+import json
+import logging
+
+import pytest
+
+from src.adapters import (
+    HACKER_NEWS_PROFILE,
+    BeautifulSoupHtmlParser,
+    FileLoggerAdapter,
+    GenericCrawlerEntryAdapter,
+    SelectorProfile,
+    SelectorProfileHtmlParser,
+    load_profiles,
+)
+from src.adapters.generic_crawler import compile_selector, parse_number
+from src.domain.entities import EntryEntity
+
+LISTING_PROFILE = SelectorProfile(
+    row="li.story",
+    title="a.title",
+    score="span.votes",
+    item_id_attribute="data-id",
+)
+
+LISTING_HTML = """<ol>
+<li class="story" data-id="7"><a class="title">First story</a>
+<span class="votes">1,204 votes</span></li>
+<li class="story"><a class="title">No votes</a></li>
+<li class="story" data-id="9"><a class="title">Second story</a>
+<span class="votes">3 votes</span></li>
+</ol>"""
+
+
+class TestGenericCrawler:
+    @pytest.fixture
+    def html_text(self):
+        with open("./tests/unit/adapters/hn_fixture.html", "r") as file:
+            return file.read()
+
+    def test_hacker_news_profile_fidelity(self, html_text):
+        parser = SelectorProfileHtmlParser(profile=HACKER_NEWS_PROFILE)
+        expected_entries = BeautifulSoupHtmlParser().parse_entries(html_text, "source")
+        assert parser.parse_entries(html_text, "source") == expected_entries
+
+    def test_parse_entries_with_profile(self):
+        parser = SelectorProfileHtmlParser(profile=LISTING_PROFILE)
+        assert parser.parse_entries(LISTING_HTML, "source") == [
+            EntryEntity(
+                index=1,
+                title="First story",
+                total_points=1204,
+                total_comments=0,
+                source="source",
+                item_id=7,
+            ),
+            EntryEntity(
+                index=2,
+                title="Second story",
+                total_points=3,
+                total_comments=0,
+                source="source",
+                item_id=9,
+            ),
+        ]
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("12.", 12),
+            ("1,234 points", 1234),
+            ("16\xa0comments", 16),
+            ("discuss", None),
+        ],
+    )
+    def test_parse_number(self, text, expected):
+        assert parse_number(text) == expected
+
+    def test_compile_selector_is_cached(self):
+        assert compile_selector("li.story") is compile_selector("li.story")
+
+    def test_load_profiles(self, tmp_path):
+        path = tmp_path / "profiles.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "https://example.com/": {
+                        "row": "li.story",
+                        "title": "a.title",
+                        "score": "span.votes",
+                        "item_id_attribute": "data-id",
+                    }
+                }
+            )
+        )
+        assert load_profiles(str(path)) == {"https://example.com/": LISTING_PROFILE}
+
+    def test_get_entries(self, mocker):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = GenericCrawlerEntryAdapter(
+            logger=logger, profile=LISTING_PROFILE, max_pages=3
+        )
+        page = mocker.Mock(text=LISTING_HTML, status_code=200)
+        mock_requests = mocker.patch.object(crawler.session, "get", return_value=page)
+        entries = crawler.get_entries("https://example.com/")
+        # Without page parameter, the source has a single page
+        mock_requests.assert_called_once_with(
+            "https://example.com/", timeout=crawler.timeout
+        )
+        assert [entry.title for entry in entries] == ["First story", "Second story"]
+
+    def test_get_entries_positions_across_pages(self, mocker):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        profile = SelectorProfile(
+            row="li.story", title="a.title", page_parameter="page"
+        )
+        crawler = GenericCrawlerEntryAdapter(
+            logger=logger, profile=profile, max_pages=2
+        )
+        page = mocker.Mock(text=LISTING_HTML, status_code=200)
+        mocker.patch.object(crawler.session, "get", return_value=page)
+        entries = crawler.get_entries("https://example.com/")
+        assert [entry.index for entry in entries] == [1, 2, 3, 4, 5, 6]
+
+    def test_get_page_url_with_page_parameter(self):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        profile = SelectorProfile(row="li", title="a", page_parameter="page")
+        crawler = GenericCrawlerEntryAdapter(logger=logger, profile=profile)
+        page_url = crawler.get_page_url("https://example.com/?sort=top", 2)
+        assert page_url == "https://example.com/?sort=top&page=2"
@@ -0,0 +1,141 @@
+import json
+import logging
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.adapters import FileLoggerAdapter
+from src.adapters.hn_api import HackerNewsApiEntryAdapter
+from src.domain.entities import EntryEntity
+
+ITEMS = {
+    1: {"id": 1, "type": "story", "title": "First", "score": 10, "descendants": 3},
+    2: {"id": 2, "type": "job", "title": "Hiring", "score": 1},
+    3: {"id": 3, "type": "story", "title": "Third", "score": 30, "descendants": 0},
+    4: {"id": 4, "deleted": True},
+}
+
+
+class TestHackerNewsApiAdapter:
+    @pytest.fixture
+    def api_server(self):
+        requested_paths = Counter()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requested_paths[self.path] += 1
+                if self.path == "/v0/topstories.json":
+                    body = list(ITEMS)
+                elif self.path.startswith("/v0/item/"):
+                    item_id = int(self.path.split("/")[-1].removesuffix(".json"))
+                    body = ITEMS.get(item_id)
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}/v0", requested_paths
+        server.shutdown()
+        server.server_close()
+
+    def test_get_item_url(self):
+        item_url = HackerNewsApiEntryAdapter.get_item_url(
+            "https://hacker-news.firebaseio.com/v0/topstories.json", 42
+        )
+        assert item_url == "https://hacker-news.firebaseio.com/v0/item/42.json"
+
+    def test_get_entries(self, api_server):
+        api_url, _ = api_server
+        source = f"{api_url}/topstories.json"
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        adapter = HackerNewsApiEntryAdapter(logger=logger)
+        entries = adapter.get_entries(source)
+        assert entries == [
+            EntryEntity(
+                index=1,
+                title="First",
+                total_points=10,
+                total_comments=3,
+                source=source,
+                item_id=1,
+            ),
+            EntryEntity(
+                index=3,
+                title="Third",
+                total_points=30,
+                total_comments=0,
+                source=source,
+                item_id=3,
+            ),
+        ]
+
+    def test_get_entries_max_entries(self, api_server):
+        api_url, requested_paths = api_server
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        adapter = HackerNewsApiEntryAdapter(logger=logger, max_entries=1)
+        entries = adapter.get_entries(f"{api_url}/topstories.json")
+        assert len(entries) == 1
+        assert "/v0/item/2.json" not in requested_paths
+
+    def test_get_entries_item_cache(self, api_server):
+        api_url, requested_paths = api_server
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        adapter = HackerNewsApiEntryAdapter(logger=logger)
+        adapter.get_entries(f"{api_url}/topstories.json")
+        adapter.get_entries(f"{api_url}/topstories.json")
+        assert requested_paths["/v0/topstories.json"] == 2
+        assert requested_paths["/v0/item/1.json"] == 1
+
+    def test_get_entries_item_cache_expired(self, api_server):
+        api_url, requested_paths = api_server
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        adapter = HackerNewsApiEntryAdapter(logger=logger, item_ttl=0)
+        adapter.get_entries(f"{api_url}/topstories.json")
+        adapter.get_entries(f"{api_url}/topstories.json")
+        assert requested_paths["/v0/item/1.json"] == 2
+
+    def test_get_entries_unknown_source(self, api_server, mocker):
+        api_url, _ = api_server
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        mock_log_debug = mocker.patch.object(logger, "log_debug")
+        adapter = HackerNewsApiEntryAdapter(logger=logger)
+        assert adapter.get_entries(f"{api_url}/unknown.json") == []
+        mock_log_debug.assert_called_once()
+
+    def test_get_entries_item_cache_eviction(self, api_server):
+        api_url, _ = api_server
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        adapter = HackerNewsApiEntryAdapter(logger=logger, max_cached_items=2)
+        adapter.get_entries(f"{api_url}/topstories.json")
+        assert len(adapter.item_cache) == 2
+
+        adapter.item_ttl = 0
+        adapter.evict_items()
+        assert adapter.item_cache == {}
+
+    def test_get_entries_invalid_json(self, api_server, mocker):
+        api_url, _ = api_server
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        mock_log_debug = mocker.patch.object(logger, "log_debug")
+        adapter = HackerNewsApiEntryAdapter(logger=logger)
+        response = mocker.Mock(status_code=200)
+        response.json.side_effect = ValueError("Expecting value")
+        mocker.patch.object(adapter.session, "get", return_value=response)
+        assert adapter.get_entries(f"{api_url}/topstories.json") == []
+        assert "invalid JSON" in mock_log_debug.call_args.args[0]
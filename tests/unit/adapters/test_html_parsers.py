@@ -0,0 +1,110 @@
+import pytest
+
+from src.adapters.html_parsers import (
+    BeautifulSoupHtmlParser,
+    HtmlParserEnum,
+    SelectolaxHtmlParser,
+    StreamingHtmlParser,
+)
+from src.domain.entities import EntryEntity
+
+BACKENDS = {
+    HtmlParserEnum.html_parser: None,
+    HtmlParserEnum.lxml: "lxml",
+    HtmlParserEnum.selectolax: "selectolax",
+    HtmlParserEnum.streaming: None,
+}
+
+
+class TestHtmlParsers:
+    @pytest.fixture
+    def html_text(self):
+        with open("./tests/unit/adapters/hn_fixture.html", "r") as file:
+            return file.read()
+
+    @pytest.fixture(params=list(BACKENDS), ids=[backend.value for backend in BACKENDS])
+    def parser(self, request):
+        module = BACKENDS[request.param]
+        if module is not None:
+            pytest.importorskip(module)
+        return request.param.create_parser()
+
+    def test_create_parser(self):
+        parser = HtmlParserEnum.html_parser.create_parser()
+        assert parser == BeautifulSoupHtmlParser(features="html.parser")
+
+    def test_parse_entries(self, parser, html_text):
+        entries = parser.parse_entries(html_text, "source")
+        assert len(entries) == 30
+        assert entries[0] == EntryEntity(
+            index=1,
+            title="The Backrooms of the Internet Archive",
+            total_points=121,
+            total_comments=16,
+            source="source",
+            item_id=40618079,
+        )
+
+    def test_parse_entries_fidelity(self, parser, html_text):
+        reference_parser = BeautifulSoupHtmlParser(features="html.parser")
+        expected_entries = reference_parser.parse_entries(html_text, "source")
+        assert parser.parse_entries(html_text, "source") == expected_entries
+
+    def test_parse_entries_empty_page(self, parser):
+        assert parser.parse_entries("<html></html>", "source") == []
+
+    @pytest.mark.parametrize("chunk_size", [1, 97, 4096])
+    def test_streaming_parser_chunks(self, html_text, chunk_size):
+        chunks = [
+            html_text[position : position + chunk_size]
+            for position in range(0, len(html_text), chunk_size)
+        ]
+        entries = list(StreamingHtmlParser().iter_entries(chunks, "source"))
+        expected_entries = BeautifulSoupHtmlParser().parse_entries(html_text, "source")
+        assert entries == expected_entries
+
+    def test_streaming_parser_emits_entries_early(self, html_text):
+        first_row_end = html_text.index('<tr class="spacer"')
+        entries = StreamingHtmlParser().iter_entries(
+            [html_text[:first_row_end], html_text[first_row_end:]], "source"
+        )
+        assert next(entries).index == 1
+
+    def test_streaming_parser_incomplete_entry(self):
+        html_text = """<table><tr class="athing"><td><span class="rank">1.</span></td>
+            <td><span class="titleline"><a href="link">TITLE</a></span></td></tr>
+            <tr><td class="subtext"><span class="subline">
+            <a href="hide">hide</a></span></td></tr></table>"""
+        assert StreamingHtmlParser().parse_entries(html_text, "source") == []
+
+    @pytest.mark.parametrize(
+        "link_texts,expected",
+        [
+            (["user", "1 hour ago", "hide", "16\xa0comments"], 16),
+            (["user", "hide", "1\xa0comment"], 1),
+            (["user", "hide", "discuss"], 0),
+            (["user", "hide"], None),
+        ],
+    )
+    def test_parse_comments(self, link_texts, expected):
+        assert BeautifulSoupHtmlParser.parse_comments(link_texts) == expected
+
+    def test_selectolax_parser_missing(self, mocker):
+        mocker.patch("src.adapters.html_parsers.LexborHTMLParser", None)
+        with pytest.raises(ImportError):
+            SelectolaxHtmlParser()
+
+    def test_parse_entries_without_item_id(self, parser, html_text):
+        html_text = html_text.replace(
+            '<tr class="athing" id="40618079">', '<tr class="athing">'
+        )
+        entries = parser.parse_entries(html_text, "source")
+        assert entries[0].item_id is None
+        assert entries[1].item_id == 40618459
+
+    def test_beautifulsoup_parser_unavailable(self, mocker):
+        mocker.patch(
+            "src.adapters.html_parsers.builder_registry.lookup", return_value=None
+        )
+        with pytest.raises(ImportError, match="lxml is required"):
+            BeautifulSoupHtmlParser(features="lxml")
@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field
+
+from src.adapters.http_cache import CachedPage, HttpCache
+
+
+@dataclass
+class Response:
+    text: str
+    status_code: int
+    headers: dict = field(default_factory=dict)
+
+
+class TestHttpCache:
+    def test_fetch_stores_page(self, tmp_path, mocker):
+        cache = HttpCache(directory=str(tmp_path))
+        session = mocker.Mock()
+        session.get.return_value = Response(
+            text="body", status_code=200, headers={"ETag": '"v1"'}
+        )
+        page = cache.fetch(session, "url", (1, 1))
+        assert page.text == "body"
+        session.get.assert_called_once_with("url", timeout=(1, 1), headers={})
+        record = cache.load("url")
+        assert record["etag"] == '"v1"'
+        assert record["body"] == "body"
+
+    def test_fetch_not_modified(self, tmp_path, mocker):
+        cache = HttpCache(directory=str(tmp_path))
+        session = mocker.Mock()
+        session.get.side_effect = [
+            Response(
+                text="body",
+                status_code=200,
+                headers={"ETag": '"v1"', "Last-Modified": "date"},
+            ),
+            Response(text="", status_code=304),
+        ]
+        cache.fetch(session, "url", (1, 1))
+        page = cache.fetch(session, "url", (1, 1))
+        assert page == CachedPage(text="body")
+        session.get.assert_called_with(
+            "url",
+            timeout=(1, 1),
+            headers={"If-None-Match": '"v1"', "If-Modified-Since": "date"},
+        )
+
+    def test_fetch_fresh_page_skips_network(self, tmp_path, mocker):
+        cache = HttpCache(directory=str(tmp_path), ttl=60)
+        session = mocker.Mock()
+        session.get.return_value = Response(text="body", status_code=200)
+        cache.fetch(session, "url", (1, 1))
+        page = cache.fetch(session, "url", (1, 1))
+        assert page.text == "body"
+        session.get.assert_called_once()
+
+    def test_fetch_error_is_not_stored(self, tmp_path, mocker):
+        cache = HttpCache(directory=str(tmp_path))
+        session = mocker.Mock()
+        session.get.return_value = Response(text="error", status_code=500)
+        page = cache.fetch(session, "url", (1, 1))
+        assert page.status_code == 500
+        assert cache.load("url") is None
@@ -0,0 +1,28 @@
+from src.adapters import HostRateLimiter, PoliteSession
+from src.adapters.http_session import RETRY_STATUS_CODES, create_session
+
+
+class TestHttpSession:
+    def test_create_session(self):
+        session = create_session(pool_size=4, retries=5, backoff_factor=1)
+        adapter = session.get_adapter("https://news.ycombinator.com/")
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 5
+        assert adapter.max_retries.backoff_factor == 1
+        assert adapter.max_retries.status_forcelist == RETRY_STATUS_CODES
+
+    def test_create_session_mounts_http(self):
+        session = create_session()
+        assert session.get_adapter("http://localhost/") is session.get_adapter(
+            "https://localhost/"
+        )
+
+    def test_create_session_rate_limiter(self):
+        rate_limiter = HostRateLimiter()
+        session = create_session(rate_limiter=rate_limiter)
+        assert isinstance(session, PoliteSession)
+        assert session.rate_limiter is rate_limiter
+        # The 429 and 5xx are retried by the session, through the limiter
+        adapter = session.get_adapter("https://news.ycombinator.com/")
+        assert not adapter.max_retries.status_forcelist
+        assert not adapter.max_retries.respect_retry_after_header
@@ -0,0 +1,113 @@
+import json
+import logging
+import threading
+from datetime import datetime
+
+from src.adapters import QueueFileLoggerAdapter
+from src.domain.entities import (
+    FilterEntity,
+    FilterFieldEnum,
+    FilterOperatorEnum,
+    LogEntity,
+)
+
+LOG_ENTITY = LogEntity(
+    request_time=datetime.now(),
+    filter=FilterEntity(
+        field=FilterFieldEnum.number_of_words, operator=FilterOperatorEnum.lt, value=5
+    ),
+    order=None,
+)
+
+
+class TestQueueFileLoggerAdapter:
+    def test_log_request(self, tmp_path):
+        filename = tmp_path / "app.log"
+        logger = QueueFileLoggerAdapter(log_level=logging.INFO, filename=str(filename))
+        logger.log_request(LOG_ENTITY)
+        logger.log_debug("ignored")
+        logger.close()
+        lines = filename.read_text().splitlines()
+        assert len(lines) == 1
+        assert lines[0].startswith("INFO - ")
+        assert lines[0].endswith(
+            " - Filter by: number_of_words lt 5 - Order by: Nothing"
+        )
+
+    def test_log_json_lines(self, tmp_path):
+        filename = tmp_path / "app.log"
+        logger = QueueFileLoggerAdapter(
+            log_level=logging.DEBUG, filename=str(filename), json_lines=True
+        )
+        logger.log_request(LOG_ENTITY)
+        logger.log_debug("message")
+        logger.close()
+        documents = [json.loads(line) for line in filename.read_text().splitlines()]
+        assert documents[0]["level"] == "INFO"
+        assert documents[0]["filter"] == "number_of_words lt 5"
+        assert documents[0]["order"] == "Nothing"
+        assert documents[1]["level"] == "DEBUG"
+        assert documents[1]["message"] == "message"
+        assert "filter" not in documents[1]
+
+    def test_size_rotation(self, tmp_path):
+        filename = tmp_path / "app.log"
+        logger = QueueFileLoggerAdapter(
+            log_level=logging.DEBUG,
+            filename=str(filename),
+            max_bytes=200,
+            backup_count=2,
+        )
+        for number in range(20):
+            logger.log_debug(f"message {number}")
+        logger.close()
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "app.log",
+            "app.log.1",
+            "app.log.2",
+        ]
+
+    def test_time_rotation(self, tmp_path):
+        logger = QueueFileLoggerAdapter(
+            log_level=logging.INFO,
+            filename=str(tmp_path / "app.log"),
+            when="midnight",
+            backup_count=7,
+        )
+        assert isinstance(logger.handler, logging.handlers.TimedRotatingFileHandler)
+        logger.close()
+
+    def test_does_not_write_on_the_caller_thread(self, tmp_path, mocker):
+        logger = QueueFileLoggerAdapter(
+            log_level=logging.INFO, filename=str(tmp_path / "app.log")
+        )
+        emit_threads = []
+        mocker.patch.object(
+            logger.handler,
+            "emit",
+            side_effect=lambda record: emit_threads.append(threading.current_thread()),
+        )
+        logger.log_request(LOG_ENTITY)
+        logger.close()
+        assert len(emit_threads) == 1
+        assert emit_threads[0] is not threading.current_thread()
+
+    def test_does_not_format_on_the_caller_thread(self, tmp_path, mocker):
+        logger = QueueFileLoggerAdapter(
+            log_level=logging.INFO, filename=str(tmp_path / "app.log")
+        )
+        mock_format = mocker.patch.object(logger.queue_handler, "format")
+        format_threads = []
+        mock_get_request_fields = mocker.patch.object(
+            QueueFileLoggerAdapter,
+            "get_request_fields",
+            side_effect=lambda log_entity: format_threads.append(
+                threading.current_thread()
+            )
+            or ("filter", "order"),
+        )
+        logger.log_request(LOG_ENTITY)
+        logger.close()
+        mock_format.assert_not_called()
+        mock_get_request_fields.assert_called_once_with(LOG_ENTITY)
+        assert format_threads[0] is not threading.current_thread()
@@ -0,0 +1,263 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+from requests import Response
+
+from src.adapters import (
+    HostRateLimiter,
+    PoliteSession,
+    RateLimitExceededError,
+    RobotsDisallowedError,
+)
+from src.adapters.rate_limiter import parse_retry_after
+
+ROBOTS_TXT = """User-agent: *
+Disallow: /private
+Crawl-delay: 2
+"""
+
+
+def build_response(status_code: int, text: str = "", headers: dict | None = None):
+    response = Response()
+    response.status_code = status_code
+    response._content = text.encode()
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeClock:
+    """Clock advanced by the sleeps, recording them."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self.lock = threading.Lock()
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.sleeps.append(seconds)
+
+
+class TestParseRetryAfter:
+    def test_parse_retry_after_seconds(self):
+        assert parse_retry_after("120") == 120
+
+    def test_parse_retry_after_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 28 <= seconds <= 30
+
+    @pytest.mark.parametrize("value", [None, "soon"])
+    def test_parse_retry_after_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestHostRateLimiter:
+    @pytest.fixture
+    def fake_clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def limiter(self, fake_clock):
+        return HostRateLimiter(
+            rate=2, burst=2, clock=fake_clock.clock, sleep=fake_clock.sleep
+        )
+
+    def test_acquire_burst_then_rate(self, limiter, fake_clock):
+        for _ in range(4):
+            limiter.acquire("https://a.com/page")
+        assert fake_clock.sleeps == [0.5, 1.0]
+
+    def test_acquire_refills(self, limiter, fake_clock):
+        for _ in range(2):
+            limiter.acquire("https://a.com/page")
+        fake_clock.now = 1.0
+        for _ in range(2):
+            limiter.acquire("https://a.com/page")
+        assert fake_clock.sleeps == []
+
+    def test_acquire_per_host(self, limiter, fake_clock):
+        for host in ["a.com", "b.com", "A.com", "b.com"]:
+            limiter.acquire(f"https://{host}/page")
+        assert fake_clock.sleeps == []
+
+    def test_acquire_shared_by_threads(self, fake_clock):
+        limiter = HostRateLimiter(
+            rate=10, burst=1, clock=fake_clock.clock, sleep=fake_clock.sleep
+        )
+        threads = [
+            threading.Thread(target=limiter.acquire, args=("https://a.com/",))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Each thread waits for its own slot
+        assert sorted(fake_clock.sleeps) == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+    def test_defer(self, limiter, fake_clock):
+        limiter.defer("https://a.com/page", 10)
+        limiter.acquire("https://a.com/other")
+        limiter.acquire("https://a.com/other")
+        limiter.acquire("https://b.com/page")
+        assert fake_clock.sleeps == [10, 10.5]
+
+    @pytest.mark.parametrize(("rate", "burst"), [(0, 1), (-1, 1), (1, 0)])
+    def test_invalid_rate(self, rate, burst):
+        with pytest.raises(ValueError):
+            HostRateLimiter(rate=rate, burst=burst)
+
+    def test_acquire_max_wait(self, limiter, fake_clock):
+        limiter.max_wait = 0.5
+        for _ in range(3):
+            limiter.acquire("https://a.com/page")
+        with pytest.raises(RateLimitExceededError):
+            limiter.acquire("https://a.com/page")
+        # The token of the failed request is given back
+        fake_clock.now = 1.0
+        limiter.acquire("https://a.com/page")
+        assert fake_clock.sleeps == [0.5]
+
+    def test_get_robots_cached(self, limiter, fake_clock, mocker):
+        fetch = mocker.Mock(return_value=build_response(200, ROBOTS_TXT))
+        robots = limiter.get_robots("https://a.com/page", fetch)
+        assert limiter.get_robots("https://a.com/other", fetch) is robots
+        fetch.assert_called_once_with("https://a.com/robots.txt")
+        assert not robots.can_fetch("*", "https://a.com/private/page")
+        assert robots.can_fetch("*", "https://a.com/page")
+
+        fake_clock.now = limiter.robots_ttl
+        assert limiter.get_robots("https://a.com/page", fetch) is not robots
+        assert fetch.call_count == 2
+
+    @pytest.mark.parametrize(
+        "response,allowed",
+        [
+            (build_response(404), True),
+            (build_response(403), False),
+            (requests.ConnectionError(), True),
+        ],
+    )
+    def test_get_robots_errors(self, limiter, mocker, response, allowed):
+        fetch = mocker.Mock(side_effect=[response])
+        robots = limiter.get_robots("https://a.com/page", fetch)
+        assert robots.can_fetch("*", "https://a.com/page") == allowed
+
+    def test_crawl_delay_lowers_rate(self, limiter, fake_clock, mocker):
+        fetch = mocker.Mock(return_value=build_response(200, ROBOTS_TXT))
+        limiter.get_robots("https://a.com/page", fetch)
+        for _ in range(3):
+            limiter.acquire("https://a.com/page")
+        assert fake_clock.sleeps == [2, 4]
+
+
+class TestPoliteSession:
+    @pytest.fixture
+    def fake_clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def session(self, fake_clock):
+        limiter = HostRateLimiter(
+            rate=1, burst=10, clock=fake_clock.clock, sleep=fake_clock.sleep
+        )
+        return PoliteSession(limiter, retries=2)
+
+    def test_request_robots_disallowed(self, session, mocker):
+        mock_request = mocker.patch.object(
+            requests.Session,
+            "request",
+            return_value=build_response(200, ROBOTS_TXT),
+        )
+        with pytest.raises(RobotsDisallowedError):
+            session.get("https://a.com/private")
+        session.get("https://a.com/page")
+        requested_urls = [call.args[1] for call in mock_request.call_args_list]
+        assert requested_urls == ["https://a.com/robots.txt", "https://a.com/page"]
+
+    def test_request_retry_after(self, session, fake_clock, mocker):
+        session.rate_limiter.respect_robots = False
+        mock_request = mocker.patch.object(
+            requests.Session,
+            "request",
+            side_effect=[
+                build_response(429, headers={"Retry-After": "30"}),
+                build_response(200, "page"),
+            ],
+        )
+        response = session.get("https://a.com/page")
+        assert response.text == "page"
+        assert mock_request.call_count == 2
+        assert fake_clock.sleeps == [30]
+
+    def test_request_retry_limit(self, session, mocker):
+        session.rate_limiter.respect_robots = False
+        mock_request = mocker.patch.object(
+            requests.Session, "request", return_value=build_response(429)
+        )
+        response = session.get("https://a.com/page")
+        assert response.status_code == 429
+        assert mock_request.call_count == 3
+
+    def test_request_retry_after_too_long(self, session, fake_clock, mocker):
+        session.rate_limiter.respect_robots = False
+        mock_request = mocker.patch.object(
+            requests.Session,
+            "request",
+            side_effect=[
+                build_response(429, headers={"Retry-After": "86400"}),
+                build_response(200, "page"),
+            ],
+        )
+        response = session.get("https://a.com/page")
+        assert response.status_code == 429
+        assert mock_request.call_count == 1
+        # The host is only paused during max_retry_after
+        session.get("https://a.com/page")
+        assert fake_clock.sleeps == [session.rate_limiter.max_retry_after]
+
+    def test_request_retry_server_error(self, session, fake_clock, mocker):
+        session.rate_limiter.respect_robots = False
+        mock_request = mocker.patch.object(
+            requests.Session,
+            "request",
+            side_effect=[build_response(502), build_response(200, "page")],
+        )
+        response = session.get("https://a.com/page")
+        assert response.text == "page"
+        assert mock_request.call_count == 2
+        # The retry backs off through the limiter
+        assert fake_clock.sleeps == [1]
+
+    def test_request_503_retry_after_too_long(self, session, fake_clock, mocker):
+        session.rate_limiter.respect_robots = False
+        session.rate_limiter.max_retry_after = 0.5
+        mock_request = mocker.patch.object(
+            requests.Session,
+            "request",
+            side_effect=[
+                build_response(503, headers={"Retry-After": "4"}),
+                build_response(200, "page"),
+            ],
+        )
+        response = session.get("https://a.com/page")
+        assert response.status_code == 503
+        assert mock_request.call_count == 1
+        session.get("https://a.com/page")
+        assert fake_clock.sleeps == [0.5]
+
+    def test_request_post_not_retried(self, session, mocker):
+        session.rate_limiter.respect_robots = False
+        mock_request = mocker.patch.object(
+            requests.Session, "request", return_value=build_response(503)
+        )
+        response = session.post("https://a.com/page")
+        assert response.status_code == 503
+        assert mock_request.call_count == 1
@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.adapters import SingleFlightEntryAdapter
+from src.domain.entities import EntryEntity
+from src.domain.repositories import EntryRepositoryInterface
+
+NUMBER_OF_CALLERS = 5
+
+
+class Interrupted(BaseException):
+    """Interruption of the leader, as a KeyboardInterrupt."""
+
+
+class SlowEntryRepository(EntryRepositoryInterface):
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+        self.release = threading.Event()
+
+    def get_entries(self, source):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return [
+            EntryEntity(
+                index=1,
+                title="title",
+                total_points=1,
+                total_comments=1,
+                source=source,
+            )
+        ]
+
+
+class TestSingleFlightEntryAdapter:
+    def run_concurrently(self, adapter, repository, source="source"):
+        barrier = threading.Barrier(NUMBER_OF_CALLERS)
+
+        def call():
+            barrier.wait()
+            return adapter.get_entries(source)
+
+        with ThreadPoolExecutor(max_workers=NUMBER_OF_CALLERS) as executor:
+            futures = [executor.submit(call) for _ in range(NUMBER_OF_CALLERS)]
+            # Let every caller reach the in-flight fetch before it completes
+            time.sleep(0.1)
+            repository.release.set()
+        return futures
+
+    def test_get_entries_coalesced(self):
+        repository = SlowEntryRepository()
+        adapter = SingleFlightEntryAdapter(repository=repository)
+        futures = self.run_concurrently(adapter, repository)
+        results = [future.result() for future in futures]
+        assert repository.calls == 1
+        assert all(result == results[0] for result in results)
+        assert len({id(result) for result in results}) == NUMBER_OF_CALLERS
+        assert adapter.in_flight == {}
+
+    def test_get_entries_error_shared(self):
+        repository = SlowEntryRepository(error=ValueError("boom"))
+        adapter = SingleFlightEntryAdapter(repository=repository)
+        futures = self.run_concurrently(adapter, repository)
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+        assert repository.calls == 1
+
+    def test_get_entries_sequential_calls(self):
+        repository = SlowEntryRepository()
+        repository.release.set()
+        adapter = SingleFlightEntryAdapter(repository=repository)
+        adapter.get_entries("source")
+        adapter.get_entries("source")
+        assert repository.calls == 2
+
+    def test_get_entries_interrupted_leader_releases_followers(self):
+        repository = SlowEntryRepository(error=Interrupted())
+        adapter = SingleFlightEntryAdapter(repository=repository)
+        errors = []
+
+        def call():
+            try:
+                adapter.get_entries("source")
+            except Interrupted as exception:
+                errors.append(exception)
+
+        # Daemon threads, so a follower blocked forever can't hang the tests
+        leader = threading.Thread(target=call, daemon=True)
+        leader.start()
+        while not adapter.in_flight:
+            time.sleep(0.01)
+        follower = threading.Thread(target=call, daemon=True)
+        follower.start()
+        time.sleep(0.1)
+        repository.release.set()
+        leader.join(timeout=2)
+        follower.join(timeout=2)
+        assert not follower.is_alive()
+        assert len(errors) == 2
+        assert repository.calls == 1
@@ -0,0 +1,56 @@
+from src.adapters import CachedEntryAdapter
+from src.domain.entities import EntryEntity
+from src.domain.repositories import EntryRepositoryInterface
+
+
+class FakeEntryRepository(EntryRepositoryInterface):
+    def __init__(self, failing=False):
+        self.sources = []
+        self.failing = failing
+
+    def get_entries(self, source):
+        self.sources.append(source)
+        if self.failing:
+            return []
+        return [
+            EntryEntity(
+                index=1,
+                title="title",
+                total_points=1,
+                total_comments=1,
+                source=source,
+            )
+        ]
+
+
+class TestCachedEntryAdapter:
+    def test_get_entries_snapshot(self):
+        repository = FakeEntryRepository()
+        adapter = CachedEntryAdapter(repository=repository, ttl=60)
+        first_entries = adapter.get_entries("source")
+        first_entries.clear()
+        assert len(adapter.get_entries("source")) == 1
+        adapter.get_entries("other source")
+        assert repository.sources == ["source", "other source"]
+
+    def test_get_entries_expired(self):
+        repository = FakeEntryRepository()
+        adapter = CachedEntryAdapter(repository=repository, ttl=0)
+        adapter.get_entries("source")
+        adapter.get_entries("source")
+        assert repository.sources == ["source", "source"]
+
+    def test_max_sources(self):
+        repository = FakeEntryRepository()
+        adapter = CachedEntryAdapter(repository=repository, max_sources=2)
+        for source in ["first", "second", "third"]:
+            adapter.get_entries(source)
+        assert list(adapter.snapshots) == ["second", "third"]
+
+    def test_get_entries_empty_not_kept(self):
+        repository = FakeEntryRepository(failing=True)
+        adapter = CachedEntryAdapter(repository=repository, ttl=60)
+        assert adapter.get_entries("source") == []
+        assert adapter.get_entries("source") == []
+        assert repository.sources == ["source", "source"]
+        assert not adapter.snapshots
@@ -0,0 +1,32 @@
+from src.adapters import SourceRegistry
+
+
+class TestSourceRegistry:
+    def test_get_repository(self, mocker):
+        default_repository = mocker.Mock()
+        example_repository = mocker.Mock()
+        example_news_repository = mocker.Mock()
+        registry = SourceRegistry(default_factory=lambda: default_repository)
+        registry.register("https://example.com/", lambda: example_repository)
+        registry.register("https://example.com/news", lambda: example_news_repository)
+        assert registry.get_repository("https://other.com/") is default_repository
+        assert registry.get_repository("https://example.com/new") is example_repository
+        assert (
+            registry.get_repository("https://example.com/news?p=2")
+            is example_news_repository
+        )
+
+    def test_repositories_are_shared(self, mocker):
+        factory = mocker.Mock()
+        registry = SourceRegistry(default_factory=mocker.Mock())
+        registry.register("https://example.com/", factory)
+        registry.get_repository("https://example.com/a")
+        registry.get_repository("https://example.com/b")
+        factory.assert_called_once_with()
+
+    def test_get_entries(self, mocker):
+        repository = mocker.Mock()
+        registry = SourceRegistry(default_factory=lambda: repository)
+        entries = registry.get_entries("source")
+        repository.get_entries.assert_called_once_with("source")
+        assert entries == repository.get_entries.return_value
@@ -0,0 +1,77 @@
+import pytest
+
+from benchmarks.common import BenchResult, NullLogger, StaticSession
+from benchmarks.run import check_baseline, check_thresholds
+from benchmarks.synthetic import generate_entries, generate_hn_page
+from src.adapters import HackerNewsCrawlerEntryAdapter, HtmlParserEnum
+
+BACKENDS = {
+    HtmlParserEnum.html_parser: None,
+    HtmlParserEnum.lxml: "lxml",
+    HtmlParserEnum.selectolax: "selectolax",
+    HtmlParserEnum.streaming: None,
+}
+
+
+class TestSynthetic:
+    @pytest.fixture(params=list(BACKENDS), ids=[backend.value for backend in BACKENDS])
+    def parser(self, request):
+        module = BACKENDS[request.param]
+        if module is not None:
+            pytest.importorskip(module)
+        return request.param.create_parser()
+
+    def test_generate_hn_page_is_parsed_by_every_backend(self, parser):
+        crawler = HackerNewsCrawlerEntryAdapter(
+            logger=NullLogger(),
+            parser=parser,
+            session=StaticSession(generate_hn_page(50)),
+        )
+        entries = crawler.get_entries("https://news.ycombinator.com/")
+        assert [entry.index for entry in entries] == list(range(1, 51))
+        assert all(entry.item_id is not None for entry in entries)
+        assert any(entry.total_comments == 0 for entry in entries)
+        assert any("&" in entry.title for entry in entries)
+
+    def test_generate_hn_page_is_seeded(self):
+        assert generate_hn_page(20) == generate_hn_page(20)
+        assert generate_hn_page(20) != generate_hn_page(20, seed=1)
+
+    def test_generate_entries(self):
+        entries = generate_entries(100)
+        assert len(entries) == 100
+        assert entries == generate_entries(100)
+
+
+class TestRun:
+    @pytest.fixture
+    def results(self):
+        return [
+            BenchResult(
+                name="filter/python/1000", group="filter", size=1000, seconds=1
+            ),
+            BenchResult(
+                name="order/python/1000", group="order", size=1000, seconds=0.5
+            ),
+        ]
+
+    def test_check_thresholds(self, results):
+        thresholds = {
+            "filter/python/1000": {"min_throughput": 2000},
+            "order/python/1000": {"min_throughput": 2000},
+            "unknown/python/1000": {"min_throughput": 2000},
+        }
+        regressions = check_thresholds(results, thresholds)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("filter/python/1000")
+
+    def test_check_baseline(self, results):
+        baseline = {
+            "results": [
+                {"name": "filter/python/1000", "throughput": 1200},
+                {"name": "order/python/1000", "throughput": 4000},
+            ]
+        }
+        regressions = check_baseline(results, baseline, tolerance=0.25)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("order/python/1000")
@@ -0,0 +1,176 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.adapters import FileLoggerAdapter
+from src.controllers.api import DEFAULT_SOURCE, create_app
+from src.domain.entities import EntryEntity
+from src.domain.repositories import EntryRepositoryInterface
+
+
+class FakeEntryRepository(EntryRepositoryInterface):
+    def __init__(self):
+        self.calls = 0
+
+    def get_entries(self, source):
+        self.calls += 1
+        return [
+            EntryEntity(
+                index=1,
+                title="one two three",
+                total_points=10,
+                total_comments=50,
+                source=source,
+            ),
+            EntryEntity(
+                index=2,
+                title="one",
+                total_points=30,
+                total_comments=5,
+                source=source,
+            ),
+        ]
+
+
+ALLOWED_SOURCES = [DEFAULT_SOURCE, "source", "s"]
+
+
+class TestApiController:
+    @pytest.fixture
+    def entry_repository(self):
+        return FakeEntryRepository()
+
+    @pytest.fixture
+    def logger(self, mocker):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        mocker.patch.object(logger, "log_request")
+        mocker.patch.object(logger, "log_debug")
+        return logger
+
+    @pytest.fixture
+    def client(self, entry_repository, logger):
+        app = create_app(
+            entry_repository=entry_repository,
+            logger_repository=logger,
+            allowed_sources=ALLOWED_SOURCES,
+        )
+        with TestClient(app) as client:
+            yield client
+
+    def test_get_entries(self, client):
+        response = client.get("/entries", params={"source": "source"})
+        assert response.status_code == 200
+        assert [entry["index"] for entry in response.json()] == [1, 2]
+        assert response.json()[0]["source"] == "source"
+
+    def test_get_entries_filter_and_order(self, client):
+        response = client.get(
+            "/entries",
+            params={"filter": "number_of_words:lt:5", "order": "points:desc"},
+        )
+        assert response.status_code == 200
+        assert [entry["index"] for entry in response.json()] == [2, 1]
+
+    @pytest.mark.parametrize(
+        "params,expected_indexes",
+        [
+            ({"filter": ["number_of_words:gt:1", "number_of_points:gt:20"]}, []),
+            (
+                {
+                    "filter": ["number_of_words:gt:1", "number_of_points:gt:20"],
+                    "match_any": True,
+                },
+                [1, 2],
+            ),
+        ],
+    )
+    def test_get_entries_multiple_filters(self, client, params, expected_indexes):
+        response = client.get("/entries", params=params)
+        assert [entry["index"] for entry in response.json()] == expected_indexes
+
+    def test_get_entries_multiple_orders_and_limit(self, client):
+        response = client.get(
+            "/entries",
+            params={"order": ["comments:asc", "points:desc"], "limit": 1},
+        )
+        assert [entry["index"] for entry in response.json()] == [2]
+
+    def test_get_entries_shared_snapshot(self, entry_repository, logger):
+        app = create_app(
+            entry_repository=entry_repository,
+            logger_repository=logger,
+            allowed_sources=ALLOWED_SOURCES,
+        )
+        with TestClient(app) as client:
+            client.get("/entries", params={"order": "points:desc"})
+            client.get("/entries", params={"order": "comments:desc"})
+            client.get("/entries", params={"filter": "number_of_words:gt:1"})
+        assert entry_repository.calls == 1
+        # The pending logs are flushed when the application shuts down
+        assert logger.log_request.call_count == 3
+
+    def test_get_entries_concurrent_requests(self, logger):
+        entry_repository = FakeEntryRepository()
+        release = threading.Event()
+        get_entries = entry_repository.get_entries
+
+        def slow_get_entries(source):
+            release.wait(timeout=5)
+            return get_entries(source)
+
+        entry_repository.get_entries = slow_get_entries
+        app = create_app(
+            entry_repository=entry_repository,
+            logger_repository=logger,
+            allowed_sources=ALLOWED_SOURCES,
+        )
+        with TestClient(app) as client:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(client.get, "/entries", params={"source": "s"})
+                    for _ in range(4)
+                ]
+                time.sleep(0.2)
+                release.set()
+            responses = [future.result() for future in futures]
+        assert all(response.status_code == 200 for response in responses)
+        assert entry_repository.calls == 1
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"filter": "number_of_words:lt"},
+            {"filter": "unknown:lt:5"},
+            {"filter": "number_of_words:lt:five"},
+            {"order": "points"},
+            {"order": "points:up"},
+            {"limit": "-1"},
+        ],
+    )
+    def test_get_entries_invalid_query(self, client, params):
+        response = client.get("/entries", params=params)
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "http://169.254.169.254/latest/meta-data/",
+            "https://news.ycombinator.com.example.com/",
+        ],
+    )
+    def test_get_entries_source_not_allowed(self, entry_repository, logger, source):
+        app = create_app(entry_repository=entry_repository, logger_repository=logger)
+        with TestClient(app) as client:
+            response = client.get("/entries", params={"source": source})
+        assert response.status_code == 403
+        assert entry_repository.calls == 0
+
+    def test_create_app_registry(self, logger):
+        app = create_app(logger_repository=logger)
+        with TestClient(app) as client:
+            response = client.get("/entries", params={"source": "https://example.com/"})
+        assert response.status_code == 403
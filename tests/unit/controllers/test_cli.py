@@ -1,10 +1,18 @@
 import pytest
+import typer
 
+from src.adapters import HackerNewsCrawlerEntryAdapter, HtmlParserEnum, SourceRegistry
 from src.controllers.cli import main
 from src.domain.dtos.get_entries import GetEntriesDto
-from src.domain.entities.filter import FilterEntity, FilterFieldEnum, FilterOperatorEnum
+from src.domain.entities.filter import (
+    FilterAndEntity,
+    FilterEntity,
+    FilterFieldEnum,
+    FilterOperatorEnum,
+    FilterOrEntity,
+)
 from src.domain.entities.order import OrderEntity, OrderFieldEnum, OrderDirectionEnum
-from src.usecases import GetEntries
+from src.usecases import GetEntries, GetItemHistory, PollingSchedule
 
 
 class TestCliController:
@@ -29,7 +37,7 @@ class TestCliController:
             ),
             (
                 None,
-                (FilterFieldEnum.number_of_words, FilterOperatorEnum.lt, 5),
+                ["number_of_words:lt:5"],
                 None,
                 None,
                 GetEntriesDto(
@@ -45,7 +53,7 @@ class TestCliController:
             (
                 None,
                 None,
-                (OrderFieldEnum.comments, OrderDirectionEnum.desc),
+                ["comments:desc"],
                 None,
                 GetEntriesDto(
                     source="https://news.ycombinator.com/",
@@ -82,3 +90,161 @@ class TestCliController:
         else:
             main(source, filter, order, verbose)
         mock_usecase.assert_called_once_with(dto=expected_usecase_dto_params)
+
+    def test_cli_controller_api_source(self, mocker):
+        mock_usecase = mocker.patch.object(GetEntries, "execute", return_value=[])
+        mock_api_adapter = mocker.patch("src.controllers.cli.HackerNewsApiEntryAdapter")
+        source = "https://hacker-news.firebaseio.com/v0/topstories.json"
+        main(source, max_entries=10)
+        mock_api_adapter.assert_called_once()
+        assert mock_api_adapter.call_args.kwargs["max_entries"] == 10
+        mock_usecase.assert_called_once_with(
+            dto=GetEntriesDto(source=source, filter=None, order=None)
+        )
+
+    @pytest.mark.parametrize(
+        ("match_any", "expected_filter_cls"),
+        [(False, FilterAndEntity), (True, FilterOrEntity)],
+    )
+    def test_cli_controller_multiple_filters(
+        self, match_any, expected_filter_cls, mocker
+    ):
+        mock_usecase = mocker.patch.object(GetEntries, "execute")
+        filters = ["number_of_words:gt:5", "number_of_comments ge 10"]
+        main(filter=filters, match_any=match_any)
+        expected_filter = expected_filter_cls(
+            filters=[
+                FilterEntity(
+                    field=FilterFieldEnum.number_of_words,
+                    operator=FilterOperatorEnum.gt,
+                    value=5,
+                ),
+                FilterEntity(
+                    field=FilterFieldEnum.number_of_comments,
+                    operator=FilterOperatorEnum.ge,
+                    value=10,
+                ),
+            ]
+        )
+        mock_usecase.assert_called_once_with(
+            dto=GetEntriesDto(
+                source="https://news.ycombinator.com/",
+                filter=expected_filter,
+                order=None,
+            )
+        )
+
+    def test_cli_controller_invalid_filter(self, mocker):
+        mocker.patch.object(GetEntries, "execute")
+        with pytest.raises(typer.BadParameter):
+            main(filter=["number_of_words:lt"])
+
+    def test_cli_controller_multiple_orders_and_limit(self, mocker):
+        mock_usecase = mocker.patch.object(GetEntries, "execute")
+        main(order=["comments:desc", "points desc"], limit=20)
+        mock_usecase.assert_called_once_with(
+            dto=GetEntriesDto(
+                source="https://news.ycombinator.com/",
+                filter=None,
+                order=[
+                    OrderEntity(
+                        field=OrderFieldEnum.comments,
+                        direction=OrderDirectionEnum.desc,
+                    ),
+                    OrderEntity(
+                        field=OrderFieldEnum.points, direction=OrderDirectionEnum.desc
+                    ),
+                ],
+                limit=20,
+            )
+        )
+
+    def test_cli_controller_invalid_order(self, mocker):
+        mocker.patch.object(GetEntries, "execute")
+        with pytest.raises(typer.BadParameter):
+            main(order=["comments:down"])
+
+    def test_cli_controller_snapshot(self, mocker):
+        mocker.patch.object(GetEntries, "execute", return_value=[])
+        mock_snapshot_adapter = mocker.patch("src.controllers.cli.DBSnapshotAdapter")
+        mock_get_entries = mocker.spy(GetEntries, "__init__")
+        main(snapshot=True)
+        mock_snapshot_adapter.assert_called_once_with()
+        assert mock_get_entries.call_args.args[3] == mock_snapshot_adapter.return_value
+
+    def test_cli_controller_history(self, mocker):
+        mock_usecase = mocker.patch.object(GetEntries, "execute")
+        mock_history = mocker.patch.object(GetItemHistory, "execute", return_value=[])
+        mocker.patch("src.controllers.cli.DBSnapshotAdapter")
+        main(history=42)
+        mock_history.assert_called_once_with(42)
+        mock_usecase.assert_not_called()
+
+    def test_cli_controller_since_last(self, mocker):
+        mock_usecase = mocker.patch.object(GetEntries, "execute", return_value=[])
+        mock_snapshot_adapter = mocker.patch("src.controllers.cli.DBSnapshotAdapter")
+        main(since_last=True)
+        mock_snapshot_adapter.assert_called_once_with()
+        assert mock_usecase.call_args.kwargs["dto"].since_last
+
+    def test_cli_controller_profiles(self, mocker, tmp_path):
+        path = tmp_path / "profiles.json"
+        path.write_text('{"https://lobste.rs/": {"row": "li.story", "title": "a"}}')
+        mock_usecase = mocker.patch.object(GetEntries, "execute", return_value=[])
+        mock_generic_adapter = mocker.patch(
+            "src.controllers.cli.GenericCrawlerEntryAdapter"
+        )
+        mock_get_entries = mocker.spy(GetEntries, "__init__")
+        main(source="https://lobste.rs/", profiles=str(path))
+        mock_generic_adapter.assert_called_once()
+        assert mock_generic_adapter.call_args.kwargs["profile"].row == "li.story"
+        assert mock_get_entries.call_args.args[1] == mock_generic_adapter.return_value
+        mock_usecase.assert_called_once()
+
+    def test_cli_controller_multiple_sources(self, mocker):
+        mock_usecase = mocker.patch.object(GetEntries, "execute", return_value=[])
+        mock_get_entries = mocker.spy(GetEntries, "__init__")
+        main(source=["https://news.ycombinator.com/", "https://lobste.rs/"], deadline=5)
+        dto = mock_usecase.call_args.kwargs["dto"]
+        assert dto.source == ["https://news.ycombinator.com/", "https://lobste.rs/"]
+        assert dto.deadline == 5
+        assert isinstance(mock_get_entries.call_args.args[1], SourceRegistry)
+
+    def test_cli_controller_watch(self, mocker):
+        mock_get_entries = mocker.patch.object(
+            HackerNewsCrawlerEntryAdapter, "get_entries", return_value=[]
+        )
+        mocker.patch.object(PollingSchedule, "get_delay", return_value=0)
+        main(watch=60, max_runs=3)
+        assert mock_get_entries.call_count == 3
+
+    def test_cli_controller_watch_invalid(self):
+        with pytest.raises(typer.BadParameter):
+            main(watch=0)
+
+    def test_cli_controller_parser_unavailable(self, mocker):
+        mocker.patch.object(
+            HtmlParserEnum, "create_parser", side_effect=ImportError("lxml is required")
+        )
+        with pytest.raises(typer.BadParameter, match="lxml is required"):
+            main(parser=HtmlParserEnum.lxml)
+
+    def test_cli_controller_negative_limit(self, mocker):
+        mock_usecase = mocker.patch.object(GetEntries, "execute", return_value=[])
+        with pytest.raises(typer.BadParameter):
+            main(limit=-1)
+        mock_usecase.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "options", [{"max_entries": 0}, {"max_entries": -5}, {"max_pages": 0}]
+    )
+    def test_cli_controller_invalid_max_entries_or_pages(self, options, mocker):
+        mock_usecase = mocker.patch.object(GetEntries, "execute", return_value=[])
+        with pytest.raises(typer.BadParameter):
+            main(**options)
+        mock_usecase.assert_not_called()
+
+    @pytest.mark.parametrize("rate", [0, -1])
+    def test_cli_controller_invalid_rate(self, rate):
+        with pytest.raises(typer.BadParameter):
+            main(rate=rate)
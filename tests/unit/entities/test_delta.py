@@ -0,0 +1,70 @@
+from src.domain.entities import (
+    EntryChangeEnum,
+    EntryDeltaEntity,
+    EntryEntity,
+    get_entries_delta,
+)
+
+
+def build_entry(index, title, total_points, total_comments, item_id=None):
+    return EntryEntity(
+        index=index,
+        title=title,
+        total_points=total_points,
+        total_comments=total_comments,
+        source="source",
+        item_id=item_id,
+    )
+
+
+def test_get_entries_delta():
+    unchanged = build_entry(1, "unchanged", 10, 1, item_id=1)
+    moved = build_entry(2, "moved", 10, 1, item_id=2)
+    updated = build_entry(3, "updated", 10, 1, item_id=3)
+    previous_entries = [unchanged, updated, moved]
+    entries = [
+        unchanged,
+        build_entry(2, "moved", 10, 1, item_id=2),
+        build_entry(3, "updated", 12, 1, item_id=3),
+        build_entry(4, "new", 1, 0, item_id=4),
+    ]
+    assert get_entries_delta([], entries) == [
+        EntryDeltaEntity(entry=entry, change=EntryChangeEnum.new) for entry in entries
+    ]
+    previous_entries = [
+        unchanged,
+        build_entry(2, "updated", 10, 1, item_id=3),
+        build_entry(3, "moved", 10, 1, item_id=2),
+    ]
+    assert get_entries_delta(previous_entries, entries) == [
+        EntryDeltaEntity(
+            entry=entries[1], change=EntryChangeEnum.moved, previous=previous_entries[2]
+        ),
+        EntryDeltaEntity(
+            entry=entries[2],
+            change=EntryChangeEnum.updated,
+            previous=previous_entries[1],
+        ),
+        EntryDeltaEntity(entry=entries[3], change=EntryChangeEnum.new),
+    ]
+
+
+def test_get_entries_delta_keyed_by_item_id():
+    previous_entries = [build_entry(1, "old title", 10, 1, item_id=1)]
+    entries = [build_entry(1, "new title", 10, 1, item_id=1)]
+    assert get_entries_delta(previous_entries, entries) == [
+        EntryDeltaEntity(
+            entry=entries[0],
+            change=EntryChangeEnum.updated,
+            previous=previous_entries[0],
+        )
+    ]
+
+
+def test_get_entries_delta_falls_back_on_title():
+    previous_entries = [build_entry(1, "title", 10, 1)]
+    assert get_entries_delta(previous_entries, [build_entry(1, "title", 10, 1)]) == []
+    assert (
+        get_entries_delta(previous_entries, [build_entry(1, "title", 10, 1, item_id=7)])
+        == []
+    )
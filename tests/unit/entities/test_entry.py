@@ -1,4 +1,4 @@
-from src.domain.entities import EntryEntity
+from src.domain.entities import EntryEntity, count_words
 
 
 def test_create_entry_entity():
@@ -7,3 +7,58 @@ def test_create_entry_entity():
     )
     assert entity is not None
     assert type(entity) == EntryEntity
+
+
+def test_entry_word_count_excludes_symbols():
+    entity = EntryEntity(
+        index=1,
+        title="This is - a self-explained example",
+        total_points=12,
+        total_comments=13,
+        source="source",
+    )
+    assert entity.word_count == 5
+
+
+def test_count_words():
+    assert count_words("") == 0
+    assert count_words("  Show HN:  a   tool | 2024 ") == 5
+    assert count_words("- | --") == 0
+
+
+def test_entry_points_per_comment():
+    entity = EntryEntity(
+        index=1, title="title", total_points=12, total_comments=4, source="source"
+    )
+    assert entity.points_per_comment == 3
+
+
+def test_entry_points_per_comment_without_comments():
+    entity = EntryEntity(
+        index=1, title="title", total_points=12, total_comments=0, source="source"
+    )
+    assert entity.points_per_comment == 12
+
+
+def test_entry_derived_fields_are_not_compared():
+    entity = EntryEntity(
+        index=1, title="a b", total_points=1, total_comments=1, source="source"
+    )
+    other = EntryEntity(
+        index=1, title="a b", total_points=1, total_comments=1, source="source"
+    )
+    other.word_count = 0
+    assert entity == other
+
+
+def test_entry_is_slotted_and_interns_the_source():
+    sources = ["".join(["https://news.ycombinator.com", "/"]) for _ in range(2)]
+    assert sources[0] is not sources[1]
+    entity = EntryEntity(
+        index=1, title="title", total_points=12, total_comments=4, source=sources[0]
+    )
+    other = EntryEntity(
+        index=2, title="title", total_points=12, total_comments=4, source=sources[1]
+    )
+    assert not hasattr(entity, "__dict__")
+    assert entity.source is other.source
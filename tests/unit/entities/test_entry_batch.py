@@ -0,0 +1,39 @@
+from src.domain.entities import EntryBatch, EntryEntity, FilterFieldEnum, OrderFieldEnum
+
+ENTRIES = [
+    EntryEntity(
+        index=1, title="a title", total_points=12, total_comments=4, source="source"
+    ),
+    EntryEntity(
+        index=2,
+        title="an - other one",
+        total_points=3,
+        total_comments=0,
+        source="source",
+    ),
+]
+
+
+def test_entry_batch_round_trip():
+    batch = EntryBatch.from_entries(ENTRIES)
+    assert len(batch) == 2
+    assert list(batch.word_counts) == [2, 3]
+    assert batch.to_entries() == ENTRIES
+
+
+def test_entry_batch_take():
+    batch = EntryBatch.from_entries(ENTRIES).take([1])
+    assert batch.to_entries() == ENTRIES[1:]
+
+
+def test_entry_batch_shares_the_sources():
+    batch = EntryBatch.from_entries(ENTRIES)
+    assert batch.sources[0] is batch.sources[1]
+
+
+def test_entry_batch_getters():
+    batch = EntryBatch.from_entries(ENTRIES)
+    assert batch.get_filter_getters()[FilterFieldEnum.number_of_words](1) == 3
+    order_getters = batch.get_order_getters()
+    assert order_getters[OrderFieldEnum.points_per_comment](0) == 3
+    assert order_getters[OrderFieldEnum.points_per_comment](1) == 3
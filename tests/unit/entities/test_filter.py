@@ -1,6 +1,31 @@
 import operator
 
-from src.domain.entities import FilterEntity, FilterFieldEnum, FilterOperatorEnum
+import pytest
+
+from src.domain.entities import (
+    EntryEntity,
+    FilterAndEntity,
+    FilterEntity,
+    FilterFieldEnum,
+    FilterNotEntity,
+    FilterOperatorEnum,
+    FilterOrEntity,
+    combine_filters,
+)
+
+ENTRY = EntryEntity(
+    index=3,
+    title="This is a title",
+    total_points=100,
+    total_comments=20,
+    source="source",
+)
+WORDS_GT_3 = FilterEntity(
+    field=FilterFieldEnum.number_of_words, operator=FilterOperatorEnum.gt, value=3
+)
+COMMENTS_GE_50 = FilterEntity(
+    field=FilterFieldEnum.number_of_comments, operator=FilterOperatorEnum.ge, value=50
+)
 
 
 def test_create_filter_entity():
@@ -19,3 +44,64 @@ def test_filter_operator_convert():
     filter_operator = filter_operator_enum.convert_str_to_operator()
 
     assert filter_operator == operator.lt
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["number_of_words:gt:3", "number_of_words gt 3", " number_of_words : gt : 3 "],
+)
+def test_filter_from_string(text):
+    assert FilterEntity.from_string(text) == WORDS_GT_3
+
+
+@pytest.mark.parametrize(
+    "text", ["number_of_words:gt", "words:gt:3", "number_of_words:gt:many"]
+)
+def test_filter_from_string_invalid(text):
+    with pytest.raises(ValueError):
+        FilterEntity.from_string(text)
+
+
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        (WORDS_GT_3, True),
+        (COMMENTS_GE_50, False),
+        (FilterAndEntity(filters=[WORDS_GT_3, COMMENTS_GE_50]), False),
+        (FilterOrEntity(filters=[WORDS_GT_3, COMMENTS_GE_50]), True),
+        (FilterNotEntity(filter=COMMENTS_GE_50), True),
+        (
+            FilterAndEntity(
+                filters=[WORDS_GT_3, FilterNotEntity(filter=COMMENTS_GE_50)]
+            ),
+            True,
+        ),
+    ],
+)
+def test_filter_expression_compile(expression, expected):
+    predicate = expression.compile()
+    assert predicate(ENTRY) is expected
+
+
+def test_filter_expression_compile_field_getters():
+    predicate = WORDS_GT_3.compile({FilterFieldEnum.number_of_words: len})
+    assert predicate("four")
+    assert not predicate("one")
+
+
+def test_filter_expression_str():
+    expression = FilterOrEntity(
+        filters=[WORDS_GT_3, FilterNotEntity(filter=COMMENTS_GE_50)]
+    )
+    assert str(expression) == ("(number_of_words gt 3 OR NOT number_of_comments ge 50)")
+
+
+def test_combine_filters():
+    assert combine_filters([]) is None
+    assert combine_filters([WORDS_GT_3]) == WORDS_GT_3
+    assert combine_filters([WORDS_GT_3, COMMENTS_GE_50]) == FilterAndEntity(
+        filters=[WORDS_GT_3, COMMENTS_GE_50]
+    )
+    assert combine_filters([WORDS_GT_3, COMMENTS_GE_50], match_any=True) == (
+        FilterOrEntity(filters=[WORDS_GT_3, COMMENTS_GE_50])
+    )
@@ -1,4 +1,18 @@
-from src.domain.entities import OrderDirectionEnum, OrderEntity, OrderFieldEnum
+import pytest
+
+from src.domain.entities import (
+    EntryEntity,
+    OrderDirectionEnum,
+    OrderEntity,
+    OrderFieldEnum,
+    combine_orders,
+    get_orders,
+)
+
+COMMENTS_DESC = OrderEntity(
+    field=OrderFieldEnum.comments, direction=OrderDirectionEnum.desc
+)
+POINTS_ASC = OrderEntity(field=OrderFieldEnum.points, direction=OrderDirectionEnum.asc)
 
 
 def test_create_filter_entity():
@@ -8,3 +22,38 @@ def test_create_filter_entity():
     entity = OrderEntity(field=order_field_enum, direction=order_direction_enum)
     assert entity is not None
     assert type(entity) == OrderEntity
+
+
+@pytest.mark.parametrize("text", ["comments:desc", "comments desc"])
+def test_order_from_string(text):
+    assert OrderEntity.from_string(text) == COMMENTS_DESC
+
+
+@pytest.mark.parametrize("text", ["comments", "words:desc", "comments:down"])
+def test_order_from_string_invalid(text):
+    with pytest.raises(ValueError):
+        OrderEntity.from_string(text)
+
+
+def test_order_str():
+    assert str(COMMENTS_DESC) == "comments desc"
+
+
+def test_get_orders():
+    assert get_orders(None) == []
+    assert get_orders(COMMENTS_DESC) == [COMMENTS_DESC]
+    assert get_orders([COMMENTS_DESC, POINTS_ASC]) == [COMMENTS_DESC, POINTS_ASC]
+
+
+def test_combine_orders():
+    assert combine_orders([]) is None
+    assert combine_orders([COMMENTS_DESC]) == COMMENTS_DESC
+    assert combine_orders([COMMENTS_DESC, POINTS_ASC]) == [COMMENTS_DESC, POINTS_ASC]
+
+
+def test_order_points_per_comment_getter():
+    getter = OrderFieldEnum.points_per_comment.get_entry_getter()
+    entry = EntryEntity(
+        index=1, title="title", total_points=10, total_comments=4, source="source"
+    )
+    assert getter(entry) == 2.5
@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+
+from src.domain.dtos.get_entries import GetEntriesDto
+from src.domain.entities.entry import EntryEntity
+from src.domain.entities.filter import FilterEntity, FilterFieldEnum, FilterOperatorEnum
+from src.domain.entities.order import OrderDirectionEnum, OrderEntity, OrderFieldEnum
+from src.domain.repositories import (
+    AsyncEntryRepositoryInterface,
+    AsyncLogRepositoryInterface,
+)
+from src.usecases import AsyncGetEntries
+
+
+class FakeAsyncEntryRepository(AsyncEntryRepositoryInterface):
+    def __init__(self, entries):
+        self.entries = entries
+
+    async def get_entries(self, source):
+        await asyncio.sleep(0)
+        return self.entries
+
+
+class FakeAsyncLogRepository(AsyncLogRepositoryInterface):
+    def __init__(self):
+        self.requests = []
+        self.messages = []
+
+    async def log_request(self, log_entity):
+        await asyncio.sleep(0)
+        self.requests.append(log_entity)
+
+    async def log_debug(self, message):
+        self.messages.append(message)
+
+
+class TestAsyncGetEntriesUsecase:
+    def build_entry(self, title, total_points):
+        return EntryEntity(
+            index=1,
+            title=title,
+            total_points=total_points,
+            total_comments=12,
+            source="source",
+        )
+
+    def test_get_entries_nominal(self):
+        entries = [self.build_entry("title", 12)]
+        logger = FakeAsyncLogRepository()
+        usecase = AsyncGetEntries(FakeAsyncEntryRepository(entries), logger)
+        get_entries_dto = GetEntriesDto(source="source", filter=None, order=None)
+
+        async def run():
+            result = await usecase.execute(dto=get_entries_dto)
+            await usecase.wait_pending_logs()
+            return result
+
+        assert asyncio.run(run()) == entries
+        assert len(logger.requests) == 1
+        assert not usecase.pending_logs
+
+    def test_get_entries_filter_and_order(self):
+        short_entry = self.build_entry("title", 100)
+        low_entry = self.build_entry("title title", 10)
+        high_entry = self.build_entry("title title", 50)
+        logger = FakeAsyncLogRepository()
+        usecase = AsyncGetEntries(
+            FakeAsyncEntryRepository([short_entry, low_entry, high_entry]), logger
+        )
+        get_entries_dto = GetEntriesDto(
+            source="source",
+            filter=FilterEntity(
+                field=FilterFieldEnum.number_of_words,
+                operator=FilterOperatorEnum.gt,
+                value=1,
+            ),
+            order=OrderEntity(
+                field=OrderFieldEnum.points, direction=OrderDirectionEnum.desc
+            ),
+        )
+
+        async def run():
+            result = await usecase.execute(dto=get_entries_dto)
+            await usecase.wait_pending_logs()
+            return result
+
+        assert asyncio.run(run()) == [high_entry, low_entry]
+        assert logger.requests[0].filter == get_entries_dto.filter
+
+    def test_get_entries_concurrent_sources(self):
+        entries = [self.build_entry("title", 12)]
+        usecase = AsyncGetEntries(
+            FakeAsyncEntryRepository(entries), FakeAsyncLogRepository()
+        )
+
+        async def run():
+            results = await asyncio.gather(
+                usecase.execute(GetEntriesDto(source="a", filter=None, order=None)),
+                usecase.execute(GetEntriesDto(source="b", filter=None, order=None)),
+            )
+            await usecase.wait_pending_logs()
+            return results
+
+        assert asyncio.run(run()) == [entries, entries]
+
+    def test_get_entries_multiple_sources(self):
+        class SourcesRepository(AsyncEntryRepositoryInterface):
+            async def get_entries(self, source):
+                if source == "failing":
+                    raise ConnectionError(source)
+                if source == "slow":
+                    await asyncio.sleep(10)
+                return [EntryEntity(1, source, 1, 1, source)]
+
+        logger = FakeAsyncLogRepository()
+        usecase = AsyncGetEntries(SourcesRepository(), logger)
+        get_entries_dto = GetEntriesDto(
+            source=["first", "failing", "slow", "second"],
+            filter=None,
+            order=None,
+            deadline=0.2,
+        )
+
+        async def run():
+            result = await usecase.execute(dto=get_entries_dto)
+            await usecase.wait_pending_logs()
+            return result
+
+        result = asyncio.run(run())
+        assert [entry.source for entry in result] == ["first", "second"]
+        assert any("failing" in message for message in logger.messages)
+        assert any("slow" in message for message in logger.messages)
+
+    def test_get_entries_since_last_not_supported(self):
+        usecase = AsyncGetEntries(
+            FakeAsyncEntryRepository([]), FakeAsyncLogRepository()
+        )
+        get_entries_dto = GetEntriesDto(
+            source="source", filter=None, order=None, since_last=True
+        )
+        with pytest.raises(ValueError):
+            asyncio.run(usecase.execute(dto=get_entries_dto))
+
+    def test_get_entries_late_source_not_fetched_again(self):
+        class SlowRepository(AsyncEntryRepositoryInterface):
+            def __init__(self):
+                self.sources = []
+
+            async def get_entries(self, source):
+                self.sources.append(source)
+                await asyncio.sleep(0.3)
+                return [EntryEntity(1, source, 1, 1, source)]
+
+        repository = SlowRepository()
+        usecase = AsyncGetEntries(repository, FakeAsyncLogRepository())
+        get_entries_dto = GetEntriesDto(
+            source=["slow"], filter=None, order=None, deadline=0.2
+        )
+
+        async def run():
+            first_result = await usecase.execute(dto=get_entries_dto)
+            # The late fetch is awaited, not started again
+            second_result = await usecase.execute(dto=get_entries_dto)
+            await usecase.wait_pending_logs()
+            return first_result, second_result
+
+        first_result, second_result = asyncio.run(run())
+        assert first_result == []
+        assert [entry.source for entry in second_result] == ["slow"]
+        assert repository.sources == ["slow"]
+        assert not usecase.pending_fetches
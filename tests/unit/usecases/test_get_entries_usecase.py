@@ -1,12 +1,26 @@
 import logging
+import threading
+import time
 
 from _pytest.scope import HIGH_SCOPES
 import pytest
 
-from src.adapters import HackerNewsCrawlerEntryAdapter, FileLoggerAdapter
+from src.adapters import (
+    DBSnapshotAdapter,
+    HackerNewsCrawlerEntryAdapter,
+    FileLoggerAdapter,
+)
 from src.domain.dtos.get_entries import GetEntriesDto
 from src.domain.entities.entry import EntryEntity
-from src.domain.entities.filter import FilterEntity, FilterFieldEnum, FilterOperatorEnum
+from src.domain.entities.entry_batch import EntryBatch
+from src.domain.entities.filter import (
+    FilterAndEntity,
+    FilterEntity,
+    FilterFieldEnum,
+    FilterNotEntity,
+    FilterOperatorEnum,
+    FilterOrEntity,
+)
 from src.domain.entities.order import OrderDirectionEnum, OrderEntity, OrderFieldEnum
 from src.usecases.get_entries_usecase import GetEntries
 
@@ -114,3 +128,315 @@ class TestGetEntriesUsecase:
         assert len(result) == len(returned_entries)
         # Assert the result is ordered descending
         assert result == [entry_high_points, entry_middle_points, entry_low_points]
+
+    def test_get_entries_filter_expression(self, mocker):
+        matching_entry = EntryEntity(
+            index=1,
+            title="one two three four five six",
+            total_points=12,
+            total_comments=10,
+            source="source",
+        )
+        few_comments_entry = EntryEntity(
+            index=2,
+            title="one two three four five six",
+            total_points=12,
+            total_comments=2,
+            source="source",
+        )
+        short_entry = EntryEntity(
+            index=3,
+            title="one",
+            total_points=12,
+            total_comments=10,
+            source="source",
+        )
+        returned_entries = [matching_entry, few_comments_entry, short_entry]
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(crawler, "get_entries", return_value=returned_entries)
+        mocker.patch.object(logger, "log_debug")
+        mocker.patch.object(logger, "log_request")
+        usecase = GetEntries(entry_repository=crawler, logger_repository=logger)
+        filter = FilterAndEntity(
+            filters=[
+                FilterEntity(
+                    field=FilterFieldEnum.number_of_words,
+                    operator=FilterOperatorEnum.gt,
+                    value=5,
+                ),
+                FilterEntity(
+                    field=FilterFieldEnum.number_of_comments,
+                    operator=FilterOperatorEnum.ge,
+                    value=10,
+                ),
+            ]
+        )
+        get_entries_dto = GetEntriesDto(source="source", filter=filter, order=None)
+        result = usecase.execute(dto=get_entries_dto)
+        assert result == [matching_entry]
+
+    def build_entries(self, values: list[tuple[int, int]]) -> list[EntryEntity]:
+        return [
+            EntryEntity(
+                index=index,
+                title="title",
+                total_points=total_points,
+                total_comments=total_comments,
+                source="source",
+            )
+            for index, (total_comments, total_points) in enumerate(values, start=1)
+        ]
+
+    def test_order_entries_multiple_keys(self):
+        entries = self.build_entries([(5, 10), (20, 1), (5, 30), (20, 1)])
+        order = [
+            OrderEntity(
+                field=OrderFieldEnum.comments, direction=OrderDirectionEnum.desc
+            ),
+            OrderEntity(field=OrderFieldEnum.points, direction=OrderDirectionEnum.desc),
+        ]
+        result = GetEntries.order_entries(entries, order)
+        assert [entry.index for entry in result] == [2, 4, 3, 1]
+
+    def test_order_entries_tiebreak_on_index(self):
+        entries = list(reversed(self.build_entries([(5, 10), (5, 10), (5, 10)])))
+        order = OrderEntity(
+            field=OrderFieldEnum.points, direction=OrderDirectionEnum.asc
+        )
+        result = GetEntries.order_entries(entries, order)
+        assert [entry.index for entry in result] == [1, 2, 3]
+
+    @pytest.mark.parametrize("limit", [0, 1, 3, 10, 100])
+    def test_order_entries_top_k(self, limit):
+        entries = self.build_entries(
+            [(comments % 7, comments % 5) for comments in range(50)]
+        )
+        order = [
+            OrderEntity(
+                field=OrderFieldEnum.comments, direction=OrderDirectionEnum.desc
+            ),
+            OrderEntity(field=OrderFieldEnum.points, direction=OrderDirectionEnum.asc),
+        ]
+        result = GetEntries.order_entries(entries, order, limit=limit)
+        assert result == GetEntries.order_entries(entries, order)[:limit]
+
+    def test_get_entries_limit_without_order(self, mocker):
+        returned_entries = self.build_entries([(1, 1), (2, 2), (3, 3)])
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(crawler, "get_entries", return_value=returned_entries)
+        mocker.patch.object(logger, "log_debug")
+        mocker.patch.object(logger, "log_request")
+        usecase = GetEntries(entry_repository=crawler, logger_repository=logger)
+        get_entries_dto = GetEntriesDto(
+            source="source", filter=None, order=None, limit=2
+        )
+        result = usecase.execute(dto=get_entries_dto)
+        assert result == returned_entries[:2]
+
+    @pytest.mark.parametrize(
+        "order",
+        [
+            None,
+            OrderEntity(field=OrderFieldEnum.points, direction=OrderDirectionEnum.desc),
+        ],
+    )
+    def test_limit_entries_negative(self, order):
+        with pytest.raises(ValueError):
+            GetEntries.limit_entries(self.build_entries([(1, 1)]), order, -1)
+
+    def test_filter_batch_matches_filter_entries(self):
+        entries = self.build_entries(
+            [(comments % 7, comments % 5) for comments in range(50)]
+        )
+        filter = FilterOrEntity(
+            [
+                FilterEntity(
+                    field=FilterFieldEnum.number_of_comments,
+                    operator=FilterOperatorEnum.gt,
+                    value=4,
+                ),
+                FilterNotEntity(
+                    FilterEntity(
+                        field=FilterFieldEnum.number_of_points,
+                        operator=FilterOperatorEnum.ge,
+                        value=2,
+                    )
+                ),
+            ]
+        )
+        batch = EntryBatch.from_entries(entries)
+        result = GetEntries.filter_batch(batch, filter)
+        assert result.to_entries() == GetEntries.filter_entries(entries, filter)
+
+    @pytest.mark.parametrize("limit", [None, 0, 3, 100])
+    def test_order_batch_matches_order_entries(self, limit):
+        entries = self.build_entries(
+            [(comments % 7, comments % 5) for comments in range(50)]
+        )
+        order = [
+            OrderEntity(
+                field=OrderFieldEnum.points_per_comment,
+                direction=OrderDirectionEnum.desc,
+            ),
+            OrderEntity(field=OrderFieldEnum.points, direction=OrderDirectionEnum.asc),
+        ]
+        batch = EntryBatch.from_entries(entries)
+        result = GetEntries.order_batch(batch, order, limit=limit)
+        assert result.to_entries() == GetEntries.order_entries(entries, order, limit)
+
+    def test_get_entries_saves_snapshot(self, mocker):
+        returned_entries = self.build_entries([(1, 1), (2, 2)])
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        snapshot_repository = mocker.Mock()
+        mocker.patch.object(crawler, "get_entries", return_value=returned_entries)
+        mocker.patch.object(logger, "log_debug")
+        mocker.patch.object(logger, "log_request")
+        usecase = GetEntries(
+            entry_repository=crawler,
+            logger_repository=logger,
+            snapshot_repository=snapshot_repository,
+        )
+        get_entries_dto = GetEntriesDto(
+            source="source", filter=None, order=None, limit=1
+        )
+        usecase.execute(dto=get_entries_dto)
+        snapshot_repository.save_snapshot.assert_called_once_with(
+            "source", returned_entries, crawled_at=mocker.ANY
+        )
+
+    def test_get_entries_since_last(self, mocker, tmp_path):
+        first_entries = self.build_entries([(1, 1), (2, 2)])
+        second_entries = self.build_entries([(1, 1), (3, 2), (4, 4)])
+        for entry in first_entries + second_entries:
+            entry.title = f"title {entry.index}"
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(
+            crawler, "get_entries", side_effect=[first_entries, second_entries]
+        )
+        mocker.patch.object(logger, "log_debug")
+        mocker.patch.object(logger, "log_request")
+        usecase = GetEntries(
+            entry_repository=crawler,
+            logger_repository=logger,
+            snapshot_repository=DBSnapshotAdapter(db_path=str(tmp_path / "app.db")),
+        )
+        get_entries_dto = GetEntriesDto(
+            source="source", filter=None, order=None, since_last=True
+        )
+        assert usecase.execute(dto=get_entries_dto) == first_entries
+        assert usecase.execute(dto=get_entries_dto) == second_entries[1:]
+
+    def test_get_entries_since_last_failed_crawl(self, mocker, tmp_path):
+        entries = self.build_entries([(1, 1), (2, 2)])
+        for entry in entries:
+            entry.title = f"title {entry.index}"
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        # The crawler returns no entry when the fetch fails
+        mocker.patch.object(crawler, "get_entries", side_effect=[entries, [], entries])
+        mocker.patch.object(logger, "log_debug")
+        mocker.patch.object(logger, "log_request")
+        snapshot_repository = DBSnapshotAdapter(db_path=str(tmp_path / "app.db"))
+        usecase = GetEntries(
+            entry_repository=crawler,
+            logger_repository=logger,
+            snapshot_repository=snapshot_repository,
+        )
+        get_entries_dto = GetEntriesDto(
+            source="source", filter=None, order=None, since_last=True
+        )
+        assert usecase.execute(dto=get_entries_dto) == entries
+        assert usecase.execute(dto=get_entries_dto) == []
+        assert usecase.execute(dto=get_entries_dto) == []
+        assert snapshot_repository.get_last_snapshot("source") == entries
+
+    def test_get_entries_since_last_without_snapshot_repository(self):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        usecase = GetEntries(entry_repository=crawler, logger_repository=logger)
+        get_entries_dto = GetEntriesDto(
+            source="source", filter=None, order=None, since_last=True
+        )
+        with pytest.raises(ValueError):
+            usecase.execute(dto=get_entries_dto)
+
+    def test_get_entries_multiple_sources(self, mocker):
+        def get_entries(source):
+            if source == "failing":
+                raise ConnectionError(source)
+            time.sleep(5 if source == "slow" else 0.2)
+            return (
+                self.build_entries([(1, 1)])
+                if source == "first"
+                else [
+                    EntryEntity(
+                        index=1,
+                        title="title",
+                        total_points=5,
+                        total_comments=1,
+                        source=source,
+                    )
+                ]
+            )
+
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(crawler, "get_entries", side_effect=get_entries)
+        mock_log_debug = mocker.patch.object(logger, "log_debug")
+        mocker.patch.object(logger, "log_request")
+        usecase = GetEntries(entry_repository=crawler, logger_repository=logger)
+        get_entries_dto = GetEntriesDto(
+            source=["first", "failing", "slow", "second"],
+            filter=None,
+            order=OrderEntity(
+                field=OrderFieldEnum.points, direction=OrderDirectionEnum.desc
+            ),
+            deadline=1,
+        )
+        start = time.monotonic()
+        result = usecase.execute(dto=get_entries_dto)
+        # The sources are fetched concurrently, and the slow one is not waited for
+        assert time.monotonic() - start < 1.5
+        assert [entry.source for entry in result] == ["second", "source"]
+        messages = [call.args[0] for call in mock_log_debug.call_args_list]
+        assert any("failing" in message for message in messages)
+        assert any("slow" in message for message in messages)
+
+    def test_get_entries_late_source_not_fetched_again(self, mocker):
+        release = threading.Event()
+        calls = []
+
+        def get_entries(source):
+            calls.append((source, threading.current_thread().daemon))
+            if source == "slow":
+                release.wait(timeout=5)
+            return [
+                EntryEntity(
+                    index=1,
+                    title=source,
+                    total_points=1,
+                    total_comments=1,
+                    source=source,
+                )
+            ]
+
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(crawler, "get_entries", side_effect=get_entries)
+        mocker.patch.object(logger, "log_debug")
+        mocker.patch.object(logger, "log_request")
+        usecase = GetEntries(entry_repository=crawler, logger_repository=logger)
+        get_entries_dto = GetEntriesDto(
+            source=["fast", "slow"], filter=None, order=None, deadline=0.1
+        )
+        for _ in range(2):
+            result = usecase.execute(dto=get_entries_dto)
+            assert [entry.source for entry in result] == ["fast"]
+        release.set()
+        # The late source is fetched once, in a daemon thread
+        assert calls.count(("slow", True)) == 1
+        assert calls.count(("fast", True)) == 2
@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from src.domain.entities import (
+    EntryBatch,
+    EntryEntity,
+    FilterAndEntity,
+    FilterEntity,
+    FilterFieldEnum,
+    FilterNotEntity,
+    FilterOperatorEnum,
+    FilterOrEntity,
+    OrderDirectionEnum,
+    OrderEntity,
+    OrderFieldEnum,
+)
+from src.usecases import GetEntries, vectorized
+
+pytest.importorskip("numpy")
+
+WORDS = ["Show", "HN:", "-", "a", "tool", "|", "for", "Rust", "2024"]
+
+FILTERS = [
+    FilterEntity(field=FilterFieldEnum.number_of_words, operator=operator, value=value)
+    for operator in FilterOperatorEnum
+    for value in (0, 3, 5)
+] + [
+    FilterOrEntity(
+        [
+            FilterAndEntity(
+                [
+                    FilterEntity(
+                        field=FilterFieldEnum.number_of_points,
+                        operator=FilterOperatorEnum.ge,
+                        value=50,
+                    ),
+                    FilterEntity(
+                        field=FilterFieldEnum.index,
+                        operator=FilterOperatorEnum.lt,
+                        value=500,
+                    ),
+                ]
+            ),
+            FilterNotEntity(
+                FilterEntity(
+                    field=FilterFieldEnum.number_of_comments,
+                    operator=FilterOperatorEnum.gt,
+                    value=2,
+                )
+            ),
+        ]
+    ),
+    FilterAndEntity([]),
+    FilterOrEntity([]),
+]
+
+ORDERS = [
+    OrderEntity(field=field, direction=direction)
+    for field in OrderFieldEnum
+    for direction in OrderDirectionEnum
+] + [
+    [
+        OrderEntity(field=OrderFieldEnum.comments, direction=OrderDirectionEnum.desc),
+        OrderEntity(
+            field=OrderFieldEnum.points_per_comment, direction=OrderDirectionEnum.asc
+        ),
+    ]
+]
+
+
+@pytest.fixture
+def entries():
+    generator = random.Random(42)
+    return [
+        EntryEntity(
+            index=generator.randint(1, 1000),
+            title=" ".join(generator.choices(WORDS, k=generator.randint(0, 8))),
+            total_points=generator.randint(0, 100),
+            total_comments=generator.randint(0, 10),
+            source="source",
+        )
+        for _ in range(2000)
+    ]
+
+
+class TestVectorized:
+
+    @pytest.mark.parametrize("filter", FILTERS, ids=str)
+    def test_filter_entries_matches_python(self, entries, filter):
+        predicate = filter.compile()
+        expected = [entry for entry in entries if predicate(entry)]
+        assert vectorized.filter_entries(entries, filter) == expected
+
+    @pytest.mark.parametrize("order", ORDERS, ids=str)
+    @pytest.mark.parametrize("limit", [None, -1, 0, 10, 5000])
+    def test_order_entries_matches_python(self, entries, order, limit):
+        key = GetEntries.get_order_key(order)
+        expected = sorted(entries, key=key)
+        if limit is not None:
+            expected = expected[: max(limit, 0)]
+        assert vectorized.order_entries(entries, order, limit) == expected
+
+    def test_batch_matches_python(self, entries):
+        batch = EntryBatch.from_entries(entries)
+        filter, order = FILTERS[-3], ORDERS[-1]
+        expected = GetEntries.order_entries(
+            GetEntries.filter_entries(entries, filter), order, 20
+        )
+        result = vectorized.order_batch(
+            vectorized.filter_batch(batch, filter), order, 20
+        )
+        assert result.to_entries() == expected
+
+    def test_get_entries_switches_above_threshold(self, entries, mocker, monkeypatch):
+        order = ORDERS[-1]
+        expected = GetEntries.order_entries(entries, order)
+        spy = mocker.spy(vectorized, "order_entries")
+        monkeypatch.setattr(vectorized, "VECTORIZE_THRESHOLD", len(entries))
+        assert GetEntries.order_entries(entries, order) == expected
+        assert spy.call_count == 1
+        GetEntries.order_entries(entries[:-1], order)
+        assert spy.call_count == 1
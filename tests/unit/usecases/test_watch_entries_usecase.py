@@ -0,0 +1,171 @@
+import logging
+
+import pytest
+
+from src.adapters import (
+    DBSnapshotAdapter,
+    FileLoggerAdapter,
+    HackerNewsCrawlerEntryAdapter,
+)
+from src.domain.dtos.get_entries import GetEntriesDto
+from src.domain.entities.entry import EntryEntity
+from src.domain.entities.filter import (
+    FilterEntity,
+    FilterFieldEnum,
+    FilterOperatorEnum,
+)
+from src.usecases import GetEntries, PollingSchedule, WatchEntries
+
+
+def build_entries(points: list[int]) -> list[EntryEntity]:
+    return [
+        EntryEntity(
+            index=index,
+            title=f"title {index}",
+            total_points=total_points,
+            total_comments=1,
+            source="source",
+            item_id=index,
+        )
+        for index, total_points in enumerate(points, start=1)
+    ]
+
+
+class TestPollingSchedule:
+    def test_update_backoff(self):
+        schedule = PollingSchedule(interval=10)
+        assert schedule.update(0) == 15
+        assert schedule.update(0) == 22.5
+        for _ in range(10):
+            schedule.update(0)
+        assert schedule.interval == 80
+
+    def test_update_speedup(self):
+        schedule = PollingSchedule(interval=10)
+        assert schedule.update(0.5) == 5
+        assert schedule.update(0.5) == 2.5
+        assert schedule.update(0.5) == 2.5
+
+    def test_update_low_churn(self):
+        schedule = PollingSchedule(interval=10)
+        assert schedule.update(0.05) == 10
+
+    @pytest.mark.parametrize(("random_value", "expected"), [(0, 9), (0.5, 10), (1, 11)])
+    def test_get_delay_jitter(self, random_value, expected):
+        schedule = PollingSchedule(interval=10, jitter=0.1)
+        assert schedule.get_delay(random_value) == pytest.approx(expected)
+
+
+class TestWatchEntriesUsecase:
+    @pytest.fixture
+    def logger(self, mocker):
+        logger = FileLoggerAdapter(log_level=logging.INFO)
+        mocker.patch.object(logger, "log_debug")
+        mocker.patch.object(logger, "log_request")
+        return logger
+
+    def test_watch_entries(self, logger, mocker):
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(
+            crawler,
+            "get_entries",
+            side_effect=[
+                build_entries([1, 2, 3]),
+                build_entries([1, 2, 3]),
+                build_entries([5, 2, 3]),
+            ],
+        )
+        sleep = mocker.Mock()
+        on_entries = mocker.Mock()
+        watcher = WatchEntries(
+            GetEntries(crawler, logger),
+            PollingSchedule(interval=10),
+            sleep=sleep,
+            get_random=lambda: 0.5,
+        )
+        dto = GetEntriesDto(source="source", filter=None, order=None)
+        watcher.execute(dto, on_entries=on_entries, max_runs=3)
+
+        # Unchanged, then churning: the interval backs off, then speeds up
+        assert [call.args[0] for call in sleep.call_args_list] == [10, 15]
+        assert watcher.schedule.interval == 7.5
+        deltas = [call.args[1] for call in on_entries.call_args_list]
+        assert [len(delta) for delta in deltas] == [3, 0, 1]
+
+    def test_watch_entries_failure(self, logger, mocker):
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(
+            crawler,
+            "get_entries",
+            side_effect=[ConnectionError("down"), build_entries([1])],
+        )
+        sleep = mocker.Mock()
+        on_entries = mocker.Mock()
+        watcher = WatchEntries(
+            GetEntries(crawler, logger),
+            PollingSchedule(interval=10),
+            sleep=sleep,
+            get_random=lambda: 0.5,
+        )
+        dto = GetEntriesDto(source="source", filter=None, order=None)
+        watcher.execute(dto, on_entries=on_entries, max_runs=2)
+
+        sleep.assert_called_once_with(15)
+        on_entries.assert_called_once()
+        assert "down" in logger.log_debug.call_args_list[0].args[0]
+
+    def test_watch_entries_churn_of_crawled_entries(self, logger, mocker, tmp_path):
+        # 1 story in 30 changes at each poll
+        pages = [build_entries([1] * 30) for _ in range(4)]
+        for poll, page in enumerate(pages):
+            page[0].total_points = poll + 1
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(crawler, "get_entries", side_effect=pages)
+        on_entries = mocker.Mock()
+        watcher = WatchEntries(
+            GetEntries(
+                crawler,
+                logger,
+                DBSnapshotAdapter(db_path=str(tmp_path / "app.db")),
+            ),
+            PollingSchedule(interval=300),
+            sleep=mocker.Mock(),
+        )
+        dto = GetEntriesDto(source="source", filter=None, order=None, since_last=True)
+        watcher.execute(dto, on_entries=on_entries, max_runs=4)
+
+        # The output only holds the changed entries, the interval is unchanged
+        assert [len(call.args[0]) for call in on_entries.call_args_list] == [
+            30,
+            1,
+            1,
+            1,
+        ]
+        assert watcher.schedule.interval == 300
+
+    def test_watch_entries_churn_without_matching_entry(self, logger, mocker):
+        crawler = HackerNewsCrawlerEntryAdapter(logger=logger)
+        mocker.patch.object(
+            crawler,
+            "get_entries",
+            side_effect=[build_entries([1, 2, 3]), build_entries([4, 5, 6])],
+        )
+        on_entries = mocker.Mock()
+        watcher = WatchEntries(
+            GetEntries(crawler, logger),
+            PollingSchedule(interval=10),
+            sleep=mocker.Mock(),
+        )
+        dto = GetEntriesDto(
+            source="source",
+            filter=FilterEntity(
+                field=FilterFieldEnum.number_of_comments,
+                operator=FilterOperatorEnum.gt,
+                value=100,
+            ),
+            order=None,
+        )
+        watcher.execute(dto, on_entries=on_entries, max_runs=2)
+
+        assert [call.args[0] for call in on_entries.call_args_list] == [[], []]
+        assert watcher.schedule.interval == 5